@@ -2,6 +2,8 @@
 
 #include <cmath>
 #include <algorithm>
+#include <atomic>
+#include <cstddef>
 #include <limits>
 
 namespace feen::ailee {
@@ -39,6 +41,9 @@ struct AileeSample {
  *
  * This metric is a read-only observer: it never feeds back into FEEN state evolution.
  * Exponential terms are clamped to prevent overflow.
+ *
+ * The accumulator is atomic, so integrate(), delta_v() and reset() may be
+ * called concurrently from multiple threads on the same instance.
  */
 class AileeMetric {
 public:
@@ -51,24 +56,40 @@ public:
      * @param sample The telemetry sample to integrate.
      */
     void integrate(const AileeSample& sample) {
-        if (sample.mass <= 0.0) {
-            // Avoid division by zero or negative mass
-            return;
-        }
-
-        // Calculate exponents with overflow protection
-        double w_sq = sample.workload * sample.workload;
-        double arg1 = -params_.alpha * w_sq;
-        double arg2 = 2.0 * params_.alpha * params_.v0 * sample.velocity;
-
-        double term1 = std::exp(clamp_exp_arg(arg1));
-        double term2 = std::exp(clamp_exp_arg(arg2));
+        accumulate(increment_for(sample));
+    }
 
-        // Integrand: (P * e^(-aw^2) * e^(2av0v)) / M
-        double integrand = (sample.p_input * term1 * term2) / sample.mass;
+    /**
+     * @brief Integrates a contiguous batch of samples and returns the new Delta v.
+     *
+     * @param samples Row-major array of count x 5 doubles, each row laid out as
+     *                {p_input, workload, velocity, mass, dt} (AileeSample order).
+     * @param count   Number of rows.
+     * @return The accumulated efficiency metric value after integration.
+     */
+    double integrate_batch(const double* samples, std::size_t count) {
+        double sum = 0.0;
+        for (std::size_t i = 0; i < count; ++i) {
+            const double* row = samples + i * 5;
+            sum += increment_for(AileeSample{row[0], row[1], row[2], row[3], row[4]});
+        }
+        accumulate(sum);
+        return delta_v();
+    }
 
-        // Accumulate integral
-        integral_accum_ += integrand * sample.dt;
+    /**
+     * @brief Integrates a sample given as raw fields and returns the new Delta v.
+     *
+     * Equivalent to building an AileeSample, calling integrate(), then delta_v().
+     * Lets bindings push one sample in a single call instead of setting five
+     * fields on a temporary object first.
+     *
+     * @return The accumulated efficiency metric value after integration.
+     */
+    double integrate_raw(double p_input, double workload, double velocity,
+                         double mass, double dt) {
+        integrate(AileeSample{p_input, workload, velocity, mass, dt});
+        return delta_v();
     }
 
     /**
@@ -79,19 +100,53 @@ public:
     double delta_v() const {
         double arg = -params_.alpha * params_.v0 * params_.v0;
         double prefactor = params_.isp * params_.eta * std::exp(clamp_exp_arg(arg));
-        return prefactor * integral_accum_;
+        return prefactor * integral_accum_.load(std::memory_order_relaxed);
     }
 
     /**
      * @brief Resets the accumulated integral.
      */
     void reset() {
-        integral_accum_ = 0.0;
+        integral_accum_.store(0.0, std::memory_order_relaxed);
     }
 
 private:
     AileeParams params_;
-    double integral_accum_;
+    std::atomic<double> integral_accum_;
+
+    /**
+     * @brief Returns integrand * dt for one sample (0 for non-positive mass).
+     */
+    double increment_for(const AileeSample& sample) const {
+        if (sample.mass <= 0.0) {
+            // Avoid division by zero or negative mass
+            return 0.0;
+        }
+
+        // Calculate exponents with overflow protection
+        double w_sq = sample.workload * sample.workload;
+        double arg1 = -params_.alpha * w_sq;
+        double arg2 = 2.0 * params_.alpha * params_.v0 * sample.velocity;
+
+        // e^(-aw^2) * e^(2av0v) = e^(-aw^2 + 2av0v): one exp instead of two.
+        // Each argument is clamped before the sum so infinite inputs cannot
+        // produce inf - inf, and the sum is clamped again for the exp.
+        double factor = std::exp(clamp_exp_arg(clamp_exp_arg(arg1) + clamp_exp_arg(arg2)));
+
+        // Integrand: (P * e^(-aw^2 + 2av0v)) / M
+        double integrand = (sample.p_input * factor) / sample.mass;
+        return integrand * sample.dt;
+    }
+
+    /**
+     * @brief Lock-free add to the accumulator; safe under concurrent callers.
+     */
+    void accumulate(double increment) {
+        double current = integral_accum_.load(std::memory_order_relaxed);
+        while (!integral_accum_.compare_exchange_weak(
+                   current, current + increment, std::memory_order_relaxed)) {
+        }
+    }
 
     /**
      * @brief Clamps the argument for exp() to prevent overflow/underflow.
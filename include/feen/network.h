@@ -10,6 +10,13 @@
 
 namespace feen {
 
+// Nonzero couplings in COO form: values[k] = K(rows[k], cols[k]), row-major order.
+struct CouplingCOO {
+    std::vector<std::size_t> rows{};
+    std::vector<std::size_t> cols{};
+    std::vector<double> values{};
+};
+
 // Directed dense coupling matrix: K_ij is influence of j on i.
 class CouplingMatrix {
 public:
@@ -26,6 +33,24 @@ public:
 
     void clear() { std::fill(w_.begin(), w_.end(), 0.0); }
 
+    // One pass to count nonzeros, one to fill exactly-sized buffers.
+    [[nodiscard]] CouplingCOO nonzeros() const {
+        const auto nnz = static_cast<std::size_t>(
+            std::count_if(w_.begin(), w_.end(), [](double w) { return w != 0.0; }));
+        CouplingCOO out;
+        out.rows.reserve(nnz);
+        out.cols.reserve(nnz);
+        out.values.reserve(nnz);
+        for (std::size_t k = 0; k < w_.size(); ++k) {
+            if (w_[k] != 0.0) {
+                out.rows.push_back(k / n_);
+                out.cols.push_back(k % n_);
+                out.values.push_back(w_[k]);
+            }
+        }
+        return out;
+    }
+
     double& at(std::size_t i, std::size_t j) {
         bounds_check_(i, j);
         return w_[i * n_ + j];
@@ -106,6 +131,9 @@ public:
 
     void clear_couplings() { coupling_.clear(); }
 
+    // Nonzero couplings as (target i, source j, K_ij) triples.
+    [[nodiscard]] CouplingCOO coupling_coo() const { return coupling_.nonzeros(); }
+
     /**
      * Evolve all resonators in lockstep by dt.
      *
@@ -119,33 +147,26 @@ public:
         if (dt <= 0.0) throw std::invalid_argument("tick_parallel dt must be > 0");
         if (nodes_.empty()) return;
 
-        const index_t n = nodes_.size();
-
-        // Snapshot x at time t (synchronous update)
-        std::vector<double> x(n, 0.0);
-        for (index_t k = 0; k < n; ++k) {
-            x[k] = nodes_[k].x();
-        }
+        std::vector<double> x(nodes_.size(), 0.0);
+        std::vector<double> F(nodes_.size(), 0.0);
+        step_(dt, x, F);
+    }
 
-        // Compute coupling forces from snapshot
-        std::vector<double> F(n, 0.0);
-        for (index_t i = 0; i < n; ++i) {
-            double sum = 0.0;
-            for (index_t j = 0; j < n; ++j) {
-                const double kij = coupling_.at(i, j);
-                if (kij == 0.0) continue;
-                sum += kij * (x[j] - x[i]);
-            }
-            F[i] = sum;
-        }
+    /**
+     * Evolve all resonators by `steps` consecutive ticks of dt.
+     *
+     * Equivalent to calling tick_parallel(dt) `steps` times, but the
+     * snapshot and force buffers are allocated once for the whole run.
+     */
+    void tick_parallel_n(double dt, std::size_t steps) {
+        if (dt <= 0.0) throw std::invalid_argument("tick_parallel_n dt must be > 0");
+        if (nodes_.empty()) return;
 
-        // Advance all nodes using those forces
-        for (index_t i = 0; i < n; ++i) {
-            nodes_[i].tick(dt, 0.0, -1.0, F[i]);
+        std::vector<double> x(nodes_.size(), 0.0);
+        std::vector<double> F(nodes_.size(), 0.0);
+        for (std::size_t s = 0; s < steps; ++s) {
+            step_(dt, x, F);
         }
-
-        t_ += dt;
-        ++ticks_;
     }
 
     /**
@@ -171,6 +192,35 @@ private:
     double t_ = 0.0;
     std::uint64_t ticks_ = 0;
 
+    // One synchronous tick; x and F are caller-owned scratch of size n.
+    void step_(double dt, std::vector<double>& x, std::vector<double>& F) {
+        const index_t n = nodes_.size();
+
+        // Snapshot x at time t (synchronous update)
+        for (index_t k = 0; k < n; ++k) {
+            x[k] = nodes_[k].x();
+        }
+
+        // Compute coupling forces from snapshot
+        for (index_t i = 0; i < n; ++i) {
+            double sum = 0.0;
+            for (index_t j = 0; j < n; ++j) {
+                const double kij = coupling_.at(i, j);
+                if (kij == 0.0) continue;
+                sum += kij * (x[j] - x[i]);
+            }
+            F[i] = sum;
+        }
+
+        // Advance all nodes using those forces
+        for (index_t i = 0; i < n; ++i) {
+            nodes_[i].tick(dt, 0.0, -1.0, F[i]);
+        }
+
+        t_ += dt;
+        ++ticks_;
+    }
+
     void bounds_check_node_(index_t i) const {
         if (i >= nodes_.size()) throw std::out_of_range("ResonatorNetwork node index out of range");
     }
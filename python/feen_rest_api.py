@@ -32,15 +32,31 @@ Design invariants preserved by this API:
 
 import time as _time
 import threading
+import types
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+import numpy as np
 import sys
 import os
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgspec
+    _MSGSPEC_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    _MSGSPEC_AVAILABLE = False
+
 # Add parent directory to path to import pyfeen and plugin_registry
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from plugin_registry import dumps as _dumps, loads as _loads
+
 try:
     import pyfeen
 except ImportError:
@@ -69,6 +85,151 @@ MAX_NETWORK_SIZE = 1000
 DT_MIN = 1e-12
 DT_MAX = 1.0
 
+# ---------------------------------------------------------------------------
+# Response helpers
+# ---------------------------------------------------------------------------
+
+def _json_response(payload, status=200):
+    """Serialize payload with orjson (stdlib fallback) into a JSON Response."""
+    return Response(_dumps(payload), status=status, mimetype='application/json')
+
+
+# Views with more list items than this are streamed in batches of this size.
+_STREAM_BATCH = 512
+
+
+def _streamed_json_response(payload, batch=_STREAM_BATCH):
+    """Serialize a dict into a streamed JSON Response.
+
+    List values are encoded ``batch`` items at a time, so a large body is
+    never held in memory as a whole.  The bytes equal _json_response's.
+    """
+    def generate():
+        sep = b'{'
+        for key, value in payload.items():
+            yield sep + _dumps(key) + b':'
+            sep = b','
+            if isinstance(value, list):
+                yield b'['
+                for start in range(0, len(value), batch):
+                    chunk = _dumps(value[start:start + batch])[1:-1]
+                    yield chunk if start == 0 else b',' + chunk
+                yield b']'
+            else:
+                yield _dumps(value)
+        yield b'}' if sep == b',' else b'{}'
+
+    return Response(generate(), mimetype='application/json')
+
+
+def _json_body():
+    """Parse the raw request body as JSON, or return None if empty/invalid.
+
+    Reads the body without caching it on the request object and decodes it
+    with orjson (stdlib fallback), bypassing Flask's get_json() machinery.
+    """
+    raw = request.get_data(cache=False)
+    if not raw:
+        return None
+    try:
+        return _loads(raw)
+    except ValueError:
+        return None
+
+
+_REQUIRED = object()
+
+
+class _RequestSchema:
+    """Typed request-body schema: (name, type, default) fields.
+
+    With msgspec installed the body is parsed, validated and coerced in one
+    compiled pass into a Struct; otherwise it falls back to _json_body() plus
+    per-field conversion. Either way decode() returns an object with one
+    attribute per field, None for an empty body or an empty object (the
+    old ``if not data`` check), and raises ValueError for malformed or
+    invalid input.
+    """
+
+    def __init__(self, name, fields):
+        self._fields = tuple(fields)
+        if _MSGSPEC_AVAILABLE:
+            struct = msgspec.defstruct(name, [
+                (f, t) if default is _REQUIRED else (f, t, default)
+                for f, t, default in self._fields
+            ])
+            # strict=False keeps the old float("1.5")-style string coercion.
+            self._decoder = msgspec.json.Decoder(struct, strict=False)
+            # Only a body that decodes to all defaults can be an empty object.
+            optional = all(d is not _REQUIRED for _, _, d in self._fields)
+            self._defaults = struct() if optional else None
+        else:  # pragma: no cover
+            self._decoder = None
+
+    def decode(self):
+        if self._decoder is None:  # pragma: no cover
+            return self._decode_fallback()
+        raw = request.get_data(cache=False)
+        if not raw:
+            return None
+        req = self._decoder.decode(raw)
+        if req == self._defaults and not msgspec.json.decode(raw):
+            return None
+        return req
+
+    def _decode_fallback(self):  # pragma: no cover
+        data = _json_body()
+        if not data:
+            return None
+        if not isinstance(data, dict):
+            raise ValueError("Expected a JSON object")
+        values = {}
+        for f, t, default in self._fields:
+            value = data.get(f, default)
+            if value is _REQUIRED:
+                raise ValueError(f"Object missing required field `{f}`")
+            values[f] = t(value)
+        return types.SimpleNamespace(**values)
+
+
+_TICK_REQUEST = _RequestSchema('TickRequest', [
+    ('dt', float, 1e-6),
+    ('steps', int, 1),
+])
+_INJECT_REQUEST = _RequestSchema('InjectRequest', [
+    ('amplitude', float, 1.0),
+    ('phase', float, 0.0),
+])
+_COUPLING_REQUEST = _RequestSchema('CouplingRequest', [
+    ('target_id', int, _REQUIRED),
+    ('source_id', int, _REQUIRED),
+    ('strength', float, _REQUIRED),
+])
+_UNCOUPLE_REQUEST = _RequestSchema('UncoupleRequest', [
+    ('target_id', int, _REQUIRED),
+    ('source_id', int, _REQUIRED),
+])
+_AILEE_CONFIG_REQUEST = _RequestSchema('AileeConfigRequest', [
+    ('alpha', float, 0.1),
+    ('eta', float, 1.0),
+    ('isp', float, 1.0),
+    ('v0', float, 1.0),
+])
+_AILEE_SAMPLE_REQUEST = _RequestSchema('AileeSampleRequest', [
+    ('p_input', float, 0.0),
+    ('workload', float, 0.0),
+    ('velocity', float, 0.0),
+    ('mass', float, 1.0),
+    ('dt', float, 1e-6),
+])
+
+
+def _static_json_response(body):
+    """Serve a pre-encoded constant JSON body."""
+    return Response(body, mimetype='application/json',
+                    headers={'Cache-Control': 'public, max-age=1'})
+
+
 # ---------------------------------------------------------------------------
 # Input validation helpers
 # ---------------------------------------------------------------------------
@@ -109,6 +270,12 @@ class ResonatorNetworkManager:
     def __init__(self):
         self.network = pyfeen.ResonatorNetwork()
         self.node_configs = [] # Keep track of configs since C++ object stores by value
+        # Column-wise copies of the validated config used by the snapshot paths,
+        # so they index arrays instead of doing per-node dict lookups.
+        self._names = []
+        self._freqs = np.empty(16, dtype=np.float64)
+        self._qs = np.empty(16, dtype=np.float64)
+        self._betas = np.empty(16, dtype=np.float64)
 
     def add_node(self, config_dict):
         """Add a new resonator node to the network."""
@@ -119,11 +286,24 @@ class ResonatorNetworkManager:
         config.frequency_hz = _validate_frequency(config_dict.get('frequency_hz', 1000.0))
         config.q_factor = _validate_q_factor(config_dict.get('q_factor', 200.0))
         config.beta = float(config_dict.get('beta', 1e-4))
-        config.name = config_dict.get('name', f'node_{len(self.node_configs)}')
+        # Resolve the display name once here; snapshot paths read _names and
+        # never rebuild the f'node_{i}' fallback.
+        name = config_dict.get('name')
+        config.name = name if name is not None else f'node_{len(self.node_configs)}'
 
         resonator = pyfeen.Resonator(config)
         self.network.add_node(resonator)
 
+        n = len(self._names)
+        if n == len(self._freqs):
+            self._freqs = np.resize(self._freqs, 2 * n)
+            self._qs = np.resize(self._qs, 2 * n)
+            self._betas = np.resize(self._betas, 2 * n)
+        self._names.append(config.name)
+        self._freqs[n] = config.frequency_hz
+        self._qs[n] = config.q_factor
+        self._betas[n] = config.beta
+
         self.node_configs.append({
             'id': len(self.node_configs),
             'config': config_dict
@@ -141,26 +321,25 @@ class ResonatorNetworkManager:
         res = self.get_node(node_id)
         if res is None:
             return None
+        return self._node_state(node_id, res)
 
-        config_entry = self.node_configs[node_id]
+    def _node_state(self, node_id, res):
+        # One state() call per node instead of five accessor round-trips.
+        x, v, t, energy, snr = res.state()  # snr uses default temperature
         return {
             'id': node_id,
-            'name': config_entry['config'].get('name', f'node_{node_id}'),
-            'x': res.x(),
-            'v': res.v(),
-            't': res.t(),
-            'energy': res.energy(),
-            'snr': res.snr()  # Now uses default temperature
+            'name': self._names[node_id],
+            'x': x,
+            'v': v,
+            't': t,
+            'energy': energy,
+            'snr': snr
         }
 
     def get_all_nodes_state(self):
         """Get the state of all nodes."""
-        states = []
-        for i in range(self.network.size()):
-            state = self.get_node_state(i)
-            if state is not None:
-                states.append(state)
-        return states
+        node = self.network.node
+        return [self._node_state(i, node(i)) for i in range(self.network.size())]
 
     def inject_node(self, node_id, amplitude, phase=0.0):
         """Inject a signal into a specific node."""
@@ -175,9 +354,9 @@ class ResonatorNetworkManager:
             _logging.getLogger(__name__).error("Injection failed: %s", e)
             return False
 
-    def tick_network(self, dt):
-        """Evolve all nodes by timestep dt."""
-        self.network.tick_parallel(dt)
+    def tick_network(self, dt, steps=1):
+        """Evolve all nodes by `steps` timesteps of dt in a single C++ call."""
+        self.network.tick_parallel_n(dt, steps)
         return True
 
     def get_network_status(self):
@@ -194,18 +373,24 @@ class ResonatorNetworkManager:
 
     def get_config_snapshot(self):
         """Return a read-only serialized snapshot of the network configuration."""
+        n = self.network.size()
         return {
             'snapshot_wall_time': _time.time(),
-            'num_nodes': self.network.size(),
+            'num_nodes': n,
             'nodes': [
                 {
                     'id': i,
-                    'name': self.node_configs[i]['config'].get('name', f'node_{i}'),
-                    'frequency_hz': self.node_configs[i]['config'].get('frequency_hz', 1000.0),
-                    'q_factor': self.node_configs[i]['config'].get('q_factor', 200.0),
-                    'beta': self.node_configs[i]['config'].get('beta', 1e-4),
+                    'name': name,
+                    'frequency_hz': freq,
+                    'q_factor': q,
+                    'beta': beta,
                 }
-                for i in range(self.network.size())
+                for i, (name, freq, q, beta) in enumerate(zip(
+                    self._names[:n],
+                    self._freqs[:n].tolist(),
+                    self._qs[:n].tolist(),
+                    self._betas[:n].tolist(),
+                ))
             ]
         }
 
@@ -218,30 +403,58 @@ class ResonatorNetworkManager:
         self.network.set_coupling(i, j, 0.0)
 
     def get_couplings(self):
-        couplings = []
-        n = self.network.size()
-        for i in range(n):
-            for j in range(n):
-                strength = self.network.coupling(i, j)
-                if strength != 0.0:
-                    couplings.append({'source': j, 'target': i, 'strength': strength})
-        return couplings
+        rows, cols, vals = self.network.coupling_coo()
+        return [
+            {'source': j, 'target': i, 'strength': strength}
+            for i, j, strength in zip(rows.tolist(), cols.tolist(), vals.tolist())
+        ]
 
 
 # Global network manager
 network = ResonatorNetworkManager()
 
-# Global network coupling lock — guards structural mutations (add/remove coupling).
-# Mirrors the _ailee_metric_lock pattern so concurrent REST requests cannot
-# corrupt the coupling matrix.
+# Global network lock — guards every access to native network state.
+# tick_parallel/tick_parallel_n, get_state_vector and coupling_coo release
+# the GIL, so the GIL alone does not order them against each other or
+# against add_node and set_coupling, which can reallocate or rewrite node
+# and coupling storage.
+# Mutations and observer reads alike hold this lock while touching the
+# network and copy what they need out under it.
 _network_lock = threading.Lock()
 
-# Global AILEE Metric instance (protected by _ailee_metric_lock)
+# Global AILEE Metric instance.  /config replaces it with a single reference
+# store, and every other path reads the reference once into a local and
+# works on that instance.  AileeMetric's accumulator is atomic, so
+# integration, reads and reset() need no lock; a sample racing a /config
+# lands in the instance it started with.  _ailee_metric_lock only makes
+# the lazy default initialization happen once.
 ailee_metric = None
 _ailee_metric_lock = threading.Lock()
 
+
+class _OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson.
+
+    Routes that build their own Response already use _dumps/_loads; this
+    covers what still goes through app.json (request.get_json() in plugin
+    blueprints, jsonify in third-party code).  Keys stay sorted, and non-str
+    keys are stringified, to match Flask's default provider.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(
+            obj, option=(orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_SORT_KEYS
+                         | orjson.OPT_NON_STR_KEYS),
+            default=self.default).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 # Flask app
 app = Flask(__name__)
+if orjson is not None:
+    app.json = _OrjsonProvider(app)
 # Set a secret key for session signing. Read from environment for production;
 # falls back to a per-process random key so it is always present and unique.
 app.secret_key = os.environ.get('FLASK_SECRET_KEY', os.urandom(32))
@@ -261,8 +474,11 @@ CORS(app, origins=_cors_origins)  # Intentionally open for dev; restrict via env
 def get_vcp_view():
     """Get the VCP network view (nodes, edges, metrics)."""
     if vcp_integration:
-        return jsonify(vcp_integration.get_vcp_network_view())
-    return jsonify({'error': 'VCP integration module not loaded'}), 503
+        view = vcp_integration.get_vcp_network_view()
+        if len(view['nodes']) + len(view['edges']) > _STREAM_BATCH:
+            return _streamed_json_response(view)
+        return _json_response(view)
+    return _json_response({'error': 'VCP integration module not loaded'}), 503
 
 @app.route('/feen-changes/simulate', methods=['POST'])
 def stateless_simulate():
@@ -270,9 +486,9 @@ def stateless_simulate():
     Input: { config: {...}, state: {x, v}, input: float, dt: float }
     Output: { state: {x, v} }
     """
-    data = request.get_json()
+    data = _json_body()
     if not data:
-        return jsonify({'error': 'No data'}), 400
+        return _json_response({'error': 'No data'}), 400
 
     try:
         cfg = data.get('config', {})
@@ -296,11 +512,11 @@ def stateless_simulate():
         # Tick
         res.tick(dt, inp)
 
-        return jsonify({
+        return _json_response({
             'state': {'x': res.x(), 'v': res.v(), 't': res.t()}
         })
     except Exception as e:
-        return jsonify({'error': str(e)}), 400
+        return _json_response({'error': str(e)}), 400
 
 @app.route('/feen-changes/coupling', methods=['POST'])
 def stateless_coupling():
@@ -308,9 +524,9 @@ def stateless_coupling():
     Input: { state1: {x, v}, state2: {x, v}, strength: float }
     Output: { force: float }
     """
-    data = request.get_json()
+    data = _json_body()
     if not data:
-        return jsonify({'error': 'No JSON data provided'}), 400
+        return _json_response({'error': 'No JSON data provided'}), 400
     try:
         s1 = data.get('state1', {})
         s2 = data.get('state2', {})
@@ -322,9 +538,9 @@ def stateless_coupling():
         # Linear coupling: F = k * (x2 - x1)
         force = k * (x2 - x1)
 
-        return jsonify({'force': force})
+        return _json_response({'force': force})
     except Exception as e:
-        return jsonify({'error': str(e)}), 400
+        return _json_response({'error': str(e)}), 400
 
 @app.route('/feen-changes/delta_v', methods=['POST'])
 def stateless_delta_v():
@@ -332,7 +548,7 @@ def stateless_delta_v():
     Input: { current_delta_v: float, sample: {...}, config: {...} }
     Output: { new_delta_v: float }
     """
-    data = request.get_json()
+    data = _json_body()
     try:
         current_val = float(data.get('current_delta_v', 0.0))
         sample_data = data.get('sample', {})
@@ -353,9 +569,9 @@ def stateless_delta_v():
         metric.integrate(sample)
         increment = metric.delta_v() # Started from 0, so this is the increment
 
-        return jsonify({'new_delta_v': current_val + increment})
+        return _json_response({'new_delta_v': current_val + increment})
     except Exception as e:
-        return jsonify({'error': str(e)}), 400
+        return _json_response({'error': str(e)}), 400
 
 
 # ---------------------------------------------------------------------------
@@ -365,7 +581,7 @@ def stateless_delta_v():
 # at /api/plugins/* access time caused "Failed to register blueprint" errors.
 # ---------------------------------------------------------------------------
 try:
-    from plugin_registry import PluginRegistry
+    from plugin_registry import FEEN_PLUGIN_API_VERSION, PluginRegistry
     plugin_registry = PluginRegistry()
     _plugin_registry_available = True
 except ImportError:
@@ -374,6 +590,25 @@ except ImportError:
 
 _plugins_initialized = False
 
+# Built-in example plugins from the plugins/ sub-package, listed once at import.
+_PLUGINS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "plugins")
+
+
+def _scan_plugin_files(plugins_dir):
+    """Return sorted plugin module paths in *plugins_dir* (empty if missing)."""
+    try:
+        with os.scandir(plugins_dir) as it:
+            # DirEntry.is_file() reuses the directory listing, no extra stat.
+            return tuple(sorted(
+                e.path for e in it
+                if e.name.endswith(".py") and not e.name.startswith("_") and e.is_file()
+            ))
+    except FileNotFoundError:
+        return ()
+
+
+_PLUGIN_FILES = _scan_plugin_files(_PLUGINS_DIR)
+
 
 def _ensure_plugins_initialized():
     """Initialize plugins once and register their blueprints with the app."""
@@ -382,12 +617,8 @@ def _ensure_plugins_initialized():
         return
     _plugins_initialized = True
 
-    # Discover and load built-in example plugins from the plugins/ sub-package.
-    plugins_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "plugins")
-    if os.path.isdir(plugins_dir):
-        for fname in sorted(os.listdir(plugins_dir)):
-            if fname.endswith(".py") and not fname.startswith("_"):
-                plugin_registry.load_plugin(os.path.join(plugins_dir, fname))
+    for path in _PLUGIN_FILES:
+        plugin_registry.load_plugin(path)
 
     plugin_registry.activate_all()
 
@@ -409,6 +640,7 @@ def _ensure_plugins_initialized():
 
 
 # Eagerly initialize plugins so blueprints are registered before any request.
+# Route handlers rely on this having run and do not re-check it per request.
 _ensure_plugins_initialized()
 
 # ---------------------------------------------------------------------------
@@ -417,6 +649,9 @@ _ensure_plugins_initialized()
 # They are safe for keep-alive traffic, monitoring, and dashboard polling.
 # ---------------------------------------------------------------------------
 
+_HEALTH_BODY = _dumps({'status': 'ok', 'service': 'FEEN REST API'})
+
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Infrastructure liveness probe.
@@ -424,7 +659,13 @@ def health_check():
     READ-ONLY OBSERVER: Does not access or advance simulation state.
     Safe for keep-alive polling by hosting platforms and load balancers.
     """
-    return jsonify({'status': 'ok', 'service': 'FEEN REST API'})
+    return _static_json_response(_HEALTH_BODY)
+
+
+# (key, encoded body) for /api/network/status. The payload is exactly the
+# key, so idle polls between ticks reuse the bytes instead of re-encoding.
+# Replaced as a single tuple, so concurrent readers never see a torn pair.
+_status_cache = (None, b'')
 
 
 @app.route('/api/network/status', methods=['GET'])
@@ -433,7 +674,15 @@ def get_network_status():
 
     READ-ONLY OBSERVER: Returns counters only; no simulation mutation.
     """
-    return jsonify(network.get_network_status())
+    global _status_cache
+    net = network.network
+    with _network_lock:
+        key = (net.size(), net.ticks(), net.time_s())
+    cached_key, body = _status_cache
+    if cached_key != key:
+        body = _dumps({'num_nodes': key[0], 'time': key[2], 'ticks': key[1]})
+        _status_cache = (key, body)
+    return Response(body, mimetype='application/json')
 
 
 @app.route('/api/config/snapshot', methods=['GET'])
@@ -443,7 +692,7 @@ def get_config_snapshot():
     READ-ONLY OBSERVER: Captures static node configuration, not dynamic state.
     Suitable for session replay, diff-based audit, and multi-user isolation checks.
     """
-    return jsonify(network.get_config_snapshot())
+    return _json_response(network.get_config_snapshot())
 
 
 @app.route('/api/network/nodes', methods=['GET'])
@@ -452,9 +701,12 @@ def list_nodes():
 
     READ-ONLY OBSERVER: Returns a snapshot of all node states; no mutation.
     """
-    return jsonify({
-        'nodes': network.get_all_nodes_state(),
-        'count': len(network.node_configs)
+    with _network_lock:
+        nodes = network.get_all_nodes_state()
+        count = len(network.node_configs)
+    return _json_response({
+        'nodes': nodes,
+        'count': count
     })
 
 
@@ -464,10 +716,11 @@ def get_node(node_id):
 
     READ-ONLY OBSERVER: Returns a snapshot; no simulation mutation.
     """
-    state = network.get_node_state(node_id)
+    with _network_lock:
+        state = network.get_node_state(node_id)
     if state is None:
-        return jsonify({'error': f'Node {node_id} not found'}), 404
-    return jsonify(state)
+        return _json_response({'error': f'Node {node_id} not found'}), 404
+    return _json_response(state)
 
 
 @app.route('/api/network/state', methods=['GET'])
@@ -476,17 +729,22 @@ def get_state_vector():
 
     READ-ONLY OBSERVER: Returns a snapshot; no simulation mutation.
     """
-    return jsonify({
-        'state_vector': network.get_state_vector(),
+    with _network_lock:
+        state_vector = network.get_state_vector()
+        num_nodes = len(network.node_configs)
+    return _json_response({
+        'state_vector': state_vector,
         'format': 'Interleaved [x0, v0, x1, v1, ...]',
-        'num_nodes': len(network.node_configs)
+        'num_nodes': num_nodes
     })
 
 
 @app.route('/api/network/couplings', methods=['GET'])
 def list_couplings():
     """List all active couplings between nodes."""
-    return jsonify({'couplings': network.get_couplings()})
+    with _network_lock:
+        couplings = network.get_couplings()
+    return _json_response({'couplings': couplings})
 
 
 # ---------------------------------------------------------------------------
@@ -501,19 +759,21 @@ def add_node():
     STATE-MUTATING COMMAND: Structural change — adds a node.
     Must be explicit; must not be reachable from observer/keep-alive paths.
     """
-    data = request.get_json()
+    data = _json_body()
     if not data:
-        return jsonify({'error': 'No JSON data provided'}), 400
+        return _json_response({'error': 'No JSON data provided'}), 400
 
     try:
-        node_id = network.add_node(data)
-        return jsonify({
+        with _network_lock:
+            node_id = network.add_node(data)
+            state = network.get_node_state(node_id)
+        return _json_response({
             'id': node_id,
             'message': 'Node added successfully',
-            'state': network.get_node_state(node_id)
+            'state': state
         }), 201
     except Exception as e:
-        return jsonify({'error': str(e)}), 400
+        return _json_response({'error': str(e)}), 400
 
 
 @app.route('/api/network/nodes/<int:node_id>/inject', methods=['POST'])
@@ -524,25 +784,27 @@ def inject_signal(node_id):
     This is the ONLY path through which external energy enters a node.
     Amplitude and phase must be provided explicitly in the request body.
     """
-    data = request.get_json()
-    if not data:
-        return jsonify({'error': 'No JSON data provided'}), 400
-
     try:
-        amplitude = _validate_amplitude(float(data.get('amplitude', 1.0)))
-        phase = float(data.get('phase', 0.0))
+        req = _INJECT_REQUEST.decode()
+        if req is None:
+            return _json_response({'error': 'No JSON data provided'}), 400
+        amplitude = _validate_amplitude(req.amplitude)
+        phase = req.phase
     except (ValueError, TypeError) as e:
-        return jsonify({'error': str(e)}), 400
+        return _json_response({'error': str(e)}), 400
 
-    if network.inject_node(node_id, amplitude, phase):
-        return jsonify({
+    with _network_lock:
+        injected = network.inject_node(node_id, amplitude, phase)
+        state = network.get_node_state(node_id) if injected else None
+    if injected:
+        return _json_response({
             'message': f'Signal injected into node {node_id}',
             'amplitude': amplitude,
             'phase': phase,
-            'state': network.get_node_state(node_id)
+            'state': state
         })
     else:
-        return jsonify({'error': f'Node {node_id} not found (or immutable)'}), 404
+        return _json_response({'error': f'Node {node_id} not found (or immutable)'}), 404
 
 
 @app.route('/api/network/tick', methods=['POST'])
@@ -553,28 +815,26 @@ def tick_network():
     dt is supplied explicitly in the request body.
     Hardware latency MUST NOT be used as dt.
     """
-    data = request.get_json()
-    if not data:
-        return jsonify({'error': 'No JSON data provided'}), 400
-
-    dt = data.get('dt', 1e-6)
-    steps = data.get('steps', 1)
-
     try:
-        dt = _validate_dt(float(dt))
-        steps = int(steps)
+        req = _TICK_REQUEST.decode()
+        if req is None:
+            return _json_response({'error': 'No JSON data provided'}), 400
+        dt = _validate_dt(req.dt)
+        steps = req.steps
         if steps < 1:
-            return jsonify({'error': 'steps must be >= 1'}), 400
-        for _ in range(steps):
-            network.tick_network(dt)
+            return _json_response({'error': 'steps must be >= 1'}), 400
+        with _network_lock:
+            network.tick_network(dt, steps)
+            status = network.get_network_status()
+            nodes = network.get_all_nodes_state()
 
-        return jsonify({
+        return _json_response({
             'message': f'Network evolved by {steps} steps',
-            'status': network.get_network_status(),
-            'nodes': network.get_all_nodes_state()
+            'status': status,
+            'nodes': nodes
         })
     except Exception as e:
-        return jsonify({'error': str(e)}), 400
+        return _json_response({'error': str(e)}), 400
 
 
 @app.route('/api/network/reset', methods=['POST'])
@@ -586,12 +846,11 @@ def reset_network():
     global network
     network = ResonatorNetworkManager()
 
-    global ailee_metric
-    with _ailee_metric_lock:
-        if ailee_metric:
-            ailee_metric.reset()
+    metric = ailee_metric
+    if metric:
+        metric.reset()
 
-    return jsonify({'message': 'Network reset successfully'})
+    return _json_response({'message': 'Network reset successfully'})
 
 
 @app.route('/api/network/couplings', methods=['POST'])
@@ -603,26 +862,25 @@ def add_coupling():
     always result in the last-specified strength, never accumulate.
     Protected by _network_lock to prevent concurrent coupling matrix corruption.
     """
-    data = request.get_json()
-    if not data:
-        return jsonify({'error': 'No JSON data provided'}), 400
-
     try:
-        i = int(data.get('target_id'))
-        j = int(data.get('source_id'))
-        strength = float(data.get('strength'))
+        req = _COUPLING_REQUEST.decode()
+        if req is None:
+            return _json_response({'error': 'No JSON data provided'}), 400
+        i = req.target_id
+        j = req.source_id
+        strength = req.strength
 
         n = network.network.size()
         if i < 0 or i >= n or j < 0 or j >= n:
-            return jsonify({'error': f'Node index out of range [0, {n - 1}]'}), 400
+            return _json_response({'error': f'Node index out of range [0, {n - 1}]'}), 400
         if i == j:
-            return jsonify({'error': 'Self-coupling (i == j) is not permitted'}), 400
+            return _json_response({'error': 'Self-coupling (i == j) is not permitted'}), 400
 
         with _network_lock:
             network.set_coupling(i, j, strength)
-        return jsonify({'message': 'Coupling added', 'coupling': {'source': j, 'target': i, 'strength': strength}})
+        return _json_response({'message': 'Coupling added', 'coupling': {'source': j, 'target': i, 'strength': strength}})
     except Exception as e:
-        return jsonify({'error': str(e)}), 400
+        return _json_response({'error': str(e)}), 400
 
 @app.route('/api/network/couplings', methods=['DELETE'])
 def remove_coupling():
@@ -631,19 +889,18 @@ def remove_coupling():
     STATE-MUTATING COMMAND: Structural change — zeroes coupling strength.
     Protected by _network_lock to prevent concurrent coupling matrix corruption.
     """
-    data = request.get_json()
-    if not data:
-        return jsonify({'error': 'No JSON data provided'}), 400
-
     try:
-        i = int(data.get('target_id'))
-        j = int(data.get('source_id'))
+        req = _UNCOUPLE_REQUEST.decode()
+        if req is None:
+            return _json_response({'error': 'No JSON data provided'}), 400
+        i = req.target_id
+        j = req.source_id
 
         with _network_lock:
             network.remove_coupling(i, j)
-        return jsonify({'message': 'Coupling removed'})
+        return _json_response({'message': 'Coupling removed'})
     except Exception as e:
-        return jsonify({'error': str(e)}), 400
+        return _json_response({'error': str(e)}), 400
 
 
 # ---------------------------------------------------------------------------
@@ -656,22 +913,20 @@ def configure_ailee_metric():
 
     STATE-MUTATING COMMAND: Re-initializes the global metric instance.
     """
-    data = request.get_json()
-    if not data:
-        return jsonify({'error': 'No JSON data provided'}), 400
-
     try:
+        req = _AILEE_CONFIG_REQUEST.decode()
+        if req is None:
+            return _json_response({'error': 'No JSON data provided'}), 400
         params = pyfeen.ailee.AileeParams()
-        params.alpha = float(data.get('alpha', 0.1))
-        params.eta = float(data.get('eta', 1.0))
-        params.isp = float(data.get('isp', 1.0))
-        params.v0 = float(data.get('v0', 1.0))
+        params.alpha = req.alpha
+        params.eta = req.eta
+        params.isp = req.isp
+        params.v0 = req.v0
 
         global ailee_metric
-        with _ailee_metric_lock:
-            ailee_metric = pyfeen.ailee.AileeMetric(params)
+        ailee_metric = pyfeen.ailee.AileeMetric(params)
 
-        return jsonify({
+        return _json_response({
             'message': 'AILEE Metric configured',
             'config': {
                 'alpha': params.alpha,
@@ -681,49 +936,108 @@ def configure_ailee_metric():
             }
         })
     except Exception as e:
-        return jsonify({'error': str(e)}), 400
+        return _json_response({'error': str(e)}), 400
+
+def _ensure_ailee_metric():
+    """Return the global metric, auto-initializing it with defaults if needed."""
+    global ailee_metric
+    metric = ailee_metric
+    if metric is None:
+        with _ailee_metric_lock:
+            metric = ailee_metric
+            if metric is None:
+                params = pyfeen.ailee.AileeParams()
+                params.alpha = 0.1
+                params.eta = 1.0
+                params.isp = 1.0
+                params.v0 = 1.0
+                metric = ailee_metric = pyfeen.ailee.AileeMetric(params)
+    return metric
+
 
 @app.route('/api/ailee/metric/sample', methods=['POST'])
 def push_ailee_sample():
     """Push a telemetry sample to the AILEE Metric.
 
     STATE-MUTATING COMMAND: Updates the integrated metric state.
+    The sample is integrated before the response is built, so
+    current_delta_v always includes it.  Samples are not queued for a
+    background drain: integration is a lock-free atomic add on the
+    caller's thread, so coalescing would only delay delta_v.  Producers
+    that want fewer round trips should batch client-side via /samples.
     """
-    global ailee_metric
-    with _ailee_metric_lock:
-        if ailee_metric is None:
-            # Auto-initialize with defaults if not configured
-            params = pyfeen.ailee.AileeParams()
-            params.alpha = 0.1
-            params.eta = 1.0
-            params.isp = 1.0
-            params.v0 = 1.0
-            ailee_metric = pyfeen.ailee.AileeMetric(params)
-
-    data = request.get_json()
-    if not data:
-        return jsonify({'error': 'No JSON data provided'}), 400
+    metric = _ensure_ailee_metric()
 
     try:
-        # Build the sample from request-local data before acquiring the lock.
-        # AileeSample is a value type with no shared state; data is request-local.
-        sample = pyfeen.ailee.AileeSample()
-        sample.p_input = float(data.get('p_input', 0.0))
-        sample.workload = float(data.get('workload', 0.0))
-        sample.velocity = float(data.get('velocity', 0.0))
-        sample.mass = float(data.get('mass', 1.0))
-        sample.dt = float(data.get('dt', 1e-6))
+        req = _AILEE_SAMPLE_REQUEST.decode()
+        if req is None:
+            return _json_response({'error': 'No JSON data provided'}), 400
 
-        with _ailee_metric_lock:
-            ailee_metric.integrate(sample)
-            current = ailee_metric.delta_v()
+        # integrate_raw pushes the sample and returns the new Delta v in a
+        # single binding call, avoiding a temporary AileeSample per request.
+        current = metric.integrate_raw(
+            req.p_input, req.workload, req.velocity, req.mass, req.dt)
 
-        return jsonify({
+        return _json_response({
             'message': 'Sample integrated',
             'current_delta_v': current
         })
     except Exception as e:
-        return jsonify({'error': str(e)}), 400
+        return _json_response({'error': str(e)}), 400
+
+@app.route('/api/ailee/metric/samples', methods=['POST'])
+def push_ailee_samples():
+    """Push a batch of telemetry samples to the AILEE Metric.
+
+    STATE-MUTATING COMMAND: Updates the integrated metric state.
+    Preferred over /sample for high-rate telemetry: the whole batch is
+    integrated in a single call into the metric.
+    Input: { samples: [{p_input, workload, velocity, mass, dt}, ...] }
+       or  { samples: [[p_input, workload, velocity, mass, dt], ...] }
+    The row-array form is converted to the (N, 5) batch in one step, with
+    no per-sample field lookups.
+    Output: { count: int, current_delta_v: float }
+    """
+    metric = _ensure_ailee_metric()
+
+    data = _json_body()
+    if not data:
+        return _json_response({'error': 'No JSON data provided'}), 400
+
+    try:
+        samples = data.get('samples')
+        if not isinstance(samples, list) or not samples:
+            return _json_response({'error': 'samples must be a non-empty list'}), 400
+
+        # Rows follow AileeSample field order: p_input, workload, velocity, mass, dt.
+        if isinstance(samples[0], list):
+            batch = np.asarray(samples, dtype=np.float64)
+            if batch.ndim != 2 or batch.shape[1] != 5:
+                return _json_response(
+                    {'error': 'sample rows must have 5 values: '
+                              'p_input, workload, velocity, mass, dt'}), 400
+        else:
+            batch = np.array([
+                (
+                    float(s.get('p_input', 0.0)),
+                    float(s.get('workload', 0.0)),
+                    float(s.get('velocity', 0.0)),
+                    float(s.get('mass', 1.0)),
+                    float(s.get('dt', 1e-6)),
+                )
+                for s in samples
+            ], dtype=np.float64)
+
+        current = metric.integrate_batch(batch)
+
+        return _json_response({
+            'message': 'Samples integrated',
+            'count': len(samples),
+            'current_delta_v': current
+        })
+    except Exception as e:
+        return _json_response({'error': str(e)}), 400
+
 
 @app.route('/api/ailee/metric/value', methods=['GET'])
 def get_ailee_metric_value():
@@ -731,15 +1045,14 @@ def get_ailee_metric_value():
 
     READ-ONLY OBSERVER.
     """
-    global ailee_metric
-    with _ailee_metric_lock:
-        if ailee_metric is None:
-            return jsonify({'delta_v': 0.0, 'status': 'uninitialized'})
+    metric = ailee_metric
+    if metric is None:
+        return _json_response({'delta_v': 0.0, 'status': 'uninitialized'})
 
-        return jsonify({
-            'delta_v': ailee_metric.delta_v(),
-            'status': 'active'
-        })
+    return _json_response({
+        'delta_v': metric.delta_v(),
+        'status': 'active'
+    })
 
 
 # ---------------------------------------------------------------------------
@@ -753,16 +1066,12 @@ def list_plugins():
     """List all registered plugins and their lifecycle state.
 
     READ-ONLY OBSERVER: Returns plugin registry snapshot; no mutation.
-    Initializes the plugin registry on first call.
     """
-    _ensure_plugins_initialized()
     if not _plugin_registry_available:
-        return jsonify({'plugins': [], 'registry_available': False})
-    return jsonify({
+        return _json_response({'plugins': [], 'registry_available': False})
+    return _json_response({
         'plugins': plugin_registry.list_plugins(),
-        'feen_plugin_api_version': list(
-            __import__('plugin_registry').FEEN_PLUGIN_API_VERSION
-        ),
+        'feen_plugin_api_version': list(FEEN_PLUGIN_API_VERSION),
         'registry_available': True,
     })
 
@@ -773,13 +1082,12 @@ def get_plugin(plugin_name):
 
     READ-ONLY OBSERVER: Returns plugin metadata and state; no mutation.
     """
-    _ensure_plugins_initialized()
     if not _plugin_registry_available:
-        return jsonify({'error': 'Plugin registry unavailable'}), 503
+        return _json_response({'error': 'Plugin registry unavailable'}), 503
     entry = plugin_registry.get_plugin(plugin_name)
     if entry is None:
-        return jsonify({'error': f'Plugin {plugin_name!r} not found'}), 404
-    return jsonify(entry.to_dict())
+        return _json_response({'error': f'Plugin {plugin_name!r} not found'}), 404
+    return _json_response(entry.to_dict())
 
 
 @app.route('/api/plugins/<plugin_name>/activate', methods=['POST'])
@@ -789,17 +1097,16 @@ def activate_plugin(plugin_name):
     STATE-MUTATING COMMAND (plugin state only): Transitions plugin to ACTIVE.
     Does NOT touch FEEN simulation state.
     """
-    _ensure_plugins_initialized()
     if not _plugin_registry_available:
-        return jsonify({'error': 'Plugin registry unavailable'}), 503
+        return _json_response({'error': 'Plugin registry unavailable'}), 503
     entry = plugin_registry.get_plugin(plugin_name)
     if entry is None:
-        return jsonify({'error': f'Plugin {plugin_name!r} not found'}), 404
+        return _json_response({'error': f'Plugin {plugin_name!r} not found'}), 404
     ok = plugin_registry.activate_plugin(plugin_name)
     updated = plugin_registry.get_plugin(plugin_name)
     if ok:
-        return jsonify({'message': f'Plugin {plugin_name!r} activated', 'plugin': updated.to_dict()})
-    return jsonify({'error': f'Could not activate {plugin_name!r}', 'plugin': updated.to_dict()}), 400
+        return _json_response({'message': f'Plugin {plugin_name!r} activated', 'plugin': updated.to_dict()})
+    return _json_response({'error': f'Could not activate {plugin_name!r}', 'plugin': updated.to_dict()}), 400
 
 
 @app.route('/api/plugins/<plugin_name>/deactivate', methods=['POST'])
@@ -809,75 +1116,135 @@ def deactivate_plugin(plugin_name):
     STATE-MUTATING COMMAND (plugin state only): Transitions plugin to REGISTERED.
     Does NOT touch FEEN simulation state.
     """
-    _ensure_plugins_initialized()
     if not _plugin_registry_available:
-        return jsonify({'error': 'Plugin registry unavailable'}), 503
+        return _json_response({'error': 'Plugin registry unavailable'}), 503
     entry = plugin_registry.get_plugin(plugin_name)
     if entry is None:
-        return jsonify({'error': f'Plugin {plugin_name!r} not found'}), 404
+        return _json_response({'error': f'Plugin {plugin_name!r} not found'}), 404
     ok = plugin_registry.deactivate_plugin(plugin_name)
     updated = plugin_registry.get_plugin(plugin_name)
     if ok:
-        return jsonify({'message': f'Plugin {plugin_name!r} deactivated', 'plugin': updated.to_dict()})
-    return jsonify({'error': f'Could not deactivate {plugin_name!r}', 'plugin': updated.to_dict()}), 400
+        return _json_response({'message': f'Plugin {plugin_name!r} deactivated', 'plugin': updated.to_dict()})
+    return _json_response({'error': f'Could not deactivate {plugin_name!r}', 'plugin': updated.to_dict()}), 400
+
+
+# Constant response bodies, encoded once at import time.
+_INDEX_BODY = _dumps({
+    'service': 'FEEN REST API',
+    'version': '1.0.0',
+    'description': 'REST API for FEEN Wave Engine with global node access',
+    'endpoint_classification': {
+        'read_only_observer': [
+            'GET /api/health',
+            'GET /api/network/status',
+            'GET /api/network/nodes',
+            'GET /api/network/nodes/<id>',
+            'GET /api/network/state',
+            'GET /api/config/snapshot',
+            'GET /api/network/couplings',
+            'GET /api/plugins',
+            'GET /api/plugins/<name>',
+        ],
+        'state_mutating_command': [
+            'POST /api/network/nodes',
+            'POST /api/network/nodes/<id>/inject',
+            'POST /api/network/tick',
+            'POST /api/network/reset',
+            'POST /api/network/couplings',
+            'DELETE /api/network/couplings',
+            'POST /api/plugins/<name>/activate',
+            'POST /api/plugins/<name>/deactivate',
+        ]
+    },
+    'endpoints': {
+        'GET /api/health': 'Infrastructure liveness (read-only)',
+        'GET /api/network/status': 'Get network status (read-only)',
+        'GET /api/network/nodes': 'List all nodes (read-only)',
+        'POST /api/network/nodes': 'Add a new node (mutating)',
+        'GET /api/network/nodes/<id>': 'Get specific node state (read-only)',
+        'POST /api/network/nodes/<id>/inject': 'Inject signal to node (mutating)',
+        'POST /api/network/tick': 'Evolve network by timestep (mutating)',
+        'GET /api/network/state': 'Get global network state vector (read-only)',
+        'GET /api/config/snapshot': 'Get config snapshot for auditing (read-only)',
+        'GET /api/network/couplings': 'List active couplings (read-only)',
+        'POST /api/network/couplings': 'Add coupling (mutating)',
+        'DELETE /api/network/couplings': 'Remove coupling (mutating)',
+        'POST /api/network/reset': 'Reset the network (mutating)',
+        'GET /api/plugins': 'List all plugins and their state (read-only)',
+        'GET /api/plugins/<name>': 'Get a specific plugin (read-only)',
+        'POST /api/plugins/<name>/activate': 'Activate a plugin (plugin state only)',
+        'POST /api/plugins/<name>/deactivate': 'Deactivate a plugin (plugin state only)',
+    },
+    'example_node_config': {
+        'frequency_hz': 1000.0,
+        'q_factor': 200.0,
+        'beta': 1e-4,
+        'name': 'my_resonator'
+    }
+})
 
 
 @app.route('/api', methods=['GET'])
 def index():
     """API documentation."""
-    return jsonify({
-        'service': 'FEEN REST API',
-        'version': '1.0.0',
-        'description': 'REST API for FEEN Wave Engine with global node access',
-        'endpoint_classification': {
-            'read_only_observer': [
-                'GET /api/health',
-                'GET /api/network/status',
-                'GET /api/network/nodes',
-                'GET /api/network/nodes/<id>',
-                'GET /api/network/state',
-                'GET /api/config/snapshot',
-                'GET /api/network/couplings',
-                'GET /api/plugins',
-                'GET /api/plugins/<name>',
-            ],
-            'state_mutating_command': [
-                'POST /api/network/nodes',
-                'POST /api/network/nodes/<id>/inject',
-                'POST /api/network/tick',
-                'POST /api/network/reset',
-                'POST /api/network/couplings',
-                'DELETE /api/network/couplings',
-                'POST /api/plugins/<name>/activate',
-                'POST /api/plugins/<name>/deactivate',
-            ]
-        },
-        'endpoints': {
-            'GET /api/health': 'Infrastructure liveness (read-only)',
-            'GET /api/network/status': 'Get network status (read-only)',
-            'GET /api/network/nodes': 'List all nodes (read-only)',
-            'POST /api/network/nodes': 'Add a new node (mutating)',
-            'GET /api/network/nodes/<id>': 'Get specific node state (read-only)',
-            'POST /api/network/nodes/<id>/inject': 'Inject signal to node (mutating)',
-            'POST /api/network/tick': 'Evolve network by timestep (mutating)',
-            'GET /api/network/state': 'Get global network state vector (read-only)',
-            'GET /api/config/snapshot': 'Get config snapshot for auditing (read-only)',
-            'GET /api/network/couplings': 'List active couplings (read-only)',
-            'POST /api/network/couplings': 'Add coupling (mutating)',
-            'DELETE /api/network/couplings': 'Remove coupling (mutating)',
-            'POST /api/network/reset': 'Reset the network (mutating)',
-            'GET /api/plugins': 'List all plugins and their state (read-only)',
-            'GET /api/plugins/<name>': 'Get a specific plugin (read-only)',
-            'POST /api/plugins/<name>/activate': 'Activate a plugin (plugin state only)',
-            'POST /api/plugins/<name>/deactivate': 'Deactivate a plugin (plugin state only)',
-        },
-        'example_node_config': {
-            'frequency_hz': 1000.0,
-            'q_factor': 200.0,
-            'beta': 1e-4,
-            'name': 'my_resonator'
-        }
-    })
+    return _static_json_response(_INDEX_BODY)
+
+
+# ---------------------------------------------------------------------------
+# Static fast path
+# ---------------------------------------------------------------------------
+
+class _StaticGetMiddleware:
+    """WSGI shortcut for GET routes whose body never changes.
+
+    Matching requests are answered with pre-encoded bytes before Flask
+    builds a request context, so polling /api/health or a plugin's /info
+    skips routing and the before/after request hooks.  Requests carrying
+    an Origin header still go through Flask so flask-cors can answer them.
+    Everything else is passed through unchanged.
+    """
+
+    def __init__(self, wsgi_app, bodies):
+        self.wsgi_app = wsgi_app
+        self._routes = {}
+        for path, (body, extra_headers) in bodies.items():
+            headers = [('Content-Type', 'application/json'),
+                       ('Content-Length', str(len(body)))]
+            headers.extend(extra_headers)
+            self._routes[path] = (body, headers)
+
+    def __call__(self, environ, start_response):
+        if environ.get('REQUEST_METHOD') == 'GET' and 'HTTP_ORIGIN' not in environ:
+            hit = self._routes.get(environ.get('PATH_INFO'))
+            if hit is not None:
+                start_response('200 OK', list(hit[1]))
+                return [hit[0]]
+        return self.wsgi_app(environ, start_response)
+
+
+def _static_get_bodies():
+    """Map static GET paths to (body, extra headers).
+
+    Plugin /info views serve their manifest dict, so any active plugin
+    blueprint with an ``info`` endpoint is answered from the registry copy.
+    """
+    cache_headers = [('Cache-Control', 'public, max-age=1')]
+    bodies = {
+        '/api/health': (_HEALTH_BODY, cache_headers),
+        '/api': (_INDEX_BODY, cache_headers),
+    }
+    if _plugin_registry_available:
+        info_rules = {r.endpoint: r.rule for r in app.url_map.iter_rules()
+                      if r.endpoint.endswith('.info')}
+        for bp in plugin_registry.active_blueprints():
+            entry = plugin_registry.get_plugin(bp.name)
+            rule = info_rules.get(f'{bp.name}.info')
+            if entry is not None and rule is not None:
+                bodies[rule] = (entry.manifest.to_json(), [])
+    return bodies
+
+
+app.wsgi_app = _StaticGetMiddleware(app.wsgi_app, _static_get_bodies())
 
 
 def main():
@@ -897,7 +1264,8 @@ def main():
     print("")
     print("⚠️  WARNING: This is a DEVELOPMENT server, not for production use!")
     print("   For production deployments, use a production WSGI server like:")
-    print("   - Gunicorn: gunicorn -w 4 -b 0.0.0.0:5000 feen_rest_api:app")
+    print("   - Gunicorn: gunicorn -w 4 -k gthread --threads 4 --keep-alive 75 "
+          "--backlog 2048 --reuse-port -b 0.0.0.0:5000 feen_rest_api:app")
     print("   - uWSGI: uwsgi --http 0.0.0.0:5000 --module feen_rest_api:app")
     print("")
     print(f"Starting FEEN REST API server on {args.host}:{args.port}")
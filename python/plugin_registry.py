@@ -25,17 +25,49 @@ This module does NOT import pyfeen and does NOT touch simulation state.
 
 from __future__ import annotations
 
+import functools
 import importlib
-import importlib.util
+import json
 import logging
 import os
 import sys
-import traceback
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# ---------------------------------------------------------------------------
+# JSON encoding shared by the REST API, plugins and web blueprints.
+# orjson when installed, else the stdlib; both accept NumPy values and
+# non-str dict keys and emit compact UTF-8 bytes.
+# ---------------------------------------------------------------------------
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj: Any, sort_keys: bool = False) -> bytes:
+        """Encode *obj* as compact JSON bytes."""
+        option = _ORJSON_OPTIONS | orjson.OPT_SORT_KEYS if sort_keys else _ORJSON_OPTIONS
+        return orjson.dumps(obj, option=option)
+
+    loads = orjson.loads
+else:  # pragma: no cover
+    def _to_builtin(obj: Any) -> Any:
+        if hasattr(obj, "tolist"):  # NumPy arrays and scalars
+            return obj.tolist()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def dumps(obj: Any, sort_keys: bool = False) -> bytes:
+        """Encode *obj* as compact JSON bytes."""
+        return json.dumps(obj, sort_keys=sort_keys, separators=(",", ":"),
+                          default=_to_builtin).encode("utf-8")
+
+    loads = json.loads
+
 # ---------------------------------------------------------------------------
 # FEEN plugin API version this registry implements.
 # Plugins declare a compatible range; incompatible plugins are rejected.
@@ -43,7 +75,7 @@ logger = logging.getLogger(__name__)
 FEEN_PLUGIN_API_VERSION = (1, 0)
 
 
-class PluginType(str, Enum):
+class PluginType(Enum):
     """Declares what a plugin is allowed to do."""
 
     UI = "ui"
@@ -57,7 +89,7 @@ class PluginType(str, Enum):
     The plugin MUST document every POST it issues in its manifest."""
 
 
-class PluginState(str, Enum):
+class PluginState(Enum):
     """Lifecycle state machine for a single plugin."""
 
     UNLOADED = "unloaded"
@@ -83,6 +115,11 @@ class PluginManifest:
         )
     """
 
+    __slots__ = (
+        "name", "version", "plugin_type", "description",
+        "min_feen_api", "max_feen_api", "commands_issued", "_dict", "_json",
+    )
+
     def __init__(
         self,
         *,
@@ -112,12 +149,8 @@ class PluginManifest:
                 "commands_issued — only TOOL plugins may issue commands."
             )
 
-    def is_api_compatible(self) -> bool:
-        """Return True if this plugin is compatible with the running FEEN API version."""
-        return self.min_feen_api <= FEEN_PLUGIN_API_VERSION <= self.max_feen_api
-
-    def to_dict(self) -> Dict[str, Any]:
-        return {
+        # Manifests are immutable after construction: serialize once.
+        self._dict: Dict[str, Any] = {
             "name": self.name,
             "version": list(self.version),
             "type": self.plugin_type.value,
@@ -126,11 +159,40 @@ class PluginManifest:
             "max_feen_api": list(self.max_feen_api),
             "commands_issued": self.commands_issued,
         }
+        self._json = dumps(self._dict)
+
+    def is_api_compatible(self) -> bool:
+        """Return True if this plugin is compatible with the running FEEN API version."""
+        return self.min_feen_api <= FEEN_PLUGIN_API_VERSION <= self.max_feen_api
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self._dict.copy()
+
+    def to_json(self) -> bytes:
+        """The manifest as JSON bytes, encoded once (e.g. for /info routes)."""
+        return self._json
+
+
+def _debug_tracebacks() -> bool:
+    """Attach tracebacks to plugin failure logs only when DEBUG is enabled,
+    so repeatedly failing plugins do not pay for formatting in production."""
+    return logger.isEnabledFor(logging.DEBUG)
+
+
+# Optional module-level hooks a plugin may define.
+_PLUGIN_HOOKS = ("get_blueprint", "activate", "deactivate", "unload")
+
+
+def _resolve_hooks(module: Any) -> Dict[str, Optional[Callable[[], Any]]]:
+    """Look up each optional hook once; missing hooks (or no module) map to None."""
+    return {hook: getattr(module, hook, None) for hook in _PLUGIN_HOOKS}
 
 
 class PluginEntry:
     """Internal tracking record for a loaded plugin."""
 
+    __slots__ = ("manifest", "module", "state", "error", "blueprint", "hooks")
+
     def __init__(self, manifest: PluginManifest, module: Any) -> None:
         self.manifest = manifest
         self.module = module
@@ -138,13 +200,47 @@ class PluginEntry:
         self.error: Optional[str] = None
         # Flask blueprints or route functions the plugin optionally provides.
         self.blueprint: Optional[Any] = None
+        # Lifecycle hooks resolved at load time, so state transitions make a
+        # single indirect call instead of hasattr() + getattr() each time.
+        self.hooks = _resolve_hooks(module)
+
+    @classmethod
+    def failed(cls, manifest: PluginManifest, module: Any, error: str) -> "PluginEntry":
+        """Build an entry already in FAILED state."""
+        entry = cls(manifest, module)
+        entry.state = PluginState.FAILED
+        entry.error = error
+        return entry
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            **self.manifest.to_dict(),
-            "state": self.state.value,
-            "error": self.error,
-        }
+        d = self.manifest._dict.copy()
+        d["state"] = self.state.value
+        d["error"] = self.error
+        return d
+
+
+# Plugin types confined to read-only HTTP, and the methods they may issue.
+_READ_ONLY_TYPES = frozenset({PluginType.OBSERVER, PluginType.UI})
+# Lowercase spellings are included so the common cases skip str.upper().
+_READ_ONLY_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "get", "head", "options"})
+
+
+def _placeholder_manifest(path_or_module: str, description: str) -> PluginManifest:
+    """Stand-in manifest for a plugin whose own MANIFEST is unavailable."""
+    return _cached_placeholder_manifest(
+        os.path.splitext(os.path.basename(path_or_module))[0], description)
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_placeholder_manifest(name: str, description: str) -> PluginManifest:
+    # Manifests are immutable, so failed entries with the same name and
+    # reason can share one instance instead of re-validating each time.
+    return PluginManifest(
+        name=name,
+        version=(0, 0, 0),
+        plugin_type=PluginType.UI,
+        description=description,
+    )
 
 
 class ObserverBoundaryViolation(Exception):
@@ -165,93 +261,95 @@ class PluginRegistry:
         registry.unload_plugin("energy_logger")
     """
 
+    # Modules imported from file paths, keyed by real path and shared across
+    # registries, so reloading a plugin does not re-execute its module.
+    # Module-level plugin state is therefore shared too: registries loading
+    # the same file get the same module object.  Entries hold the file's
+    # mtime at import; an edited or unloaded plugin is re-executed.
+    _module_cache: Dict[str, Tuple[int, Any]] = {}
+
     def __init__(self) -> None:
         self._plugins: Dict[str, PluginEntry] = {}
+        # Blueprints of ACTIVE plugins by name, maintained on every transition
+        # into or out of ACTIVE so active_blueprints() need not scan all plugins.
+        self._active_blueprints: Dict[str, Any] = {}
 
     # ------------------------------------------------------------------
     # Lifecycle methods
     # ------------------------------------------------------------------
 
-    def load_plugin(self, path_or_module: str) -> PluginEntry:
+    def load_plugin(self, path_or_module: str, reload: bool = False) -> PluginEntry:
         """Load a plugin from a file path or dotted module name.
 
         The plugin module must expose a ``MANIFEST`` attribute of type
         :class:`PluginManifest`.  Loading is sandboxed: any exception raised
         during module import is caught and the plugin is put in FAILED state.
 
+        A module that was already imported is reused while its file is
+        unchanged; pass ``reload=True`` to re-execute it regardless.
+
         Returns the :class:`PluginEntry` regardless of success/failure.
         """
         try:
-            module = self._import_plugin(path_or_module)
+            module = self._import_plugin(path_or_module, reload=reload)
         except Exception as exc:
-            logger.error("Failed to import plugin %r: %s", path_or_module, exc)
+            logger.error("Failed to import plugin %r: %s", path_or_module, exc, exc_info=_debug_tracebacks())
             # Create a minimal failed entry so callers always get a return value.
-            failed = PluginEntry.__new__(PluginEntry)
-            failed.manifest = PluginManifest(
-                name=os.path.splitext(os.path.basename(path_or_module))[0],
-                version=(0, 0, 0),
-                plugin_type=PluginType.UI,
-                description="[failed to load]",
-            )
-            failed.module = None
-            failed.state = PluginState.FAILED
-            failed.error = str(exc)
-            failed.blueprint = None
-            self._plugins[failed.manifest.name] = failed
+            failed = PluginEntry.failed(
+                _placeholder_manifest(path_or_module, "[failed to load]"), None, str(exc))
+            self._store(failed)
             return failed
 
         manifest = getattr(module, "MANIFEST", None)
         if not isinstance(manifest, PluginManifest):
-            entry = PluginEntry.__new__(PluginEntry)
-            entry.manifest = PluginManifest(
-                name=os.path.splitext(os.path.basename(path_or_module))[0],
-                version=(0, 0, 0),
-                plugin_type=PluginType.UI,
-                description="[missing MANIFEST]",
-            )
-            entry.module = module
-            entry.state = PluginState.FAILED
-            entry.error = "Module does not expose a PluginManifest as MANIFEST"
-            entry.blueprint = None
-            self._plugins[entry.manifest.name] = entry
+            entry = PluginEntry.failed(
+                _placeholder_manifest(path_or_module, "[missing MANIFEST]"), module,
+                "Module does not expose a PluginManifest as MANIFEST")
+            self._store(entry)
             return entry
 
         if not manifest.is_api_compatible():
-            entry = PluginEntry.__new__(PluginEntry)
-            entry.manifest = manifest
-            entry.module = module
-            entry.state = PluginState.FAILED
-            entry.error = (
+            entry = PluginEntry.failed(
+                manifest, module,
                 f"Plugin requires FEEN API {manifest.min_feen_api}–{manifest.max_feen_api}; "
-                f"running {FEEN_PLUGIN_API_VERSION}"
+                f"running {FEEN_PLUGIN_API_VERSION}",
             )
-            entry.blueprint = None
-            self._plugins[manifest.name] = entry
+            self._store(entry)
             return entry
 
         entry = PluginEntry(manifest, module)
-        self._plugins[manifest.name] = entry
+        self._store(entry)
         logger.info("Loaded plugin %r (%s)", manifest.name, manifest.plugin_type.value)
         return entry
 
+    def _store(self, entry: PluginEntry) -> None:
+        """Add *entry*, replacing (and retiring) any plugin of the same name."""
+        name = entry.manifest.name
+        self._plugins[name] = entry
+        self._active_blueprints.pop(name, None)
+
     def register_plugin(self, name: str) -> bool:
         """Advance a LOADED plugin to REGISTERED state (obtains its Blueprint if any).
 
         Returns True on success, False on failure.
         """
         entry = self._plugins.get(name)
-        if entry is None or entry.state != PluginState.LOADED:
+        if entry is None or entry.state is not PluginState.LOADED:
             return False
+        return self._register_entry(name, entry)
+
+    def _register_entry(self, name: str, entry: PluginEntry) -> bool:
         try:
-            if hasattr(entry.module, "get_blueprint"):
-                entry.blueprint = entry.module.get_blueprint()
+            get_blueprint = entry.hooks["get_blueprint"]
+            if get_blueprint is not None:
+                entry.blueprint = get_blueprint()
             entry.state = PluginState.REGISTERED
             logger.info("Registered plugin %r", name)
             return True
         except Exception as exc:
             entry.state = PluginState.FAILED
             entry.error = f"register failed: {exc}"
-            logger.error("Failed to register plugin %r: %s", name, exc)
+            logger.error("Failed to register plugin %r: %s", name, exc, exc_info=_debug_tracebacks())
             return False
 
     def activate_plugin(self, name: str) -> bool:
@@ -261,18 +359,24 @@ class PluginRegistry:
         Returns True on success, False on failure.
         """
         entry = self._plugins.get(name)
-        if entry is None or entry.state != PluginState.REGISTERED:
+        if entry is None or entry.state is not PluginState.REGISTERED:
             return False
+        return self._activate_entry(name, entry)
+
+    def _activate_entry(self, name: str, entry: PluginEntry) -> bool:
         try:
-            if hasattr(entry.module, "activate"):
-                entry.module.activate()
+            activate = entry.hooks["activate"]
+            if activate is not None:
+                activate()
             entry.state = PluginState.ACTIVE
+            if entry.blueprint is not None:
+                self._active_blueprints[name] = entry.blueprint
             logger.info("Activated plugin %r", name)
             return True
         except Exception as exc:
             entry.state = PluginState.FAILED
             entry.error = f"activate failed: {exc}"
-            logger.error("Failed to activate plugin %r: %s", name, exc)
+            logger.error("Failed to activate plugin %r: %s", name, exc, exc_info=_debug_tracebacks())
             return False
 
     def deactivate_plugin(self, name: str) -> bool:
@@ -282,36 +386,44 @@ class PluginRegistry:
         Returns True on success, False on failure.
         """
         entry = self._plugins.get(name)
-        if entry is None or entry.state != PluginState.ACTIVE:
+        if entry is None or entry.state is not PluginState.ACTIVE:
             return False
+        # Leaves ACTIVE whether the hook succeeds or fails.
+        self._active_blueprints.pop(name, None)
         try:
-            if hasattr(entry.module, "deactivate"):
-                entry.module.deactivate()
+            deactivate = entry.hooks["deactivate"]
+            if deactivate is not None:
+                deactivate()
             entry.state = PluginState.REGISTERED
             logger.info("Deactivated plugin %r", name)
             return True
         except Exception as exc:
             entry.state = PluginState.FAILED
             entry.error = f"deactivate failed: {exc}"
-            logger.error("Failed to deactivate plugin %r: %s", name, exc)
+            logger.error("Failed to deactivate plugin %r: %s", name, exc, exc_info=_debug_tracebacks())
             return False
 
     def unload_plugin(self, name: str) -> bool:
         """Deactivate (if needed) and remove a plugin from the registry.
 
-        Calls ``plugin.unload()`` if present.  Returns True on success.
+        Calls ``plugin.unload()`` if present and evicts the module from the
+        module cache, so a later load_plugin() gets a fresh module rather than
+        the torn-down one.  Returns True on success.
         """
         entry = self._plugins.get(name)
         if entry is None:
             return False
         try:
-            if entry.state == PluginState.ACTIVE:
+            if entry.state is PluginState.ACTIVE:
                 self.deactivate_plugin(name)
-            if entry.module is not None and hasattr(entry.module, "unload"):
-                entry.module.unload()
+            unload = entry.hooks["unload"]
+            if unload is not None:
+                unload()
         except Exception as exc:
-            logger.error("Error during unload of %r: %s", name, exc)
+            logger.error("Error during unload of %r: %s", name, exc, exc_info=_debug_tracebacks())
         del self._plugins[name]
+        self._active_blueprints.pop(name, None)
+        self._evict_module(entry.module)
         logger.info("Unloaded plugin %r", name)
         return True
 
@@ -321,12 +433,12 @@ class PluginRegistry:
 
     def activate_all(self) -> None:
         """Load → register → activate all LOADED plugins in order."""
-        for name in list(self._plugins.keys()):
-            entry = self._plugins[name]
-            if entry.state == PluginState.LOADED:
-                self.register_plugin(name)
-            if entry.state == PluginState.REGISTERED:
-                self.activate_plugin(name)
+        for name, entry in list(self._plugins.items()):
+            if entry.state is PluginState.LOADED:
+                self._register_entry(name, entry)
+            # Re-read: registration may have advanced or failed the entry.
+            if entry.state is PluginState.REGISTERED:
+                self._activate_entry(name, entry)
 
     # ------------------------------------------------------------------
     # Observer boundary enforcement
@@ -340,8 +452,8 @@ class PluginRegistry:
         ``method`` should be the HTTP method string (e.g. ``"POST"``).
         ``path`` is the endpoint path for logging purposes.
         """
-        if plugin_type in (PluginType.OBSERVER, PluginType.UI):
-            if method.upper() not in ("GET", "HEAD", "OPTIONS"):
+        if plugin_type in _READ_ONLY_TYPES and method not in _READ_ONLY_METHODS:
+            if method.upper() not in _READ_ONLY_METHODS:
                 raise ObserverBoundaryViolation(
                     f"Plugin of type {plugin_type.value!r} attempted {method.upper()} {path!r}. "
                     "Observer/UI plugins may only issue read-only HTTP requests."
@@ -359,26 +471,54 @@ class PluginRegistry:
 
     def active_blueprints(self) -> List[Any]:
         """Return Flask Blueprints from all ACTIVE plugins that provided one."""
-        return [
-            e.blueprint
-            for e in self._plugins.values()
-            if e.state == PluginState.ACTIVE and e.blueprint is not None
-        ]
+        return list(self._active_blueprints.values())
+
+    @classmethod
+    def invalidate_module_cache(cls) -> None:
+        """Forget cached plugin modules and reset the import system's finder
+        caches, so edited or newly installed plugins are picked up by the
+        next load_plugin() call."""
+        cls._module_cache.clear()
+        importlib.invalidate_caches()
 
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
 
-    @staticmethod
-    def _import_plugin(path_or_module: str) -> Any:
+    @classmethod
+    def _evict_module(cls, module: Any) -> None:
+        """Drop *module* from the module cache (no-op for dotted imports)."""
+        for key, (_, cached) in list(cls._module_cache.items()):
+            if cached is module:
+                del cls._module_cache[key]
+
+    @classmethod
+    def _import_plugin(cls, path_or_module: str, reload: bool = False) -> Any:
         """Import a plugin by file path or dotted module name."""
         if os.path.isfile(path_or_module):
-            spec = importlib.util.spec_from_file_location(
+            key = os.path.realpath(path_or_module)
+            mtime = os.stat(key).st_mtime_ns
+            cached = cls._module_cache.get(key)
+            if cached is not None and cached[0] == mtime and not reload:
+                return cached[1]
+
+            # Only file-path loading needs importlib.util; import it here so
+            # manifest-only consumers of this module do not pay for it.
+            import importlib.util as importlib_util
+
+            spec = importlib_util.spec_from_file_location(
                 "feen_plugin_" + os.path.splitext(os.path.basename(path_or_module))[0],
                 path_or_module,
             )
-            module = importlib.util.module_from_spec(spec)
+            module = importlib_util.module_from_spec(spec)
             spec.loader.exec_module(module)
+            # Register under the spec name so objects defined by the plugin
+            # can be pickled by reference (e.g. for process-pool workers).
+            sys.modules[spec.name] = module
+            cls._module_cache[key] = (mtime, module)
             return module
         # Dotted module name
-        return importlib.import_module(path_or_module)
+        module = sys.modules.get(path_or_module)
+        if module is None:
+            return importlib.import_module(path_or_module)
+        return importlib.reload(module) if reload else module
@@ -21,9 +21,9 @@ import logging
 import time
 from typing import Any, Dict, List, Optional
 
-from flask import Blueprint, jsonify
+import numpy as np
 
-from plugin_registry import PluginManifest, PluginType
+from plugin_registry import PluginManifest, PluginType, dumps as _dumps
 
 logger = logging.getLogger(__name__)
 
@@ -42,56 +42,127 @@ MANIFEST = PluginManifest(
 # ---------------------------------------------------------------------------
 # Metrics store (observer-side only)
 # ---------------------------------------------------------------------------
+# Column-wise: "ids" is a list, "snr"/"energy"/"snr_headroom_db" are float
+# arrays indexed alongside it. Expanded to per-node dicts only when served.
 _latest_metrics: Optional[Dict[str, Any]] = None
+# Simulation tick of the snapshot behind _latest_metrics, when the caller
+# supplied one.
+_last_tick: Optional[int] = None
+# Bumped whenever _latest_metrics is replaced or cleared. Together with a
+# per-process prefix it forms the ETag of /metrics, so tags from another
+# worker or an earlier process never match.
+_metrics_version = 0
+_ETAG_PREFIX = format(time.time_ns(), "x")
+
+
+def _metrics_payload(metrics: Dict[str, Any]) -> Dict[str, Any]:
+    """Expand the column store into the per-node JSON shape."""
+    return {
+        "wall_time": metrics["wall_time"],
+        "node_count": metrics["node_count"],
+        "nodes": [
+            {"id": i, "snr": snr, "snr_headroom_db": headroom, "energy": energy}
+            for i, snr, headroom, energy in zip(
+                metrics["ids"],
+                metrics["snr"].tolist(),
+                metrics["snr_headroom_db"].tolist(),
+                metrics["energy"].tolist(),
+            )
+        ],
+    }
 
 # ---------------------------------------------------------------------------
-# Blueprint
+# Blueprint (built on first get_blueprint() call so that loading the module
+# for its MANIFEST does not import Flask)
 # ---------------------------------------------------------------------------
-_blueprint = Blueprint("hardware_monitor", __name__, url_prefix="/plugins/hardware_monitor")
+_blueprint = None
+
+
+def _build_blueprint():
+    from flask import Blueprint, Response, request
+
+    bp = Blueprint("hardware_monitor", __name__, url_prefix="/plugins/hardware_monitor")
+
+    # Static bodies are encoded once, when the blueprint is built.
+    no_data_body = _dumps({"status": "no_data", "metrics": None})
 
+    # (version, encoded body) of the last /metrics response, replaced as a
+    # single tuple so concurrent requests never pair a version with another
+    # version's body.
+    cache = (None, b"")
 
-@_blueprint.route("/metrics", methods=["GET"])
-def get_metrics():
-    """Return latest derived hardware metrics — read-only endpoint."""
-    if _latest_metrics is None:
-        return jsonify({"status": "no_data", "metrics": None})
-    return jsonify(_latest_metrics)
+    @bp.route("/metrics", methods=["GET"])
+    def get_metrics():
+        """Return latest derived hardware metrics — read-only endpoint.
 
+        Repeat polls between updates reuse the encoded body, and a matching
+        If-None-Match gets an empty 304.
+        """
+        nonlocal cache
+        version, metrics = _metrics_version, _latest_metrics
+        etag = f"{_ETAG_PREFIX}-{version}"
+        if etag in request.if_none_match:
+            resp = Response(status=304)
+        else:
+            cached_version, body = cache
+            if cached_version != version:
+                body = no_data_body if metrics is None else _dumps(_metrics_payload(metrics))
+                cache = (version, body)
+            resp = Response(body, mimetype="application/json")
+        resp.set_etag(etag)
+        resp.headers["Cache-Control"] = "no-cache"
+        return resp
 
-@_blueprint.route("/info", methods=["GET"])
-def info():
-    """Return plugin metadata — read-only endpoint."""
-    return jsonify(MANIFEST.to_dict())
+    @bp.route("/info", methods=["GET"])
+    def info():
+        """Return plugin metadata — read-only endpoint."""
+        return Response(MANIFEST.to_json(), mimetype="application/json")
+
+    return bp
 
 
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
-def update_metrics(nodes_snapshot: List[Dict[str, Any]]) -> None:
+def update_metrics(nodes_snapshot: List[Dict[str, Any]],
+                   tick: Optional[int] = None) -> None:
     """Compute and cache derived hardware metrics from a node snapshot.
 
     ``nodes_snapshot`` is the parsed JSON list from GET /api/network/nodes.
+    ``tick`` is the network tick count the snapshot was taken at, if known;
+    a repeated tick, or a snapshot whose ids/SNR/energy match the cached
+    metrics, leaves the cache (including its wall_time) untouched.
     Never mutates simulation state.
     """
-    global _latest_metrics
-
-    node_metrics = []
-    for n in nodes_snapshot:
-        snr = n.get("snr", 0.0)
-        energy = n.get("energy", 0.0)
-        node_metrics.append({
-            "id": n.get("id"),
-            "snr": snr,
-            "snr_headroom_db": max(0.0, snr - 10.0),  # margin above MIN_READABLE_SNR
-            "energy": energy,
-        })
+    global _latest_metrics, _last_tick, _metrics_version
+
+    if tick is not None and tick == _last_tick and _latest_metrics is not None:
+        return
+
+    count = len(nodes_snapshot)
+    snr = np.fromiter((n.get("snr", 0.0) for n in nodes_snapshot),
+                      dtype=np.float64, count=count)
+    energy = np.fromiter((n.get("energy", 0.0) for n in nodes_snapshot),
+                         dtype=np.float64, count=count)
+    ids = [n.get("id") for n in nodes_snapshot]
+
+    _last_tick = tick
+    prev = _latest_metrics
+    if (prev is not None and prev["ids"] == ids
+            and np.array_equal(prev["snr"], snr)
+            and np.array_equal(prev["energy"], energy)):
+        return
 
     _latest_metrics = {
         "wall_time": time.time(),
-        "node_count": len(node_metrics),
-        "nodes": node_metrics,
+        "node_count": count,
+        "ids": ids,
+        "snr": snr,
+        "energy": energy,
+        "snr_headroom_db": np.maximum(0.0, snr - 10.0),  # margin above MIN_READABLE_SNR
     }
+    _metrics_version += 1
 
 
 # ---------------------------------------------------------------------------
@@ -99,6 +170,9 @@ def update_metrics(nodes_snapshot: List[Dict[str, Any]]) -> None:
 # ---------------------------------------------------------------------------
 
 def get_blueprint():
+    global _blueprint
+    if _blueprint is None:
+        _blueprint = _build_blueprint()
     return _blueprint
 
 
@@ -107,8 +181,10 @@ def activate():
 
 
 def deactivate():
-    global _latest_metrics
+    global _latest_metrics, _last_tick, _metrics_version
     _latest_metrics = None
+    _last_tick = None
+    _metrics_version += 1
     logger.info("hardware_monitor plugin deactivated")
 
 
@@ -21,30 +21,41 @@ Implements the full Phase-1 through Phase-4 HLV test plan:
 
 Architecture:
   • All simulation state is fully contained in this plugin.
-  • The FEEN C++ integrator is not used; Euler/RK4 runs in pure Python/NumPy.
-  • Observer hooks are called after each integration step.
+  • The FEEN C++ integrator is not used.  Euler/RK4 runs in Numba kernels
+    when numba is installed and the run has no scheduled perturbations;
+    otherwise it runs as a NumPy loop.  The two round differently in the
+    last bits, so the engine is recorded in config.json ("engine").
+  • O1 is computed alongside each integration step.  O2 depends only on the
+    R history and is evaluated in one pass after the run.
   • The plugin exposes a Flask Blueprint at /api/hlv/*.
-  • Thread safety: a single lock guards the active simulation state.
+  • Thread safety: results and status are published as immutable objects,
+    so readers take no lock; a lock only serialises writers.
 """
 
 from __future__ import annotations
 
 import csv
+import functools
 import hashlib
+import heapq
 import io
 import json
 import logging
 import math
+import multiprocessing
 import os
 import smtplib
+import sys
 import threading
 import time as _time
 import zipfile
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from email.message import EmailMessage
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 import numpy as np
-from flask import Blueprint, Response, jsonify, request
+from flask import Blueprint, Response, request
 
 try:
     from fpdf import FPDF
@@ -58,7 +69,21 @@ try:
 except ImportError:  # pragma: no cover
     _DOCX_AVAILABLE = False
 
-from plugin_registry import FEEN_PLUGIN_API_VERSION, PluginManifest, PluginType
+try:
+    import scipy.sparse as _sparse
+    _SCIPY_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    _SCIPY_AVAILABLE = False
+
+try:
+    from numba import njit
+    _NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    _NUMBA_AVAILABLE = False
+
+from plugin_registry import (
+    FEEN_PLUGIN_API_VERSION, PluginManifest, PluginType, dumps as _dumps,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -89,53 +114,147 @@ MANIFEST = PluginManifest(
 # Graph layer — topology builders (Aᵢⱼ, φᵢⱼ)
 # ---------------------------------------------------------------------------
 
+def _ring_edges(N: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Upper edge list (i, i+1 mod N) of the ring; each pair appears once."""
+    i = np.arange(N, dtype=np.int64)
+    return i, (i + 1) % N
+
+
+def _symmetric_graph(N: int, i: np.ndarray, j: np.ndarray,
+                     weight: float = 1.0) -> Any:
+    """Undirected adjacency from an edge list, without an N×N intermediate.
+
+    Returns CSR when the graph is below SPARSE_DENSITY_THRESHOLD and SciPy is
+    present, otherwise a dense array.  Repeated pairs collapse to one edge.
+    """
+    if _SCIPY_AVAILABLE and 2 * len(i) < SPARSE_DENSITY_THRESHOLD * N * N:
+        rows = np.concatenate((i, j))
+        cols = np.concatenate((j, i))
+        A = _sparse.csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(N, N))
+        A.sum_duplicates()
+        A.sort_indices()
+        A.data[:] = weight
+        return A
+    A = np.zeros((N, N))
+    A[i, j] = weight
+    A[j, i] = weight
+    return A
+
+
 def build_ring(N: int, weight: float = 1.0) -> np.ndarray:
     """Undirected ring graph: each node connects to its two nearest neighbours."""
     A = np.zeros((N, N))
-    for i in range(N):
-        A[i, (i + 1) % N] = weight
-        A[i, (i - 1) % N] = weight
+    i, j = _ring_edges(N)
+    A[i, j] = weight
+    A[j, i] = weight
     return A
 
 
+def _small_world_edges(N: int, k: int, beta: float,
+                       rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+    """Upper edge list (i < j) of a Watts-Strogatz graph.
+
+    Neighbour sets replace the N×N matrix, with the same random draws: the
+    rewiring candidates are the sorted non-neighbours a dense row would give.
+    """
+    half = k // 2
+    nbrs: List[set] = [set() for _ in range(N)]
+    # Start with a ring lattice of degree k
+    for i in range(N):
+        for d in range(1, half + 1):
+            j = (i + d) % N
+            nbrs[i].add(j)
+            nbrs[j].add(i)
+    # Rewire with probability beta: draw every lattice edge's coin at once
+    # and only visit the edges that actually move.
+    mask = rng.random(N * half) < beta
+    nodes = np.arange(N)
+    for e in np.flatnonzero(mask):
+        i, d = divmod(int(e), half)
+        taken = np.fromiter(nbrs[i], dtype=np.int64, count=len(nbrs[i]))
+        candidates = np.setdiff1d(nodes, np.append(taken, i), assume_unique=True)
+        if candidates.size:
+            j_old = (i + d + 1) % N
+            j_new = int(rng.choice(candidates))
+            nbrs[i].discard(j_old)
+            nbrs[j_old].discard(i)
+            nbrs[i].add(j_new)
+            nbrs[j_new].add(i)
+    # i == j survives only where the lattice wraps onto itself (k ≥ N).
+    pairs = [(i, j) for i in range(N) for j in nbrs[i] if i <= j]
+    i = np.fromiter((p[0] for p in pairs), dtype=np.int64, count=len(pairs))
+    j = np.fromiter((p[1] for p in pairs), dtype=np.int64, count=len(pairs))
+    return i, j
+
+
 def build_small_world(N: int, k: int = 4, beta: float = 0.1,
                       rng: Optional[np.random.Generator] = None) -> np.ndarray:
     """Watts-Strogatz small-world graph (unweighted)."""
     if rng is None:
         rng = np.random.default_rng(0)
     A = np.zeros((N, N))
-    # Start with a ring lattice of degree k
-    for i in range(N):
-        for d in range(1, k // 2 + 1):
-            j = (i + d) % N
-            A[i, j] = 1.0
-            A[j, i] = 1.0
-    # Rewire with probability beta
-    for i in range(N):
-        for d in range(1, k // 2 + 1):
-            if rng.random() < beta:
-                j_old = (i + d) % N
-                candidates = [m for m in range(N) if m != i and A[i, m] == 0]
-                if candidates:
-                    j_new = rng.choice(candidates)
-                    A[i, j_old] = 0.0
-                    A[j_old, i] = 0.0
-                    A[i, j_new] = 1.0
-                    A[j_new, i] = 1.0
+    i, j = _small_world_edges(N, k, beta, rng)
+    A[i, j] = 1.0
+    A[j, i] = 1.0
     return A
 
 
+ER_DENSE_THRESHOLD = 0.3
+
+
+def _erdos_renyi_edges(N: int, p: float,
+                       rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+    """Upper-triangle edge list of G(N, p) by skipping geometric gaps."""
+    n_pairs = N * (N - 1) // 2
+    # Linear upper-triangle index: row i starts at i*(2N - i - 1)/2.
+    rows = np.arange(N, dtype=np.int64)
+    row_start = rows * (2 * N - rows - 1) // 2
+    chunks = []
+    last = -1
+    batch = max(16, int(2 * n_pairs * p) + 16)
+    while last < n_pairs:
+        idx = last + np.cumsum(rng.geometric(p, size=batch))
+        chunks.append(idx)
+        last = int(idx[-1])
+    idx = np.concatenate(chunks)
+    idx = idx[idx < n_pairs]
+    i = np.searchsorted(row_start, idx, side="right") - 1
+    j = idx - row_start[i] + i + 1
+    return i, j
+
+
 def build_erdos_renyi(N: int, p: float = 0.2,
                       rng: Optional[np.random.Generator] = None) -> np.ndarray:
-    """Erdős–Rényi random graph G(N, p)."""
+    """Erdős–Rényi random graph G(N, p).
+
+    Sparse graphs are sampled by skipping geometric gaps through the upper
+    triangle, which costs O(N²·p) instead of one draw per node pair; for
+    p > ER_DENSE_THRESHOLD one uniform draw per pair is cheaper.  p ≤ 0 and
+    p ≥ 1 are deterministic and draw nothing from ``rng``.
+    """
     if rng is None:
         rng = np.random.default_rng(0)
+    if N < 2 or p <= 0.0:
+        return np.zeros((N, N))
+    if p >= 1.0:
+        # Every pair is an edge; no draw can fail.
+        return np.ones((N, N)) - np.eye(N)
+    if p > ER_DENSE_THRESHOLD:
+        # One draw per upper-triangle pair, laid into the rows above the
+        # diagonal, instead of an N×N draw of which half is discarded.
+        draws = rng.random(N * (N - 1) // 2) < p
+        upper = np.zeros((N, N), dtype=bool)
+        start = 0
+        for i in range(N - 1):
+            upper[i, i + 1:] = draws[start:start + N - 1 - i]
+            start += N - 1 - i
+        A = upper.astype(np.float64)
+        A += A.T
+        return A
     A = np.zeros((N, N))
-    for i in range(N):
-        for j in range(i + 1, N):
-            if rng.random() < p:
-                A[i, j] = 1.0
-                A[j, i] = 1.0
+    i, j = _erdos_renyi_edges(N, p, rng)
+    A[i, j] = 1.0
+    A[j, i] = 1.0
     return A
 
 
@@ -149,44 +268,67 @@ def build_phase_offsets_ring(N: int, phi0: float,
     """
     phi = np.zeros((N, N))
     if mode == "chiral":
-        for i in range(N):
-            phi[i, (i + 1) % N] = +phi0
-            phi[i, (i - 1) % N] = -phi0
+        i = np.arange(N)
+        phi[i, (i + 1) % N] = +phi0
+        phi[i, (i - 1) % N] = -phi0  # for N <= 2 the backward edge wins
     elif mode == "random":
+        # Off-diagonal cells in row-major order, i.e. the same draws a
+        # per-cell rng.uniform loop would make.
         rng = np.random.default_rng(0)
-        for i in range(N):
-            for j in range(N):
-                if i != j:
-                    phi[i, j] = rng.uniform(-phi0, phi0)
+        phi[~np.eye(N, dtype=bool)] = rng.uniform(-phi0, phi0, size=N * (N - 1))
+    return phi
+
+
+def _phase_offsets(N: int, phi0: float, mode: str) -> Any:
+    """φᵢⱼ for build_graph: CSR for the ring-supported modes when SciPy is present.
+
+    'chiral' and 'zero' only touch ring edges, so for N > 2 they are built
+    straight from the edge list; 'random' fills every pair and stays dense.
+    """
+    if not _SCIPY_AVAILABLE or mode not in ("chiral", "zero") or N <= 2:
+        return build_phase_offsets_ring(N, phi0, mode=mode)
+    if mode == "zero" or phi0 == 0.0:
+        return _sparse.csr_matrix((N, N))
+    i, j = _ring_edges(N)
+    phi = _sparse.csr_matrix(
+        (np.concatenate((np.full(N, phi0), np.full(N, -phi0))),
+         (np.concatenate((i, j)), np.concatenate((j, i)))), shape=(N, N))
+    phi.sort_indices()
     return phi
 
 
-def build_graph(cfg: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
-    """Build (A, phi) matrices from a topology config dict."""
+def build_graph(cfg: Dict[str, Any]) -> Tuple[Any, Any]:
+    """Build (A, phi) matrices from a topology config dict.
+
+    Sparse topologies come back as SciPy CSR matrices (when SciPy is
+    installed) so large rings and random graphs never allocate N×N arrays;
+    fully connected graphs and dense random graphs stay dense.
+    """
     N = int(cfg.get("N", 32))
     topo = cfg.get("topology", "ring")
     topo_seed = cfg.get("topo_seed", 0)
     rng = np.random.default_rng(topo_seed)
 
-    if topo == "ring":
-        A = build_ring(N)
-    elif topo == "fully_connected":
+    if topo == "fully_connected":
         # All-to-all coupling (mean-field Kuramoto model)
         A = (np.ones((N, N)) - np.eye(N)) / (N - 1)
     elif topo == "small_world":
         k = int(cfg.get("sw_k", 4))
         beta = float(cfg.get("sw_beta", 0.1))
-        A = build_small_world(N, k=k, beta=beta, rng=rng)
+        A = _symmetric_graph(N, *_small_world_edges(N, k, beta, rng))
     elif topo == "erdos_renyi":
         p = float(cfg.get("er_p", 0.2))
-        A = build_erdos_renyi(N, p=p, rng=rng)
+        if N >= 2 and 0.0 < p <= ER_DENSE_THRESHOLD:
+            A = _symmetric_graph(N, *_erdos_renyi_edges(N, p, rng))
+        else:
+            A = build_erdos_renyi(N, p=p, rng=rng)
     else:
-        A = build_ring(N)
+        A = _symmetric_graph(N, *_ring_edges(N))
 
     # Phase offsets (P3)
     phi0 = float(cfg.get("phi0", 0.0))
     offset_mode = cfg.get("offset_mode", "chiral")
-    phi = build_phase_offsets_ring(N, phi0, mode=offset_mode)
+    phi = _phase_offsets(N, phi0, offset_mode)
 
     return A, phi
 
@@ -217,25 +359,163 @@ def sample_frequencies(N: int, dist_cfg: Dict[str, Any],
         return rng.standard_cauchy(N) * 0.5
 
 
+# ---------------------------------------------------------------------------
+# Coupling operators
+# ---------------------------------------------------------------------------
+
+# Below this fill fraction a coupling matrix is stored as CSR (when SciPy is
+# available) so each matvec costs O(nnz) instead of O(N²).
+SPARSE_DENSITY_THRESHOLD = 0.2
+
+
+def _coupling_operator(M: Any) -> Any:
+    """Return M as CSR if it is sparse enough and SciPy is present, else dense M."""
+    if _SCIPY_AVAILABLE and _sparse.issparse(M):
+        if M.nnz < SPARSE_DENSITY_THRESHOLD * M.shape[0] * M.shape[1]:
+            M = M.tocsr()
+            M.sort_indices()
+            return M
+        return M.toarray()
+    if _SCIPY_AVAILABLE and M.size and np.count_nonzero(M) < SPARSE_DENSITY_THRESHOLD * M.size:
+        return _sparse.csr_matrix(M)
+    return M
+
+
+class _MeanFieldCoupling:
+    """All-to-all operator A = (1 − I)/(N − 1) applied without an N×N matrix.
+
+    (A x)ᵢ = (Σⱼ xⱼ − xᵢ)/(N − 1), so each product is one reduction.
+    """
+
+    def __init__(self, N: int) -> None:
+        self.shape = (N, N)
+        self.scale = 1.0 / (N - 1) if N > 1 else 0.0
+
+    def __matmul__(self, x: np.ndarray) -> np.ndarray:
+        return (x.sum(axis=0) - x) * self.scale
+
+    def toarray(self) -> np.ndarray:
+        N = self.shape[0]
+        return (np.ones((N, N)) - np.eye(N)) * self.scale
+
+
+def _edge_values(M: Any, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+    """Mᵢⱼ gathered at (rows, cols) for a dense or SciPy sparse M."""
+    return np.asarray(M[rows, cols]).ravel()
+
+
+def phase_offset_operators(A: Any, phi: Any) -> Tuple[Any, Any]:
+    """Precompute (A·cos φ, A·sin φ) for P3.
+
+    When either matrix is sparse, cos/sin are only evaluated on A's edges.
+    """
+    if not (_SCIPY_AVAILABLE and (_sparse.issparse(A) or _sparse.issparse(phi))):
+        return _coupling_operator(A * np.cos(phi)), _coupling_operator(A * np.sin(phi))
+    edges = _sparse.coo_matrix(A)
+    ph = _edge_values(phi, edges.row, edges.col)
+
+    def operator(values: np.ndarray) -> Any:
+        M = _sparse.csr_matrix((values, (edges.row, edges.col)), shape=edges.shape)
+        M.eliminate_zeros()
+        return _coupling_operator(M)
+
+    return operator(edges.data * np.cos(ph)), operator(edges.data * np.sin(ph))
+
+
+def _csr_coupling_kernel(indptr, indices, weights, sin_t, cos_t, sign, out):
+    """Both coupling identities over CSR rows in one pass.
+
+    sign = −1 gives the sin form and +1 the cos form.  Row sums run in CSR
+    order, as SciPy's matvec does, so results match the operator path.
+    """
+    for i in range(out.shape[0]):
+        a_s = 0.0
+        a_c = 0.0
+        for k in range(indptr[i], indptr[i + 1]):
+            j = indices[k]
+            a_s += weights[k] * sin_t[j]
+            a_c += weights[k] * cos_t[j]
+        if sign < 0.0:
+            out[i] = cos_t[i] * a_s - sin_t[i] * a_c
+        else:
+            out[i] = cos_t[i] * a_c + sin_t[i] * a_s
+    return out
+
+
+if _NUMBA_AVAILABLE:
+    _csr_coupling_kernel = njit(_csr_coupling_kernel)
+
+
+def _compiled_csr(A: Any) -> bool:
+    """True when A is a CSR operator the compiled coupling kernel can read."""
+    return (_NUMBA_AVAILABLE and _SCIPY_AVAILABLE and _sparse.issparse(A)
+            and A.format == "csr")
+
+
+def _sin_coupling(A: Any, sin_t: np.ndarray, cos_t: np.ndarray,
+                  out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Σⱼ Aᵢⱼ sin(θⱼ − θᵢ) = cos θᵢ (A sin θ)ᵢ − sin θᵢ (A cos θ)ᵢ."""
+    if isinstance(A, _MeanFieldCoupling):
+        # The j = i terms cancel: scale·(cos θᵢ Σ sin θ − sin θᵢ Σ cos θ).
+        out = np.multiply(cos_t, sin_t.sum(), out=out)
+        out -= sin_t * cos_t.sum()
+        out *= A.scale
+        return out
+    if _compiled_csr(A):
+        return _csr_coupling_kernel(
+            A.indptr, A.indices, A.data, sin_t, cos_t, -1.0,
+            np.empty_like(sin_t) if out is None else out)
+    out = np.multiply(cos_t, A @ sin_t, out=out)
+    out -= sin_t * (A @ cos_t)
+    return out
+
+
+def _cos_coupling(A: Any, sin_t: np.ndarray, cos_t: np.ndarray,
+                  out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Σⱼ Aᵢⱼ cos(θⱼ − θᵢ) = cos θᵢ (A cos θ)ᵢ + sin θᵢ (A sin θ)ᵢ."""
+    if isinstance(A, _MeanFieldCoupling):
+        # The j = i terms contribute cos²θᵢ + sin²θᵢ = 1 before scaling.
+        out = np.multiply(cos_t, cos_t.sum(), out=out)
+        out += sin_t * sin_t.sum()
+        out -= 1.0
+        out *= A.scale
+        return out
+    if _compiled_csr(A):
+        return _csr_coupling_kernel(
+            A.indptr, A.indices, A.data, sin_t, cos_t, 1.0,
+            np.empty_like(sin_t) if out is None else out)
+    out = np.multiply(cos_t, A @ cos_t, out=out)
+    out += sin_t * (A @ sin_t)
+    return out
+
+
 # ---------------------------------------------------------------------------
 # Physics plugins — ẋ = F(t, x; G, θ)
+#
+# Coupling sums use the identities above, so each step costs O(N) sin/cos
+# evaluations plus two matvecs per operator instead of an N×N sin matrix.
+# A may be a dense array, a SciPy sparse matrix or the mean-field operator
+# used for fully connected graphs.  Each plugin accepts an
+# optional ``out`` buffer so the integration loop can reuse its derivative
+# arrays instead of allocating new ones every step.  Passing ``rng=None``
+# evaluates the deterministic right-hand side (no σ ξ term), as RK4 does.
 # ---------------------------------------------------------------------------
 
 def physics_p1(theta: np.ndarray, omega: np.ndarray,
                A: np.ndarray, phi: np.ndarray,
                params: Dict[str, Any],
-               rng: np.random.Generator) -> np.ndarray:
+               rng: Optional[np.random.Generator],
+               out: Optional[np.ndarray] = None) -> np.ndarray:
     """P1: Kuramoto baseline.
 
     θ̇ᵢ = ωᵢ + κ Σⱼ Aᵢⱼ sin(θⱼ − θᵢ) + σ ξᵢ(t)
     """
     kappa = float(params.get("kappa", 1.0))
     sigma = float(params.get("sigma", 0.0))
-    # Phase difference matrix: diff[i,j] = θⱼ − θᵢ
-    diff = theta[np.newaxis, :] - theta[:, np.newaxis]
-    coupling = np.sum(A * np.sin(diff), axis=1)
-    dtheta = omega + kappa * coupling
-    if sigma > 0.0:
+    dtheta = _sin_coupling(A, np.sin(theta), np.cos(theta), out=out)
+    dtheta *= kappa
+    dtheta += omega
+    if sigma > 0.0 and rng is not None:
         dtheta += sigma * rng.standard_normal(len(theta))
     return dtheta
 
@@ -243,7 +523,9 @@ def physics_p1(theta: np.ndarray, omega: np.ndarray,
 def physics_p2(theta: np.ndarray, omega: np.ndarray, memory: np.ndarray,
                A: np.ndarray, phi: np.ndarray,
                params: Dict[str, Any],
-               rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+               rng: Optional[np.random.Generator],
+               out: Optional[Tuple[np.ndarray, np.ndarray]] = None
+               ) -> Tuple[np.ndarray, np.ndarray]:
     """P2: Exponential memory kernel.
 
     θ̇ᵢ = ωᵢ + κ Σⱼ Aᵢⱼ sin(θⱼ − θᵢ) + η mᵢ + σ ξᵢ(t)
@@ -254,14 +536,18 @@ def physics_p2(theta: np.ndarray, omega: np.ndarray, memory: np.ndarray,
     tau_m = float(params.get("tau_m", 5.0))
     sigma = float(params.get("sigma", 0.0))
 
-    diff = theta[np.newaxis, :] - theta[:, np.newaxis]
-    sin_diff_sum = np.sum(A * np.sin(diff), axis=1)
+    dtheta, dmemory = out if out is not None else (None, None)
+    # The coupling sum is built in the memory derivative's buffer and reused.
+    sin_diff_sum = _sin_coupling(A, np.sin(theta), np.cos(theta), out=dmemory)
 
-    dtheta = omega + kappa * sin_diff_sum + eta * memory
-    if sigma > 0.0:
+    dtheta = np.multiply(sin_diff_sum, kappa, out=dtheta)
+    dtheta += omega
+    dtheta += eta * memory
+    if sigma > 0.0 and rng is not None:
         dtheta += sigma * rng.standard_normal(len(theta))
 
-    dmemory = -memory / tau_m + sin_diff_sum
+    dmemory = sin_diff_sum
+    dmemory -= memory / tau_m
 
     return dtheta, dmemory
 
@@ -269,18 +555,28 @@ def physics_p2(theta: np.ndarray, omega: np.ndarray, memory: np.ndarray,
 def physics_p3(theta: np.ndarray, omega: np.ndarray,
                A: np.ndarray, phi: np.ndarray,
                params: Dict[str, Any],
-               rng: np.random.Generator) -> np.ndarray:
+               rng: Optional[np.random.Generator],
+               offsets: Optional[Tuple[Any, Any]] = None,
+               out: Optional[np.ndarray] = None) -> np.ndarray:
     """P3: Phase-offset (chiral) coupling.
 
     θ̇ᵢ = ωᵢ + κ Σⱼ Aᵢⱼ sin(θⱼ − θᵢ + φᵢⱼ) + σ ξᵢ(t)
+
+    Expanding sin(Δ + φ) = sin Δ cos φ + cos Δ sin φ splits the sum over the
+    operators A·cos φ and A·sin φ. Pass ``offsets`` from
+    :func:`phase_offset_operators` to reuse them across steps; otherwise they
+    are built from dense A and φ on each call.
     """
     kappa = float(params.get("kappa", 1.0))
     sigma = float(params.get("sigma", 0.0))
 
-    diff = theta[np.newaxis, :] - theta[:, np.newaxis]  # diff[i,j] = θⱼ − θᵢ
-    coupling = np.sum(A * np.sin(diff + phi), axis=1)
-    dtheta = omega + kappa * coupling
-    if sigma > 0.0:
+    A_cos, A_sin = offsets if offsets is not None else phase_offset_operators(A, phi)
+    sin_t, cos_t = np.sin(theta), np.cos(theta)
+    dtheta = _sin_coupling(A_cos, sin_t, cos_t, out=out)
+    dtheta += _cos_coupling(A_sin, sin_t, cos_t)
+    dtheta *= kappa
+    dtheta += omega
+    if sigma > 0.0 and rng is not None:
         dtheta += sigma * rng.standard_normal(len(theta))
     return dtheta
 
@@ -289,16 +585,32 @@ def physics_p3(theta: np.ndarray, omega: np.ndarray,
 # Observer modules — y(t) = O(t, x(t); G, θ)
 # ---------------------------------------------------------------------------
 
+# Column order of the per-step metrics array built by run_simulation.
+METRIC_FIELDS = ("t", "R", "psi", "sigma_theta", "delta_phi")
+
+
+def _order_parameter(theta: np.ndarray) -> Tuple[float, float, float]:
+    """Return (R, ψ, σ_θ) for O1 without building a result dict."""
+    # Two real reductions instead of a complex e^{iθ} temporary; sum()/N is
+    # bit-identical to mean() but skips its Python-level dispatch.
+    n = theta.shape[0]
+    if n == 0:
+        return math.nan, math.nan, math.nan
+    c = float(np.cos(theta).sum()) / n
+    s = float(np.sin(theta).sum()) / n
+    R = math.hypot(c, s)
+    psi = math.atan2(s, c)
+    # Circular standard deviation
+    sigma_theta = math.sqrt(max(-2.0 * math.log(max(R, 1e-12)), 0.0))
+    return R, psi, sigma_theta
+
+
 def observer_o1(theta: np.ndarray) -> Dict[str, float]:
     """O1: Synchronisation order parameter.
 
     R(t) e^{iψ(t)} = (1/N) Σⱼ e^{iθⱼ}
     """
-    z = np.mean(np.exp(1j * theta))
-    R = float(abs(z))
-    psi = float(np.angle(z))
-    # Circular standard deviation
-    sigma_theta = float(np.sqrt(max(-2.0 * math.log(max(R, 1e-12)), 0.0)))
+    R, psi, sigma_theta = _order_parameter(theta)
     return {"R": R, "psi": psi, "sigma_theta": sigma_theta}
 
 
@@ -308,6 +620,9 @@ def observer_o2(history_R: List[float], window: int = 10) -> float:
     Computes the rate of change of the order-parameter R over a baseline window.
     ΔΦ(t) = |R(t) − ⟨R⟩_baseline| where baseline is the mean over the
     previous `window` samples, normalised by the baseline mean.
+
+    This evaluates a single step and is kept for offline post-processing;
+    run_simulation computes ΔΦ for the whole run with observer_o2_series.
     """
     n = len(history_R)
     if n < window + 1:
@@ -319,16 +634,115 @@ def observer_o2(history_R: List[float], window: int = 10) -> float:
     return float(delta)
 
 
+def observer_o2_series(R: np.ndarray, window: int = 10) -> np.ndarray:
+    """O2 for every step at once: element n equals observer_o2(R[:n + 1]).
+
+    Baselines are exact window means rather than a running sum, which would
+    drift by ~n·ε over long runs and change the hashed metrics.csv bytes.
+    """
+    R = np.asarray(R, dtype=float)
+    out = np.zeros(len(R))
+    if len(R) < window + 1:
+        return out
+    baseline = np.lib.stride_tricks.sliding_window_view(R[:-1], window).mean(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        delta = np.abs(R[window:] - baseline) / baseline
+    out[window:] = np.where(baseline < 1e-9, 0.0, delta)
+    return out
+
+
+def _time_column(n_steps: int, dt: float) -> List[float]:
+    """Sample times t = (step + 1)·dt, rounded as in the metric rows."""
+    return [round(step * dt + dt, 8) for step in range(n_steps)]
+
+
+def metrics_to_rows(metrics: np.ndarray) -> List[Dict[str, float]]:
+    """Expand a METRIC_FIELDS-ordered metrics array into JSON-ready rows."""
+    return [dict(zip(METRIC_FIELDS, row)) for row in metrics.tolist()]
+
+
+class _MetricsView(Sequence):
+    """Read-only row view over a METRIC_FIELDS-ordered metrics array.
+
+    run_simulation() keeps its metrics columnar; a row dict is only built
+    when a step is indexed or iterated, and slices stay views over the
+    array.  ``rows()`` expands everything for JSON responses.
+    """
+
+    __slots__ = ("array",)
+
+    def __init__(self, array: np.ndarray):
+        self.array = array
+
+    def __len__(self) -> int:
+        return self.array.shape[0]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return _MetricsView(self.array[index])
+        return dict(zip(METRIC_FIELDS, self.array[index].tolist()))
+
+    def __iter__(self) -> Iterator[Dict[str, float]]:
+        return iter(self.rows())
+
+    def __add__(self, other: "_MetricsView") -> "_MetricsView":
+        if not isinstance(other, _MetricsView):
+            return NotImplemented
+        return _MetricsView(np.concatenate((self.array, other.array)))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, _MetricsView):
+            return np.array_equal(self.array, other.array)
+        if isinstance(other, list):
+            return self.rows() == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        return np.asarray(self.array, dtype=dtype)
+
+    def __repr__(self) -> str:
+        return f"_MetricsView({len(self)} steps)"
+
+    def rows(self) -> List[Dict[str, float]]:
+        """Return every step as a JSON-ready dict."""
+        return metrics_to_rows(self.array)
+
+
 # ---------------------------------------------------------------------------
 # Integrator — Euler (deterministic, fast) and RK4 (accuracy)
 # ---------------------------------------------------------------------------
 
 def _rk4_step_p1(theta, omega, A, phi, params, dt):
     """RK4 integration step for P1 (noiseless)."""
-    _rng_dummy = np.random.default_rng(0)  # no noise in RK4 steps
+    def f(th):
+        return physics_p1(th, omega, A, phi, params, None)
 
+    k1 = f(theta)
+    k2 = f(theta + 0.5 * dt * k1)
+    k3 = f(theta + 0.5 * dt * k2)
+    k4 = f(theta + dt * k3)
+    return theta + (dt / 6.0) * (k1 + 2 * k2 + 2 * k3 + k4)
+
+
+def _rk4_step_p2(theta, memory, omega, A, phi, params, dt):
+    """RK4 integration step for P2 (noiseless) over the joint (θ, m) state."""
+    def f(th, m):
+        return physics_p2(th, omega, m, A, phi, params, None)
+
+    k1t, k1m = f(theta, memory)
+    k2t, k2m = f(theta + 0.5 * dt * k1t, memory + 0.5 * dt * k1m)
+    k3t, k3m = f(theta + 0.5 * dt * k2t, memory + 0.5 * dt * k2m)
+    k4t, k4m = f(theta + dt * k3t, memory + dt * k3m)
+    return (theta + (dt / 6.0) * (k1t + 2 * k2t + 2 * k3t + k4t),
+            memory + (dt / 6.0) * (k1m + 2 * k2m + 2 * k3m + k4m))
+
+
+def _rk4_step_p3(theta, omega, A, phi, params, dt, offsets=None):
+    """RK4 integration step for P3 (noiseless)."""
     def f(th):
-        return physics_p1(th, omega, A, phi, {**params, "sigma": 0.0}, _rng_dummy)
+        return physics_p3(th, omega, A, phi, params, None, offsets=offsets)
 
     k1 = f(theta)
     k2 = f(theta + 0.5 * dt * k1)
@@ -337,10 +751,464 @@ def _rk4_step_p1(theta, omega, A, phi, params, dt):
     return theta + (dt / 6.0) * (k1 + 2 * k2 + 2 * k3 + k4)
 
 
+_TWO_PI = 2.0 * math.pi
+
+
+def _wrap_phases(theta: np.ndarray) -> np.ndarray:
+    """Wrap θ into [−π, π) in place.
+
+    A step rarely moves a phase by more than π, so when every value lies in
+    [−2π, 2π) a conditional ±2π shift replaces the much slower modulo; the
+    modulo is kept for larger excursions such as big phase kicks.
+    """
+    lo, hi = float(theta.min()), float(theta.max())
+    if -math.pi <= lo and hi < math.pi:
+        return theta
+    if -_TWO_PI <= lo and hi < _TWO_PI:
+        np.subtract(theta, _TWO_PI, out=theta, where=theta >= math.pi)
+        np.add(theta, _TWO_PI, out=theta, where=theta < -math.pi)
+    else:
+        theta += math.pi
+        np.mod(theta, _TWO_PI, out=theta)
+        theta -= math.pi
+    return theta
+
+
+# Upper bound on pre-drawn noise values held at once (8 MB of float64).
+NOISE_BLOCK_VALUES = 1 << 20
+
+
+def _noise_blocks(rng: np.random.Generator, n_steps: int, N: int,
+                  scale: float = 1.0,
+                  max_values: int = NOISE_BLOCK_VALUES) -> Iterator[np.ndarray]:
+    """Yield ``scale·ξ`` for n_steps steps as (rows, N) blocks, drawn in bulk.
+
+    Each block is filled with one ``standard_normal(out=)`` call into a
+    reused buffer, which gives exactly the same draws as n_steps separate
+    ``standard_normal(N)`` calls.  Each yielded block is a view that is only
+    valid until the next one is requested.
+    """
+    rows_per_block = max(1, min(n_steps, max_values // max(N, 1)))
+    buf = np.empty((rows_per_block, N))
+    for start in range(0, n_steps, rows_per_block):
+        block = buf[:min(rows_per_block, n_steps - start)]
+        rng.standard_normal(out=block)
+        if scale != 1.0:
+            block *= scale
+        yield block
+
+
+def _noise_rows(rng: np.random.Generator, n_steps: int, N: int,
+                scale: float = 1.0,
+                max_values: int = NOISE_BLOCK_VALUES) -> Iterator[np.ndarray]:
+    """Row-at-a-time form of _noise_blocks; each row is valid until the next."""
+    for block in _noise_blocks(rng, n_steps, N, scale, max_values):
+        yield from block
+
+
+StepFn = Callable[[np.ndarray, np.ndarray, np.ndarray],
+                  Tuple[np.ndarray, np.ndarray]]
+
+
+def _make_step_fn(plugin: str, integrator: str, params: Dict[str, Any],
+                  A: Any, phi: np.ndarray, offsets: Optional[Tuple[Any, Any]],
+                  rng: np.random.Generator, dt: float, N: int,
+                  n_steps: int) -> StepFn:
+    """Select the physics + integrator update for a run once, up front.
+
+    The returned ``step(theta, memory, omega) -> (theta, memory)`` advances
+    one dt without wrapping phases and must be called at most n_steps
+    times.  Euler steps reuse derivative buffers, take their σ ξ term from
+    bulk-drawn noise rows and update the state in place; RK4 (noiseless
+    runs only) returns new arrays.  Unknown plugin names fall back to P1.
+    """
+    # RK4 is used for noiseless runs; noisy runs stay on Euler–Maruyama.
+    rk4 = integrator == "rk4" and params["sigma"] == 0.0
+    # Updated with np.multiply/np.add(out=) below: augmented assignment would
+    # make them closure-local.
+    dtheta = np.empty(N)
+    dmemory = np.empty(N)
+    noise = (_noise_rows(rng, n_steps, N, params["sigma"])
+             if params["sigma"] > 0.0 and not rk4 else None)
+
+    if plugin == "P2":
+        if rk4:
+            def step(theta, memory, omega):
+                return _rk4_step_p2(theta, memory, omega, A, phi, params, dt)
+        else:
+            def step(theta, memory, omega):
+                physics_p2(theta, omega, memory, A, phi, params, None,
+                           out=(dtheta, dmemory))
+                if noise is not None:
+                    np.add(dtheta, next(noise), out=dtheta)
+                np.multiply(dtheta, dt, out=dtheta)
+                theta += dtheta
+                np.multiply(dmemory, dt, out=dmemory)
+                memory += dmemory
+                return theta, memory
+    elif plugin == "P3":
+        if rk4:
+            def step(theta, memory, omega):
+                return _rk4_step_p3(theta, omega, A, phi, params, dt,
+                                    offsets=offsets), memory
+        else:
+            def step(theta, memory, omega):
+                physics_p3(theta, omega, A, phi, params, None,
+                           offsets=offsets, out=dtheta)
+                if noise is not None:
+                    np.add(dtheta, next(noise), out=dtheta)
+                np.multiply(dtheta, dt, out=dtheta)
+                theta += dtheta
+                return theta, memory
+    elif rk4:
+        def step(theta, memory, omega):
+            return _rk4_step_p1(theta, omega, A, phi, params, dt), memory
+    else:
+        def step(theta, memory, omega):
+            physics_p1(theta, omega, A, phi, params, None, out=dtheta)
+            if noise is not None:
+                np.add(dtheta, next(noise), out=dtheta)
+            np.multiply(dtheta, dt, out=dtheta)
+            theta += dtheta
+            return theta, memory
+    return step
+
+
+# ---------------------------------------------------------------------------
+# Compiled step loops (Numba)
+#
+# With Numba installed, event-free runs execute the whole step loop —
+# physics, Euler or RK4 update, phase wrap and the O1 order parameter — in
+# one compiled kernel over the CSR form of A. fastmath is left off so
+# results stay reproducible and match the NumPy path to rounding.
+# ---------------------------------------------------------------------------
+
+_MODE_P1, _MODE_P2, _MODE_P3 = 1, 2, 3
+
+
+def _coupling_sums(sin_t, cos_t, indptr, indices, w_cos, w_sin, mean_field,
+                   acc):
+    """acc[i] = Σⱼ Aᵢⱼ sin(θⱼ − θᵢ + φᵢⱼ) from per-node sin θ and cos θ.
+
+    ``w_cos``/``w_sin`` hold Aᵢⱼ cos φᵢⱼ and Aᵢⱼ sin φᵢⱼ per CSR edge, so the
+    angle-sum identity leaves no trig call inside the edge loop.  An empty
+    ``w_sin`` means φ = 0.
+    """
+    N = sin_t.shape[0]
+    if mean_field > 0.0:
+        sum_c = 0.0
+        sum_s = 0.0
+        for i in range(N):
+            sum_c += cos_t[i]
+            sum_s += sin_t[i]
+        for i in range(N):
+            acc[i] = mean_field * (cos_t[i] * sum_s - sin_t[i] * sum_c)
+        return
+    has_offsets = w_sin.shape[0] > 0
+    for i in range(N):
+        a_s = 0.0
+        a_c = 0.0
+        b_s = 0.0
+        b_c = 0.0
+        for k in range(indptr[i], indptr[i + 1]):
+            j = indices[k]
+            a_s += w_cos[k] * sin_t[j]
+            a_c += w_cos[k] * cos_t[j]
+            if has_offsets:
+                b_s += w_sin[k] * sin_t[j]
+                b_c += w_sin[k] * cos_t[j]
+        a = cos_t[i] * a_s - sin_t[i] * a_c
+        if has_offsets:
+            a += cos_t[i] * b_c + sin_t[i] * b_s
+        acc[i] = a
+
+
+def _wrap_phase(th):
+    """Scalar form of the _wrap_phases rule."""
+    if th >= math.pi or th < -math.pi:
+        if -2.0 * math.pi <= th < 2.0 * math.pi:
+            th += -2.0 * math.pi if th >= math.pi else 2.0 * math.pi
+        else:
+            th = (th + math.pi) % (2.0 * math.pi) - math.pi
+    return th
+
+
+def _sin_cos(theta):
+    """sin θ / cos θ of the initial state, for _euler_kernel to carry."""
+    return np.sin(theta), np.cos(theta)
+
+
+def _euler_kernel(theta, omega, memory, sin_t, cos_t, indptr, indices, w_cos,
+                  w_sin, mode, kappa, sigma, eta, tau_m, dt, noise,
+                  mean_field, R, psi):
+    """Advance len(R) Euler steps, writing each step's (R, ψ).
+
+    theta, memory and their sin θ / cos θ are updated in place, so
+    successive calls over consecutive noise blocks continue one run.
+    sin_t / cos_t are computed once per step for O1 and reused by the next
+    step's coupling sums.
+    """
+    N = theta.shape[0]
+    acc = np.empty(N)
+    for s in range(R.shape[0]):
+        _coupling_sums(sin_t, cos_t, indptr, indices, w_cos, w_sin,
+                       mean_field, acc)
+        sum_c = 0.0
+        sum_s = 0.0
+        for i in range(N):
+            d = omega[i] + kappa * acc[i]
+            if mode == _MODE_P2:
+                d += eta * memory[i]
+                memory[i] += dt * (-memory[i] / tau_m + acc[i])
+            if sigma > 0.0:
+                d += sigma * noise[s, i]
+            th = _wrap_phase(theta[i] + dt * d)
+            theta[i] = th
+            sin_t[i] = math.sin(th)
+            cos_t[i] = math.cos(th)
+            sum_c += cos_t[i]
+            sum_s += sin_t[i]
+        R[s] = math.hypot(sum_c, sum_s) / N
+        psi[s] = math.atan2(sum_s, sum_c)
+
+
+def _rk4_kernel(theta, omega, memory, indptr, indices, w_cos, w_sin,
+                mode, kappa, eta, tau_m, dt, n_steps, mean_field):
+    """Noiseless RK4 counterpart of _euler_kernel over the joint (θ, m) state."""
+    N = theta.shape[0]
+    R = np.empty(n_steps)
+    psi = np.empty(n_steps)
+    k_theta = np.empty((4, N))
+    k_memory = np.zeros((4, N))
+    m = np.empty(N)
+    acc = np.empty(N)
+    sin_t = np.empty(N)
+    cos_t = np.empty(N)
+    for s in range(n_steps):
+        for stage in range(4):
+            h = 0.0 if stage == 0 else (dt if stage == 3 else 0.5 * dt)
+            for i in range(N):
+                th = theta[i] if stage == 0 else theta[i] + h * k_theta[stage - 1, i]
+                sin_t[i] = math.sin(th)
+                cos_t[i] = math.cos(th)
+                m[i] = memory[i] if stage == 0 else memory[i] + h * k_memory[stage - 1, i]
+            _coupling_sums(sin_t, cos_t, indptr, indices, w_cos, w_sin,
+                           mean_field, acc)
+            for i in range(N):
+                d = omega[i] + kappa * acc[i]
+                if mode == _MODE_P2:
+                    d += eta * m[i]
+                    k_memory[stage, i] = acc[i] - m[i] / tau_m
+                k_theta[stage, i] = d
+        sum_c = 0.0
+        sum_s = 0.0
+        for i in range(N):
+            th = _wrap_phase(theta[i] + (dt / 6.0) * (
+                k_theta[0, i] + 2 * k_theta[1, i] + 2 * k_theta[2, i] + k_theta[3, i]))
+            if mode == _MODE_P2:
+                memory[i] += (dt / 6.0) * (
+                    k_memory[0, i] + 2 * k_memory[1, i] + 2 * k_memory[2, i]
+                    + k_memory[3, i])
+            theta[i] = th
+            sum_c += math.cos(th)
+            sum_s += math.sin(th)
+        R[s] = math.hypot(sum_c, sum_s) / N
+        psi[s] = math.atan2(sum_s, sum_c)
+    return R, psi
+
+
+# No on-disk cache: plugins are loaded from file paths under names that
+# Numba cannot re-import when unpickling a cached kernel.  The loop kernels
+# release the GIL, so sweep threads can run them concurrently.
+if _NUMBA_AVAILABLE:
+    _coupling_sums = njit(nogil=True)(_coupling_sums)
+    _wrap_phase = njit(nogil=True)(_wrap_phase)
+    _sin_cos = njit(nogil=True)(_sin_cos)
+    _euler_kernel = njit(nogil=True)(_euler_kernel)
+    _rk4_kernel = njit(nogil=True)(_rk4_kernel)
+
+
+def _use_compiled_loop(pending_events: List[Dict]) -> bool:
+    """Whether a run takes the compiled loop: numba must be installed.
+
+    The kernels cover every plugin and integrator; only runs with scheduled
+    perturbations need the NumPy loop, which applies events between steps.
+    """
+    return _NUMBA_AVAILABLE and not pending_events
+
+
+def _compiled_order_parameter(plugin, integrator, theta, omega, memory, A, phi,
+                              params, dt, n_steps, rng):
+    """Run the compiled loop and return the per-step (R, ψ) arrays."""
+    mode = {"P2": _MODE_P2, "P3": _MODE_P3}.get(plugin, _MODE_P1)
+    # P3 offsets are per edge, so only P1/P2 can use the mean-field branch.
+    mean_field = (A.scale if isinstance(A, _MeanFieldCoupling) and mode != _MODE_P3
+                  else 0.0)
+    if mean_field:
+        rows_idx = cols_idx = np.zeros(0, dtype=np.int64)
+        weights = np.zeros(0)
+    elif _SCIPY_AVAILABLE and _sparse.issparse(A):
+        A = A.tocsr()
+        A.sort_indices()
+        rows_idx = np.repeat(np.arange(A.shape[0]), np.diff(A.indptr))
+        cols_idx = A.indices
+        weights = A.data
+    else:
+        dense = A.toarray() if hasattr(A, "toarray") else A
+        rows_idx, cols_idx = np.nonzero(dense)
+        weights = dense[rows_idx, cols_idx]
+    indptr = np.zeros(len(theta) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows_idx, minlength=len(theta)), out=indptr[1:])
+    # cos φ / sin φ are folded into the edge weights once per run.
+    if mode == _MODE_P3:
+        offsets = _edge_values(phi, rows_idx, cols_idx)
+        w_cos = weights * np.cos(offsets)
+        w_sin = weights * np.sin(offsets)
+    else:
+        w_cos = np.asarray(weights, dtype=np.float64)
+        w_sin = np.zeros(0)
+    sigma = params["sigma"]
+    if integrator == "rk4" and sigma == 0.0:
+        return _rk4_kernel(
+            theta.copy(), omega.copy(), memory.copy(), indptr,
+            cols_idx.astype(np.int64), w_cos, w_sin,
+            mode, params["kappa"], params["eta"], params["tau_m"],
+            dt, n_steps, mean_field)
+    theta = theta.copy()
+    memory = memory.copy()
+    sin_t, cos_t = _sin_cos(theta)
+    indices = cols_idx.astype(np.int64)
+    R = np.empty(n_steps)
+    psi = np.empty(n_steps)
+
+    def run(noise, start, stop):
+        _euler_kernel(theta, omega, memory, sin_t, cos_t, indptr, indices,
+                      w_cos, w_sin, mode, params["kappa"], sigma,
+                      params["eta"], params["tau_m"], dt, noise, mean_field,
+                      R[start:stop], psi[start:stop])
+
+    if sigma > 0.0:
+        # Noise is drawn NOISE_BLOCK_VALUES at a time (same draws as
+        # per-step standard_normal(N) calls) and the kernel resumes the
+        # run block by block.
+        start = 0
+        for block in _noise_blocks(rng, n_steps, len(theta),
+                                   max_values=NOISE_BLOCK_VALUES):
+            run(block, start, start + len(block))
+            start += len(block)
+    else:
+        run(np.zeros((0, 0)), 0, n_steps)
+    return R, psi
+
+
 # ---------------------------------------------------------------------------
 # Core simulation runner
 # ---------------------------------------------------------------------------
 
+def _event_schedule(pending_events: List[Dict], n_steps: int,
+                    dt: float) -> List[int]:
+    """Number of time-sorted events due by each step.
+
+    An event fires at the first step with time ≤ t + dt/2; later events wait
+    for every earlier one, hence the running maximum over event times.
+    """
+    if not pending_events:
+        return [0] * n_steps
+    times = np.maximum.accumulate(
+        np.array([float(ev.get("time", 0.0)) for ev in pending_events]))
+    thresholds = np.arange(n_steps) * dt + dt * 0.5
+    return np.searchsorted(times, thresholds, side="right").tolist()
+
+
+def _build_graph_layer(cfg: Dict[str, Any]) -> Tuple[Any, np.ndarray, Optional[Tuple[Any, Any]]]:
+    N = int(cfg.get("N", 32))
+    A, phi_offsets = build_graph(cfg)
+    # Operators are built once per run; physics steps only do matvecs.
+    offsets = (phase_offset_operators(A, phi_offsets)
+               if cfg.get("plugin", "P1") == "P3" else None)
+    if cfg.get("topology", "ring") == "fully_connected":
+        A = _MeanFieldCoupling(N)
+    else:
+        A = _coupling_operator(A)
+    return A, phi_offsets, offsets
+
+
+# Graph layers are cached across runs up to this N; larger dense operators
+# would pin too much memory for a cache hit to be worth it.
+GRAPH_CACHE_MAX_N = 1024
+
+
+def _graph_key(cfg: Dict[str, Any]) -> Optional[Tuple[Any, ...]]:
+    """Every config field _build_graph_layer reads, or None if uncacheable."""
+    N = int(cfg.get("N", 32))
+    topo_seed = cfg.get("topo_seed", 0)
+    # An unseeded topology is meant to differ between runs.
+    if N > GRAPH_CACHE_MAX_N or topo_seed is None:
+        return None
+    key = (N, cfg.get("topology", "ring"), topo_seed,
+           int(cfg.get("sw_k", 4)), float(cfg.get("sw_beta", 0.1)),
+           float(cfg.get("er_p", 0.2)), float(cfg.get("phi0", 0.0)),
+           cfg.get("offset_mode", "chiral"), cfg.get("plugin", "P1") == "P3")
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _freeze(op: Any) -> None:
+    """Mark a cached operator's arrays read-only so no run can alter them."""
+    if isinstance(op, np.ndarray):
+        op.setflags(write=False)
+    elif _SCIPY_AVAILABLE and _sparse.issparse(op) and op.format == "csr":
+        for arr in (op.data, op.indices, op.indptr):
+            arr.setflags(write=False)
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_graph_layer(key: Tuple[Any, ...]) -> Tuple[Any, np.ndarray, Optional[Tuple[Any, Any]]]:
+    N, topology, topo_seed, sw_k, sw_beta, er_p, phi0, offset_mode, p3 = key
+    graph = _build_graph_layer({
+        "N": N, "topology": topology, "topo_seed": topo_seed,
+        "sw_k": sw_k, "sw_beta": sw_beta, "er_p": er_p, "phi0": phi0,
+        "offset_mode": offset_mode, "plugin": "P3" if p3 else "P1",
+    })
+    A, phi_offsets, offsets = graph
+    for op in (A, phi_offsets, *(offsets or ())):
+        _freeze(op)
+    return graph
+
+
+def _prepare_graph(cfg: Dict[str, Any]) -> Tuple[Any, np.ndarray, Optional[Tuple[Any, Any]]]:
+    """Build (coupling operator, φ, P3 offset operators) for a config.
+
+    Depends only on the topology, N, plugin and phase-offset settings, so a
+    sweep over κ and seeds builds it once, and repeated runs on the same
+    graph (up to GRAPH_CACHE_MAX_N nodes) share a cached, read-only copy.
+    """
+    key = _graph_key(cfg)
+    if key is None:
+        return _build_graph_layer(cfg)
+    return _cached_graph_layer(key)
+
+
+RNG_BIT_GENERATORS = {"pcg64": np.random.PCG64, "sfc64": np.random.SFC64}
+
+
+def _run_rng(cfg: Dict[str, Any], seed: int) -> np.random.Generator:
+    """Generator for a run's frequencies, initial phases and noise.
+
+    'pcg64' (default) is np.random.default_rng(seed).  'sfc64' draws normals
+    about a quarter faster but gives a different realisation for the same
+    seed, so it is opt-in via cfg['bit_generator'].
+    """
+    name = cfg.get("bit_generator", "pcg64")
+    if name not in RNG_BIT_GENERATORS:
+        raise ValueError(f"Unknown bit_generator {name!r}; "
+                         f"expected one of {sorted(RNG_BIT_GENERATORS)}")
+    return np.random.Generator(RNG_BIT_GENERATORS[name](seed))
+
+
 def run_simulation(cfg: Dict[str, Any],
                    inject_events: Optional[List[Dict]] = None
                    ) -> Dict[str, Any]:
@@ -360,6 +1228,21 @@ def run_simulation(cfg: Dict[str, Any],
     -------
     dict with keys:
         'config', 'metrics', 'events', 'summary'
+        'metrics' is a sequence of per-step dicts (t, R, psi, sigma_theta,
+        delta_phi) backed by a single array.
+    """
+    result = _simulate(cfg, inject_events)
+    result["metrics"] = _MetricsView(result["metrics"])
+    return result
+
+
+def _simulate(cfg: Dict[str, Any],
+              inject_events: Optional[List[Dict]] = None,
+              graph: Optional[Tuple[Any, np.ndarray, Any]] = None
+              ) -> Dict[str, Any]:
+    """run_simulation() core; 'metrics' is the (n_steps, 5) METRIC_FIELDS array.
+
+    ``graph`` is a precomputed _prepare_graph(cfg) result to reuse.
     """
     # inject_events from parameter takes priority; fall back to cfg key
     if inject_events is None:
@@ -382,22 +1265,21 @@ def run_simulation(cfg: Dict[str, Any],
     }
 
     # ── Initialise RNG and state ────────────────────────────────────────────
-    rng = np.random.default_rng(seed)
+    rng = _run_rng(cfg, seed)
     omega = sample_frequencies(N, freq_dist, rng)
     theta = rng.uniform(-math.pi, math.pi, N)  # random initial phases
     memory = np.zeros(N)  # P2 memory variable
 
     # ── Graph layer ─────────────────────────────────────────────────────────
-    A, phi_offsets = build_graph(cfg)
+    A, phi_offsets, offsets = graph if graph is not None else _prepare_graph(cfg)
 
     # ── Omega-kick state (for omega_kick perturbations) ─────────────────────
     omega_kick_ends: Dict[int, float] = {}  # node → end_time
+    kick_expiry: List[Tuple[float, int]] = []  # heap of (end_time, node)
     omega_original = omega.copy()
 
     # ── Logging setup ────────────────────────────────────────────────────────
-    metrics_rows: List[Dict[str, float]] = []
     events_log: List[Dict[str, Any]] = []
-    history_R: List[float] = []
 
     # ── Pre-scheduled events queue ────────────────────────────────────────────
     pending_events = sorted((inject_events or []), key=lambda e: e.get("time", 0))
@@ -406,103 +1288,107 @@ def run_simulation(cfg: Dict[str, Any],
     # ── Integration loop ──────────────────────────────────────────────────────
     t = 0.0
     n_steps = int(round(t_end / dt))
+    # One row per step in METRIC_FIELDS order; disabled observers stay 0.
+    metrics = np.zeros((n_steps, len(METRIC_FIELDS)))
+    metrics[:, 0] = _time_column(n_steps, dt)
+    o1_enabled = "O1" in observers_enabled
+
+    compiled = _use_compiled_loop(pending_events)
+    if compiled:
+        R, psi = _compiled_order_parameter(
+            plugin, integrator, theta, omega, memory, A, phi_offsets, params,
+            dt, n_steps, rng)
+        if o1_enabled:
+            metrics[:, 1] = R
+            metrics[:, 2] = psi
+            metrics[:, 3] = np.sqrt(
+                np.maximum(-2.0 * np.log(np.maximum(R, 1e-12)), 0.0))
+    else:
+        step_fn = _make_step_fn(plugin, integrator, params, A, phi_offsets,
+                                offsets, rng, dt, N, n_steps)
+        events_due = _event_schedule(pending_events, n_steps, dt)
+        for step in range(n_steps):
+            t = step * dt
+
+            # ── Apply scheduled perturbations at this timestep ────────────────
+            while event_idx < events_due[step]:
+                ev = pending_events[event_idx]
+                ev_type = ev.get("type", "phase_kick")
+                amp = float(ev.get("amplitude", 0.1))
+                node_spec = ev.get("node", "all")
+
+                nodes_to_kick = list(range(N)) if node_spec == "all" else [int(node_spec)]
+
+                if ev_type == "phase_kick":
+                    for ni in nodes_to_kick:
+                        theta[ni] += amp
+                    events_log.append({
+                        "t": t, "type": "phase_kick",
+                        "nodes": nodes_to_kick, "amplitude": amp
+                    })
+                elif ev_type == "omega_kick":
+                    dur = float(ev.get("duration", 1.0))
+                    for ni in nodes_to_kick:
+                        omega[ni] = omega_original[ni] + amp
+                        omega_kick_ends[ni] = t + dur
+                        heapq.heappush(kick_expiry, (t + dur, ni))
+                    events_log.append({
+                        "t": t, "type": "omega_kick",
+                        "nodes": nodes_to_kick, "amplitude": amp, "duration": dur
+                    })
+
+                event_idx += 1
+
+            # ── Expire omega kicks ────────────────────────────────────────────
+            # A re-kicked node leaves a stale heap entry; only its latest
+            # end time (the one still in omega_kick_ends) restores ω.
+            while kick_expiry and kick_expiry[0][0] <= t:
+                end, ni = heapq.heappop(kick_expiry)
+                if omega_kick_ends.get(ni) == end:
+                    omega[ni] = omega_original[ni]
+                    del omega_kick_ends[ni]
+
+            # ── Physics step ──────────────────────────────────────────────────
+            theta, memory = step_fn(theta, memory, omega)
+
+            # ── Wrap phases to [−π, π] ────────────────────────────────────────
+            _wrap_phases(theta)
+
+            # ── Observers ─────────────────────────────────────────────────────
+            if o1_enabled:
+                metrics[step, 1:4] = _order_parameter(theta)
+
+    # ΔΦ depends only on the R history, so it is evaluated in one pass.
+    if "O2" in observers_enabled:
+        metrics[:, 4] = observer_o2_series(metrics[:, 1])
+
+    summary = _run_summary(metrics[:, 1], metrics[:, 0], dt, N, plugin,
+                           params["kappa"], seed)
+
+    # The compiled kernels reduce in a different order, so metrics can
+    # differ in the last bits; recording the engine keeps hash.txt honest.
+    return {
+        "config": {**cfg, "engine": "numba" if compiled else "numpy"},
+        "metrics": metrics,
+        "events": events_log,
+        "summary": summary,
+    }
 
-    for step in range(n_steps):
-        t = step * dt
-
-        # ── Apply scheduled perturbations at this timestep ────────────────
-        while event_idx < len(pending_events):
-            ev = pending_events[event_idx]
-            ev_t = float(ev.get("time", 0.0))
-            if ev_t > t + dt * 0.5:
-                break
-            ev_type = ev.get("type", "phase_kick")
-            amp = float(ev.get("amplitude", 0.1))
-            node_spec = ev.get("node", "all")
-
-            nodes_to_kick = list(range(N)) if node_spec == "all" else [int(node_spec)]
-
-            if ev_type == "phase_kick":
-                for ni in nodes_to_kick:
-                    theta[ni] += amp
-                events_log.append({
-                    "t": t, "type": "phase_kick",
-                    "nodes": nodes_to_kick, "amplitude": amp
-                })
-            elif ev_type == "omega_kick":
-                dur = float(ev.get("duration", 1.0))
-                for ni in nodes_to_kick:
-                    omega[ni] = omega_original[ni] + amp
-                    omega_kick_ends[ni] = t + dur
-                events_log.append({
-                    "t": t, "type": "omega_kick",
-                    "nodes": nodes_to_kick, "amplitude": amp, "duration": dur
-                })
-
-            event_idx += 1
-
-        # ── Expire omega kicks ────────────────────────────────────────────
-        for ni in list(omega_kick_ends.keys()):
-            if omega_kick_ends[ni] <= t:
-                omega[ni] = omega_original[ni]
-                del omega_kick_ends[ni]
-
-        # ── Physics step ──────────────────────────────────────────────────
-        if plugin == "P1":
-            if integrator == "rk4" and params["sigma"] == 0.0:
-                theta = _rk4_step_p1(theta, omega, A, phi_offsets, params, dt)
-            else:
-                dtheta = physics_p1(theta, omega, A, phi_offsets, params, rng)
-                theta = theta + dt * dtheta
-        elif plugin == "P2":
-            dtheta, dmemory = physics_p2(theta, omega, memory, A, phi_offsets, params, rng)
-            theta = theta + dt * dtheta
-            memory = memory + dt * dmemory
-        elif plugin == "P3":
-            dtheta = physics_p3(theta, omega, A, phi_offsets, params, rng)
-            theta = theta + dt * dtheta
-        else:
-            # Default to P1
-            dtheta = physics_p1(theta, omega, A, phi_offsets, params, rng)
-            theta = theta + dt * dtheta
-
-        # ── Wrap phases to [−π, π] ────────────────────────────────────────
-        theta = (theta + math.pi) % (2 * math.pi) - math.pi
-
-        # ── Observers ─────────────────────────────────────────────────────
-        row: Dict[str, float] = {"t": round(t + dt, 8)}
-
-        if "O1" in observers_enabled:
-            o1 = observer_o1(theta)
-            row.update(o1)
-            history_R.append(o1["R"])
-        else:
-            row["R"] = 0.0
-            row["psi"] = 0.0
-            row["sigma_theta"] = 0.0
-            history_R.append(0.0)
-
-        if "O2" in observers_enabled:
-            row["delta_phi"] = observer_o2(history_R)
-        else:
-            row["delta_phi"] = 0.0
-
-        metrics_rows.append(row)
 
-    # ── Summary statistics (final 20% window) ─────────────────────────────
-    final_window_start = int(0.8 * len(metrics_rows))
-    final_R = [r["R"] for r in metrics_rows[final_window_start:]]
-    mean_R = float(np.mean(final_R)) if final_R else 0.0
+def _run_summary(R: np.ndarray, t: np.ndarray, dt: float, N: int, plugin: str,
+                 kappa: float, seed: int) -> Dict[str, Any]:
+    """Summary statistics of one run from its R(t) series."""
+    n_steps = len(R)
+    # ── Final 20% window ─────────────────────────────────────────────────
+    final_R = R[int(0.8 * n_steps):]
+    mean_R = float(np.mean(final_R)) if final_R.size else 0.0
     se_R = float(np.std(final_R) / math.sqrt(max(len(final_R), 1)))
 
     # Settling time: first time R > 0.9 (or None if never reached)
-    settling_time = None
-    for row in metrics_rows:
-        if row["R"] > 0.9:
-            settling_time = row["t"]
-            break
+    locked = np.flatnonzero(R > 0.9)
+    settling_time = float(t[locked[0]]) if locked.size else None
 
-    summary = {
+    return {
         "mean_R_final": mean_R,
         "se_R_final": se_R,
         "settling_time": settling_time,
@@ -510,47 +1396,108 @@ def run_simulation(cfg: Dict[str, Any],
         "t_end_actual": round(n_steps * dt, 8),
         "N": N,
         "plugin": plugin,
-        "kappa": params["kappa"],
+        "kappa": kappa,
         "seed": seed,
     }
 
-    return {
-        "config": cfg,
-        "metrics": metrics_rows,
-        "events": events_log,
-        "summary": summary,
-    }
-
 
 # ---------------------------------------------------------------------------
 # Sweep protocol — κ sweep (E1 / Phase 1)
 # ---------------------------------------------------------------------------
 
-def run_kappa_sweep(sweep_cfg: Dict[str, Any]) -> Dict[str, Any]:
-    """Execute the E1 κ-sweep protocol (HLV.md §F.E1).
+# Graph layer shared by the runs of one sweep inside a pool worker.
+_sweep_graph: Optional[Tuple[Any, np.ndarray, Any]] = None
 
-    For each κ in the sweep range, runs `num_seeds` independent simulations
-    and reports mean ± SE of the final-window order parameter R.
+
+def _init_sweep_worker(graph: Tuple[Any, np.ndarray, Any]) -> None:
+    """Pool initializer: install the sweep's graph layer in the worker."""
+    global _sweep_graph
+    _sweep_graph = graph
+
+
+def _sweep_summary(task: Tuple[Dict[str, Any], float, int],
+                   graph: Optional[Tuple[Any, np.ndarray, Any]] = None
+                   ) -> Dict[str, Any]:
+    """Run one (κ, seed) sweep point; only the summary crosses processes."""
+    sweep_cfg, kappa, seed = task
+    return _simulate({**sweep_cfg, "kappa": kappa, "seed": seed},
+                     graph=graph if graph is not None else _sweep_graph)["summary"]
+
+
+def _sweep_pool_context() -> Optional[Any]:
+    """Return a fork context when sweep workers can resolve this module.
+
+    Workers receive ``_sweep_summary`` by reference, so the module must be
+    registered in ``sys.modules`` under its own name; plugins loaded through
+    PluginRegistry are.  Only fork is used because spawned interpreters
+    cannot re-import a plugin that was loaded from a file path.
     """
+    module = sys.modules.get(__name__)
+    if getattr(module, "_sweep_summary", None) is not _sweep_summary:
+        return None
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return None
+    return multiprocessing.get_context("fork")
+
+
+def _map_sweep(tasks: List[Tuple[Dict[str, Any], float, int]],
+               workers: int,
+               graph: Tuple[Any, np.ndarray, Any],
+               processes: bool = True) -> List[Dict[str, Any]]:
+    """Evaluate sweep tasks, fanning out to a process pool when possible.
+
+    ``workers`` is capped at the CPU count: the runs are CPU-bound, so more
+    processes or threads than cores only add start-up cost.  With
+    ``processes=False`` nothing is forked; the sweep uses threads or runs
+    serially.
+    """
+    workers = min(workers, os.cpu_count() or 1, len(tasks))
+    ctx = _sweep_pool_context() if processes and workers > 1 else None
+    # Every task shares one sweep config, so one check covers the sweep.
+    threaded = (ctx is None and workers > 1 and _NUMBA_AVAILABLE
+                and not tasks[0][0].get("inject_events"))
+    if ctx is None and not threaded:
+        return [_sweep_summary(task, graph) for task in tasks]
+    # Run the first point here so a JIT-compiled kernel is built once and
+    # inherited by the workers instead of being compiled in each.
+    summaries = [_sweep_summary(tasks[0], graph)]
+    rest = tasks[1:]
+    if threaded:
+        # Without a usable fork the compiled step loop, which releases the
+        # GIL, still lets threads share the cores; the graph is read-only.
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            summaries.extend(pool.map(lambda task: _sweep_summary(task, graph), rest))
+        return summaries
+    chunksize = max(1, len(rest) // (4 * workers))
+    # Forked workers inherit the graph through the initializer arguments
+    # rather than receiving a pickled copy with every task.
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx,
+                             initializer=_init_sweep_worker,
+                             initargs=(graph,)) as pool:
+        summaries.extend(pool.map(_sweep_summary, rest, chunksize=chunksize))
+    return summaries
+
+
+def _kappa_grid(sweep_cfg: Dict[str, Any]) -> List[float]:
+    """κ values of a sweep, kappa_min..kappa_max inclusive."""
     kappa_min = float(sweep_cfg.get("kappa_min", 0.0))
     kappa_max = float(sweep_cfg.get("kappa_max", 6.0))
     kappa_step = float(sweep_cfg.get("kappa_step", 0.2))
-    num_seeds = int(sweep_cfg.get("num_seeds", 10))
-    seed_base = int(sweep_cfg.get("seed_base", 0))
 
     kappa_values = []
     k = kappa_min
     while k <= kappa_max + kappa_step * 0.5:
         kappa_values.append(round(k, 8))
         k += kappa_step
+    return kappa_values
 
+
+def _sweep_report(sweep_cfg: Dict[str, Any], kappa_values: List[float],
+                  num_seeds: int, summaries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Aggregate κ-major per-run summaries into the sweep result."""
     sweep_results = []
-    for kappa in kappa_values:
-        seed_results = []
-        for s in range(num_seeds):
-            sim_cfg = {**sweep_cfg, "kappa": kappa, "seed": seed_base + s}
-            result = run_simulation(sim_cfg)
-            seed_results.append(result["summary"])
+    for n, kappa in enumerate(kappa_values):
+        seed_results = summaries[n * num_seeds:(n + 1) * num_seeds]
 
         mean_R = float(np.mean([r["mean_R_final"] for r in seed_results]))
         se_R = float(np.std([r["mean_R_final"] for r in seed_results])
@@ -575,57 +1522,257 @@ def run_kappa_sweep(sweep_cfg: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+def run_kappa_sweep(sweep_cfg: Dict[str, Any],
+                    processes: bool = True) -> Dict[str, Any]:
+    """Execute the E1 κ-sweep protocol (HLV.md §F.E1).
+
+    For each κ in the sweep range, runs `num_seeds` independent simulations
+    and reports mean ± SE of the final-window order parameter R.  The κ×seed
+    grid is spread over `workers` processes (default and maximum: CPU count).
+    Pass ``processes=False`` to keep the sweep in this process.
+    """
+    num_seeds = int(sweep_cfg.get("num_seeds", 10))
+    seed_base = int(sweep_cfg.get("seed_base", 0))
+    workers = int(sweep_cfg.get("workers") or os.cpu_count() or 1)
+    kappa_values = _kappa_grid(sweep_cfg)
+
+    tasks = [(sweep_cfg, kappa, seed_base + s)
+             for kappa in kappa_values for s in range(num_seeds)]
+    # The graph has no κ or seed dependence, so it is built once per sweep.
+    summaries = _map_sweep(tasks, workers, _prepare_graph(sweep_cfg), processes)
+    return _sweep_report(sweep_cfg, kappa_values, num_seeds, summaries)
+
+
+# ---------------------------------------------------------------------------
+# Batched sweep — every (κ, seed) run stepped as one (B, N) ensemble
+# ---------------------------------------------------------------------------
+
+def _ensemble_supported(cfg: Dict[str, Any]) -> bool:
+    """The ensemble stepper covers Euler runs without scheduled events."""
+    if cfg.get("inject_events"):
+        return False
+    rk4 = (cfg.get("integrator", "euler") == "rk4"
+           and float(cfg.get("sigma", 0.0)) == 0.0)
+    return not rk4
+
+
+def _batched_matvec(A: Any, X: np.ndarray) -> np.ndarray:
+    """Row-wise A @ xᵦ for a (B, N) stack, as one matrix-matrix product."""
+    return (A @ X.T).T
+
+
+def _gpu_array_module() -> Any:
+    """Import CuPy on first use; GPU sweeps are opt-in and CuPy is heavy."""
+    try:
+        import cupy
+        import cupyx.scipy.sparse  # noqa: F401  (used by _graph_to_device)
+    except ImportError as exc:
+        raise ImportError(
+            "cupy is required for device='gpu' sweeps: pip install cupy-cuda12x"
+        ) from exc
+    return cupy
+
+
+def _graph_to_device(graph: Tuple[Any, np.ndarray, Any], xp: Any
+                     ) -> Tuple[Any, np.ndarray, Any]:
+    """Upload the coupling operators of a _prepare_graph() result to CuPy."""
+    import cupyx.scipy.sparse as cp_sparse
+
+    def upload(op):
+        if isinstance(op, _MeanFieldCoupling):
+            return op  # reductions only; works on any array type
+        if hasattr(op, "tocsr"):
+            return cp_sparse.csr_matrix(op)
+        return xp.asarray(op)
+
+    A, phi, offsets = graph
+    return upload(A), phi, None if offsets is None else tuple(upload(op) for op in offsets)
+
+
+def _simulate_ensemble(cfg: Dict[str, Any], kappa_values: List[float],
+                       seeds: List[int], graph: Tuple[Any, np.ndarray, Any],
+                       xp: Any = np) -> List[Dict[str, Any]]:
+    """Euler-step all (κ, seed) runs together; return κ-major summaries.
+
+    Runs sharing a seed share their ω, initial phases and noise stream, as
+    in run_simulation, so each seed's generator is drawn once per step and
+    broadcast over κ.  Summaries match per-run ones to rounding (the
+    batched products sum in a different order than matvecs).
+
+    ``xp`` is the array module (NumPy, or CuPy with ``graph`` already on
+    the device).  Random draws stay on the host so streams are unchanged;
+    only the per-step noise goes up and the R history comes back once.
+    """
+    plugin = cfg.get("plugin", "P1")
+    N = int(cfg.get("N", 32))
+    dt = float(cfg.get("dt", 0.05))
+    t_end = float(cfg.get("t_end", 50.0))
+    freq_dist = cfg.get("freq_dist", {"type": "lorentzian", "gamma": 0.5})
+    sigma = float(cfg.get("sigma", 0.0))
+    eta = float(cfg.get("eta", 0.5))
+    tau_m = float(cfg.get("tau_m", 5.0))
+    K, S = len(kappa_values), len(seeds)
+    B = K * S
+    if B == 0:
+        return []
+
+    rngs = [_run_rng(cfg, seed) for seed in seeds]
+    omega = np.empty((S, N))
+    theta = np.empty((K, S, N))
+    for j, rng in enumerate(rngs):
+        omega[j] = sample_frequencies(N, freq_dist, rng)
+        theta[:, j] = rng.uniform(-math.pi, math.pi, N)
+    omega = xp.asarray(np.broadcast_to(omega, (K, S, N)).reshape(B, N))
+    theta = xp.asarray(theta.reshape(B, N))
+    kappa = xp.asarray(np.repeat(np.asarray(kappa_values, dtype=float), S)[:, None])
+    memory = xp.zeros((B, N))
+
+    A, _phi, offsets = graph
+    n_steps = int(round(t_end / dt))
+    t = np.asarray(_time_column(n_steps, dt))
+    R = xp.zeros((B, n_steps))
+    o1_enabled = "O1" in cfg.get("observers", ["O1"])
+    # One noise stream per seed, each continuing its run's own generator.
+    streams = ([_noise_rows(rng, n_steps, N, max_values=NOISE_BLOCK_VALUES // S)
+                for rng in rngs] if sigma > 0.0 else [])
+
+    for step in range(n_steps):
+        sin_t, cos_t = xp.sin(theta), xp.cos(theta)
+        if plugin == "P3":
+            A_cos, A_sin = offsets
+            coupling = (cos_t * _batched_matvec(A_cos, sin_t)
+                        - sin_t * _batched_matvec(A_cos, cos_t))
+            coupling += (cos_t * _batched_matvec(A_sin, cos_t)
+                         + sin_t * _batched_matvec(A_sin, sin_t))
+        else:
+            coupling = (cos_t * _batched_matvec(A, sin_t)
+                        - sin_t * _batched_matvec(A, cos_t))
+        dtheta = coupling * kappa
+        dtheta += omega
+        if plugin == "P2":
+            dtheta += eta * memory
+        if sigma > 0.0:
+            noise = xp.asarray(np.stack([next(rows) for rows in streams]))
+            by_seed = dtheta.reshape(K, S, N)  # view; noise broadcasts over κ
+            by_seed += sigma * noise
+        if plugin == "P2":
+            coupling -= memory / tau_m
+            coupling *= dt
+            memory += coupling
+        dtheta *= dt
+        theta += dtheta
+        if xp is np:
+            _wrap_phases(theta)
+        else:
+            theta += math.pi
+            xp.mod(theta, 2 * math.pi, out=theta)
+            theta -= math.pi
+
+        if o1_enabled:
+            R[:, step] = xp.hypot(xp.cos(theta).mean(axis=1),
+                                  xp.sin(theta).mean(axis=1))
+
+    if xp is not np:
+        R = xp.asnumpy(R)
+    summaries = []
+    for b in range(B):
+        kappa_b = kappa_values[b // S]
+        summaries.append(_run_summary(R[b], t, dt, N, plugin, kappa_b, seeds[b % S]))
+    return summaries
+
+
+def run_kappa_sweep_batched(sweep_cfg: Dict[str, Any]) -> Dict[str, Any]:
+    """κ-sweep with every (κ, seed) run stepped as a single ensemble.
+
+    Returns the same structure as run_kappa_sweep.  Each step is a handful
+    of (B, N) array operations and matrix-matrix products, which amortises
+    Python overhead over the whole grid.  Configurations the ensemble
+    stepper does not cover (RK4, scheduled events) use run_kappa_sweep.
+
+    With ``device='gpu'`` the ensemble runs on CuPy; this pays off for large
+    B·N grids, not for a handful of small runs.
+    """
+    if not _ensemble_supported(sweep_cfg):
+        return run_kappa_sweep(sweep_cfg)
+    num_seeds = int(sweep_cfg.get("num_seeds", 10))
+    seed_base = int(sweep_cfg.get("seed_base", 0))
+    kappa_values = _kappa_grid(sweep_cfg)
+    seeds = [seed_base + s for s in range(num_seeds)]
+
+    graph = _prepare_graph(sweep_cfg)
+    xp = np
+    if sweep_cfg.get("device", "cpu") == "gpu":
+        xp = _gpu_array_module()
+        graph = _graph_to_device(graph, xp)
+    summaries = _simulate_ensemble(sweep_cfg, kappa_values, seeds, graph, xp=xp)
+    return _sweep_report(sweep_cfg, kappa_values, num_seeds, summaries)
+
+
 # ---------------------------------------------------------------------------
 # Artifact bundle — config.json + metrics.csv + events.jsonl + hash.txt
 # ---------------------------------------------------------------------------
 
-def build_artifact_bundle(result: Dict[str, Any]) -> Dict[str, str]:
-    """Build the HLV artifact bundle as a dict of {filename: content_string}.
+def _artifact_files(result: Dict[str, Any]) -> Dict[str, bytes]:
+    """Encode the bundle files once, as the UTF-8 bytes that are hashed.
 
-    Bundle specification (HLV.md Appendix A.2):
-        config.json   — full run configuration
-        metrics.csv   — t, R, ψ, σ_θ, ΔΦ time series
-        events.jsonl  — perturbation event log
-        hash.txt      — SHA-256 over config + metrics + events
+    The CSV is written straight into a byte buffer and hashed through a
+    zero-copy view, so no intermediate str copy of the metrics is made.
+    ZIP and email exports use these bytes directly.
     """
-    config_str = json.dumps(result["config"], indent=2, sort_keys=True)
+    config_bytes = json.dumps(result["config"], indent=2, sort_keys=True).encode()
 
-    # metrics.csv
+    # metrics.csv — accepts the METRIC_FIELDS array or run_simulation() rows.
+    # writerows() formats floats with repr() exactly as DictWriter did, so
+    # bundle hashes are unchanged while the per-row dict handling goes away.
     metrics = result.get("metrics", [])
-    csv_buf = io.StringIO()
-    if metrics:
-        fieldnames = ["t", "R", "psi", "sigma_theta", "delta_phi"]
-        writer = csv.DictWriter(csv_buf, fieldnames=fieldnames,
-                                extrasaction="ignore")
-        writer.writeheader()
-        for row in metrics:
-            writer.writerow({
-                "t": row.get("t", 0.0),
-                "R": row.get("R", 0.0),
-                "psi": row.get("psi", 0.0),
-                "sigma_theta": row.get("sigma_theta", 0.0),
-                "delta_phi": row.get("delta_phi", 0.0),
-            })
-    metrics_str = csv_buf.getvalue()
+    if isinstance(metrics, _MetricsView):
+        metrics = metrics.array
+    csv_buf = io.BytesIO()
+    if len(metrics):
+        text = io.TextIOWrapper(csv_buf, encoding="utf-8", newline="")
+        writer = csv.writer(text)
+        writer.writerow(METRIC_FIELDS)
+        if isinstance(metrics, np.ndarray):
+            # One %-format over the flattened array yields the same bytes as
+            # csv.writer (repr() per value, CRLF rows) without per-row calls.
+            row_fmt = ",".join(["%r"] * metrics.shape[1]) + "\r\n"
+            text.write(row_fmt * metrics.shape[0] % tuple(metrics.ravel().tolist()))
+        else:
+            writer.writerows(
+                tuple(row.get(f, 0.0) for f in METRIC_FIELDS) for row in metrics
+            )
+        text.detach()  # flush into csv_buf without closing it
 
     # events.jsonl
-    events_str = "\n".join(json.dumps(ev) for ev in result.get("events", []))
+    events_bytes = "\n".join(json.dumps(ev) for ev in result.get("events", [])).encode()
 
     # hash.txt — SHA-256 over config + metrics + events
     hasher = hashlib.sha256()
-    hasher.update(config_str.encode())
-    hasher.update(metrics_str.encode())
-    hasher.update(events_str.encode())
-    hash_str = hasher.hexdigest()
+    hasher.update(config_bytes)
+    with csv_buf.getbuffer() as view:
+        hasher.update(view)
+    hasher.update(events_bytes)
 
     return {
-        "config.json": config_str,
-        "metrics.csv": metrics_str,
-        "events.jsonl": events_str,
-        "hash.txt": hash_str,
+        "config.json": config_bytes,
+        "metrics.csv": csv_buf.getvalue(),
+        "events.jsonl": events_bytes,
+        "hash.txt": hasher.hexdigest().encode(),
     }
 
 
+def build_artifact_bundle(result: Dict[str, Any]) -> Dict[str, str]:
+    """Build the HLV artifact bundle as a dict of {filename: content_string}.
+
+    Bundle specification (HLV.md Appendix A.2):
+        config.json   — full run configuration
+        metrics.csv   — t, R, ψ, σ_θ, ΔΦ time series
+        events.jsonl  — perturbation event log
+        hash.txt      — SHA-256 over config + metrics + events
+    """
+    return {name: data.decode() for name, data in _artifact_files(result).items()}
+
+
 def build_artifact_pdf(result: Dict[str, Any]) -> bytes:
     """Return a PDF report of the simulation results as bytes.
 
@@ -634,7 +1781,7 @@ def build_artifact_pdf(result: Dict[str, Any]) -> bytes:
     if not _FPDF_AVAILABLE:
         raise ImportError("fpdf2 is required for PDF export: pip install fpdf2")
 
-    bundle = build_artifact_bundle(result)
+    digest = _artifact_files(result)["hash.txt"].decode()
     summary = result.get("summary", {})
     cfg = result.get("config", {})
 
@@ -644,7 +1791,7 @@ def build_artifact_pdf(result: Dict[str, Any]) -> bytes:
     pdf.set_font("Helvetica", "B", 16)
     pdf.cell(0, 10, "FEEN HLV Simulation Report", new_x="LMARGIN", new_y="NEXT")
     pdf.set_font("Helvetica", "", 10)
-    pdf.cell(0, 6, f"SHA-256: {bundle['hash.txt']}", new_x="LMARGIN", new_y="NEXT")
+    pdf.cell(0, 6, f"SHA-256: {digest}", new_x="LMARGIN", new_y="NEXT")
     pdf.ln(4)
 
     # Configuration section
@@ -699,13 +1846,13 @@ def build_artifact_docx(result: Dict[str, Any]) -> bytes:
     if not _DOCX_AVAILABLE:
         raise ImportError("python-docx is required for DOCX export: pip install python-docx")
 
-    bundle = build_artifact_bundle(result)
+    digest = _artifact_files(result)["hash.txt"].decode()
     summary = result.get("summary", {})
     cfg = result.get("config", {})
 
     doc = DocxDocument()
     doc.add_heading("FEEN HLV Simulation Report", 0)
-    doc.add_paragraph(f"SHA-256: {bundle['hash.txt']}")
+    doc.add_paragraph(f"SHA-256: {digest}")
 
     doc.add_heading("Configuration", level=1)
     for key, val in cfg.items():
@@ -743,10 +1890,17 @@ def build_artifact_docx(result: Dict[str, Any]) -> bytes:
 # Plugin-level state (thread-safe)
 # ---------------------------------------------------------------------------
 
+# Results and status are published by rebinding a module global to a new,
+# never-mutated dict, so readers take a reference without locking and cannot
+# block behind a writer.  _lock only serialises writers that update several
+# globals together (e.g. a new result plus the matching idle status).
 _lock = threading.Lock()
 _latest_result: Optional[Dict[str, Any]] = None
 _latest_sweep: Optional[Dict[str, Any]] = None
 _run_status: Dict[str, Any] = {"state": "idle", "last_run_at": None}
+# (result, encoded bundle files) for the last result an artifact endpoint
+# served; results are immutable, so identity is the whole cache key.
+_artifact_cache: Tuple[Optional[Dict[str, Any]], Dict[str, bytes]] = (None, {})
 
 
 # ---------------------------------------------------------------------------
@@ -756,18 +1910,42 @@ _run_status: Dict[str, Any] = {"state": "idle", "last_run_at": None}
 _blueprint = Blueprint("hlv_dynamics", __name__, url_prefix="/api/hlv")
 
 
+def _result_artifact_files(result: Dict[str, Any]) -> Dict[str, bytes]:
+    """_artifact_files(result), encoded and hashed once per published run."""
+    global _artifact_cache
+    cached_result, files = _artifact_cache
+    if cached_result is not result:
+        files = _artifact_files(result)
+        _artifact_cache = (result, files)
+    return files
+
+
+def _json_response(payload: Any, status: int = 200) -> Response:
+    """Serialize payload with orjson (stdlib fallback) into a JSON Response.
+
+    Metric series run to tens of thousands of floats, where orjson's C
+    encoder is several times faster than the stdlib one behind jsonify.
+    """
+    return Response(_dumps(payload), status=status, mimetype="application/json")
+
+
+# Manifest-derived /status fields never change after import.
+_STATUS_STATIC = {
+    "plugin": MANIFEST.name,
+    "version": list(MANIFEST.version),
+    "feen_api": list(FEEN_PLUGIN_API_VERSION),
+}
+
+
 @_blueprint.route("/status", methods=["GET"])
 def status():
     """Return current HLV plugin status — read-only observer."""
-    with _lock:
-        return jsonify({
-            "plugin": MANIFEST.name,
-            "version": list(MANIFEST.version),
-            "feen_api": list(FEEN_PLUGIN_API_VERSION),
-            "run_status": _run_status,
-            "has_result": _latest_result is not None,
-            "has_sweep": _latest_sweep is not None,
-        })
+    return _json_response({
+        **_STATUS_STATIC,
+        "run_status": _run_status,
+        "has_result": _latest_result is not None,
+        "has_sweep": _latest_sweep is not None,
+    })
 
 
 @_blueprint.route("/run", methods=["POST"])
@@ -784,9 +1962,10 @@ def run_endpoint():
         tau_m        : float   memory timescale (P2) (default 5.0)
         phi0         : float   phase offset (P3)     (default 0.0)
         seed         : int                            (default 42)
+        bit_generator: "pcg64" | "sfc64"             (default "pcg64")
         dt           : float                          (default 0.05)
         t_end        : float                          (default 50.0)
-        integrator   : "euler" | "rk4"               (default "euler")
+        integrator   : "euler" | "rk4" (σ = 0 only)  (default "euler")
         observers    : list of "O1" and/or "O2"      (default ["O1"])
         freq_dist    : {type, gamma/std/...}
         inject_events: list of perturbation events
@@ -799,8 +1978,7 @@ def run_endpoint():
         data["observers"] = ["O1"]
 
     try:
-        with _lock:
-            _run_status = {"state": "running", "last_run_at": _time.time()}
+        _run_status = {"state": "running", "last_run_at": _time.time()}
 
         result = run_simulation(data, inject_events=data.get("inject_events"))
 
@@ -812,17 +1990,16 @@ def run_endpoint():
         metrics = result["metrics"]
         sample_metrics = (metrics[:20] + metrics[-20:]) if len(metrics) > 40 else metrics
 
-        return jsonify({
+        return _json_response({
             "summary": result["summary"],
-            "metrics_sample": sample_metrics,
+            "metrics_sample": sample_metrics.rows(),
             "metrics_count": len(metrics),
             "events": result["events"],
         })
     except Exception as exc:
-        with _lock:
-            _run_status = {"state": "error", "error": str(exc)}
+        _run_status = {"state": "error", "error": str(exc)}
         logger.exception("HLV run failed")
-        return jsonify({"error": str(exc)}), 500
+        return _json_response({"error": str(exc)}), 500
 
 
 @_blueprint.route("/sweep", methods=["POST"])
@@ -836,6 +2013,10 @@ def sweep_endpoint():
         kappa_step   : float   (default 0.2)
         num_seeds    : int     (default 10)
         seed_base    : int     (default 0)
+        workers      : int     threads (default and maximum CPU count; 1 runs
+                               serially; never forks a process pool)
+        batched      : bool    step all runs as one ensemble (default false)
+        device       : "cpu" | "gpu"  batched sweep on CuPy (default "cpu")
     """
     global _latest_sweep, _run_status
     data = request.get_json(silent=True) or {}
@@ -844,21 +2025,23 @@ def sweep_endpoint():
         data["observers"] = ["O1"]
 
     try:
-        with _lock:
-            _run_status = {"state": "sweeping", "last_run_at": _time.time()}
+        _run_status = {"state": "sweeping", "last_run_at": _time.time()}
 
-        sweep = run_kappa_sweep(data)
+        batched = data.get("batched") or data.get("device") == "gpu"
+        # Forking a threaded server worker per request risks deadlock, so
+        # HTTP sweeps stay in-process: threads when compiled, else serial.
+        sweep = (run_kappa_sweep_batched(data) if batched
+                 else run_kappa_sweep(data, processes=False))
 
         with _lock:
             _latest_sweep = sweep
             _run_status = {"state": "idle", "last_run_at": _time.time()}
 
-        return jsonify(sweep)
+        return _json_response(sweep)
     except Exception as exc:
-        with _lock:
-            _run_status = {"state": "error", "error": str(exc)}
+        _run_status = {"state": "error", "error": str(exc)}
         logger.exception("HLV sweep failed")
-        return jsonify({"error": str(exc)}), 500
+        return _json_response({"error": str(exc)}), 500
 
 
 @_blueprint.route("/inject", methods=["POST"])
@@ -888,7 +2071,7 @@ def inject_endpoint():
     if ev["type"] == "omega_kick":
         ev["duration"] = float(data.get("duration", 1.0))
 
-    return jsonify({
+    return _json_response({
         "message": "Perturbation event spec ready — include in inject_events of POST /api/hlv/run",
         "event": ev,
     })
@@ -897,30 +2080,30 @@ def inject_endpoint():
 @_blueprint.route("/results", methods=["GET"])
 def results_endpoint():
     """Return the latest simulation results — read-only observer."""
-    with _lock:
-        if _latest_result is None:
-            return jsonify({"error": "No results yet. Run a simulation first."}), 404
-        metrics = _latest_result["metrics"]
-        sample = (metrics[:50] + metrics[-50:]) if len(metrics) > 100 else metrics
-        return jsonify({
-            "summary": _latest_result["summary"],
-            "metrics_sample": sample,
-            "metrics_count": len(metrics),
-            "events": _latest_result["events"],
-        })
+    result = _latest_result
+    if result is None:
+        return _json_response({"error": "No results yet. Run a simulation first."}), 404
+    metrics = result["metrics"]
+    sample = (metrics[:50] + metrics[-50:]) if len(metrics) > 100 else metrics
+    return _json_response({
+        "summary": result["summary"],
+        "metrics_sample": sample.rows(),
+        "metrics_count": len(metrics),
+        "events": result["events"],
+    })
 
 
 @_blueprint.route("/results/full", methods=["GET"])
 def results_full_endpoint():
     """Return the full metrics time series — read-only observer."""
-    with _lock:
-        if _latest_result is None:
-            return jsonify({"error": "No results yet."}), 404
-        return jsonify({
-            "summary": _latest_result["summary"],
-            "metrics": _latest_result["metrics"],
-            "events": _latest_result["events"],
-        })
+    result = _latest_result
+    if result is None:
+        return _json_response({"error": "No results yet."}), 404
+    return _json_response({
+        "summary": result["summary"],
+        "metrics": result["metrics"].rows(),
+        "events": result["events"],
+    })
 
 
 @_blueprint.route("/artifacts", methods=["GET"])
@@ -929,20 +2112,20 @@ def artifacts_endpoint():
 
     READ-ONLY OBSERVER: Returns the most recent run's artifact bundle.
     """
-    with _lock:
-        if _latest_result is None:
-            return jsonify({"error": "No results yet."}), 404
-        bundle = build_artifact_bundle(_latest_result)
-    return jsonify(bundle)
+    result = _latest_result
+    if result is None:
+        return _json_response({"error": "No results yet."}), 404
+    files = _result_artifact_files(result)
+    return _json_response({name: data.decode() for name, data in files.items()})
 
 
 @_blueprint.route("/sweep/results", methods=["GET"])
 def sweep_results_endpoint():
     """Return the latest sweep results — read-only observer."""
-    with _lock:
-        if _latest_sweep is None:
-            return jsonify({"error": "No sweep results yet."}), 404
-        return jsonify(_latest_sweep)
+    sweep = _latest_sweep
+    if sweep is None:
+        return _json_response({"error": "No sweep results yet."}), 404
+    return _json_response(sweep)
 
 
 @_blueprint.route("/artifacts/download", methods=["GET"])
@@ -957,18 +2140,17 @@ def artifacts_download_endpoint():
     """
     fmt = request.args.get("format", "zip").lower().strip()
     if fmt not in ("zip", "pdf", "docx"):
-        return jsonify({"error": "Invalid format. Use zip, pdf, or docx."}), 400
+        return _json_response({"error": "Invalid format. Use zip, pdf, or docx."}), 400
 
-    with _lock:
-        if _latest_result is None:
-            return jsonify({"error": "No results yet."}), 404
-        result_snapshot = _latest_result
+    result_snapshot = _latest_result
+    if result_snapshot is None:
+        return _json_response({"error": "No results yet."}), 404
 
     if fmt == "pdf":
         try:
             data = build_artifact_pdf(result_snapshot)
         except ImportError as exc:
-            return jsonify({"error": str(exc)}), 503
+            return _json_response({"error": str(exc)}), 503
         return Response(
             data,
             mimetype="application/pdf",
@@ -979,7 +2161,7 @@ def artifacts_download_endpoint():
         try:
             data = build_artifact_docx(result_snapshot)
         except ImportError as exc:
-            return jsonify({"error": str(exc)}), 503
+            return _json_response({"error": str(exc)}), 503
         return Response(
             data,
             mimetype="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
@@ -987,15 +2169,14 @@ def artifacts_download_endpoint():
         )
 
     # Default: ZIP
-    bundle = build_artifact_bundle(result_snapshot)
+    files = _result_artifact_files(result_snapshot)
     zip_buf = io.BytesIO()
     with zipfile.ZipFile(zip_buf, "w", zipfile.ZIP_DEFLATED) as zf:
-        for filename, content in bundle.items():
+        for filename, content in files.items():
             zf.writestr(filename, content)
-    zip_buf.seek(0)
 
     return Response(
-        zip_buf.read(),
+        zip_buf.getvalue(),
         mimetype="application/zip",
         headers={"Content-Disposition": "attachment; filename=hlv_artifact_bundle.zip"},
     )
@@ -1017,15 +2198,15 @@ def artifacts_email_endpoint():
 
     READ-ONLY OBSERVER: does not modify simulation state.
     """
-    with _lock:
-        if _latest_result is None:
-            return jsonify({"error": "No results yet."}), 404
-        bundle = build_artifact_bundle(_latest_result)
+    result = _latest_result
+    if result is None:
+        return _json_response({"error": "No results yet."}), 404
+    files = _result_artifact_files(result)
 
     data = request.get_json(silent=True) or {}
     to_addr = data.get("to", "").strip()
     if not to_addr:
-        return jsonify({"error": "'to' email address is required."}), 400
+        return _json_response({"error": "'to' email address is required."}), 400
 
     # Per-request values override environment-variable defaults, which in turn
     # override hard-coded fallbacks.  This lets operators configure a shared
@@ -1043,7 +2224,7 @@ def artifacts_email_endpoint():
     # Build zip attachment in memory
     zip_buf = io.BytesIO()
     with zipfile.ZipFile(zip_buf, "w", zipfile.ZIP_DEFLATED) as zf:
-        for filename, content in bundle.items():
+        for filename, content in files.items():
             zf.writestr(filename, content)
     zip_bytes = zip_buf.getvalue()
 
@@ -1053,7 +2234,7 @@ def artifacts_email_endpoint():
     msg["To"] = to_addr
     msg.set_content(
         "Please find attached the FEEN HLV artifact bundle.\n\n"
-        f"SHA-256: {bundle['hash.txt']}\n"
+        f"SHA-256: {files['hash.txt'].decode()}\n"
     )
     msg.add_attachment(
         zip_bytes,
@@ -1071,9 +2252,9 @@ def artifacts_email_endpoint():
             server.send_message(msg)
     except Exception as exc:
         logger.warning("HLV email delivery failed: %s", exc)
-        return jsonify({"error": f"Email delivery failed: {exc}"}), 502
+        return _json_response({"error": f"Email delivery failed: {exc}"}), 502
 
-    return jsonify({"message": f"Artifact bundle sent to {to_addr}."})
+    return _json_response({"message": f"Artifact bundle sent to {to_addr}."})
 
 # ---------------------------------------------------------------------------
 # Lifecycle hooks
@@ -1092,7 +2273,8 @@ def deactivate():
 
 
 def unload():
-    global _latest_result, _latest_sweep
+    global _latest_result, _latest_sweep, _artifact_cache
     with _lock:
         _latest_result = None
         _latest_sweep = None
+        _artifact_cache = (None, {})
@@ -10,7 +10,8 @@ Python logging system.  Demonstrates the observer plugin contract:
 
   • Uses only read-only (GET) REST endpoints.
   • Calling assert_observer_safe() in every HTTP helper guards the boundary.
-  • Stores a rolling in-memory log (max 1 000 entries); never mutates state.
+  • Stores a rolling in-memory log (max 1 000 entries, kept as NumPy
+    columns for window aggregates); never mutates state.
   • Exposes a GET endpoint for external consumers to retrieve the log.
 
 In production this plugin would be activated by the plugin registry and its
@@ -19,13 +20,17 @@ The plugin itself is responsible for that scheduling; FEEN core is unaffected.
 """
 
 import logging
+import os
+import threading
 import time
-from collections import deque
-from typing import Any, Deque, Dict, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
-from flask import Blueprint, jsonify
+import numpy as np
+from flask import Blueprint, Response, request
 
-from plugin_registry import FEEN_PLUGIN_API_VERSION, PluginManifest, PluginType
+from plugin_registry import (
+    FEEN_PLUGIN_API_VERSION, PluginManifest, PluginType, dumps as _dumps,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -45,9 +50,172 @@ MANIFEST = PluginManifest(
 # In-memory rolling log (observer-side; no simulation state)
 # ---------------------------------------------------------------------------
 _MAX_ENTRIES = 1_000
-_log: Deque[Dict[str, Any]] = deque(maxlen=_MAX_ENTRIES)
+# Widest snapshot kept per entry; larger polls are truncated.
+_MAX_NODES = int(os.environ.get("FEEN_OBSERVER_MAX_NODES", 4096))
+
+
+class _Snapshot:
+    """One poll, column-wise: ``ids`` is a list and ``energy``/``snr`` are
+    float arrays indexed alongside it (NaN where a node omitted the field)."""
+
+    __slots__ = ("wall_time", "ids", "energy", "snr")
+
+    def __init__(self, wall_time: float, ids: List[Any],
+                 energy: np.ndarray, snr: np.ndarray) -> None:
+        self.wall_time = wall_time
+        self.ids = ids
+        self.energy = energy
+        self.snr = snr
+
+
+class _ColumnLog:
+    """Fixed-capacity log of the newest polls, stored column-wise.
+
+    ``wall_times`` and ``node_count`` are per-row vectors and ``energy``/``snr``
+    are ``(capacity, width)`` float matrices, so aggregate queries over a
+    window of rows are single NumPy reductions instead of a walk over
+    per-node objects.  Cells past a row's ``node_count`` hold NaN.  ``width``
+    grows on demand up to ``max_nodes`` so a small network does not pay for
+    the full bound.  Node ids stay in a per-row list because the REST layer
+    does not promise they are integers.
+
+    Writers serialise on ``_lock``; readers take no lock.  Each write bumps
+    ``_seq`` to odd before touching the columns and back to even after, and
+    a reader retries its copy until it sees the same even value on both
+    sides (a seqlock).  A reader racing a poll therefore gets the log as of
+    that poll or the one before, never a half-written row.
+    """
+
+    def __init__(self, capacity: int, max_nodes: int) -> None:
+        self.capacity = capacity
+        self.max_nodes = max_nodes
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._reset(width=0)
+
+    def _reset(self, width: int) -> None:
+        self.wall_times = np.zeros(self.capacity, dtype=np.float64)
+        self.node_count = np.zeros(self.capacity, dtype=np.int64)
+        self.energy = np.full((self.capacity, width), np.nan)
+        self.snr = np.full((self.capacity, width), np.nan)
+        self._ids: List[Optional[List[Any]]] = [None] * self.capacity
+        self._head = 0  # next row to write
+        self._count = 0
+
+    def _grow(self, n: int) -> None:
+        width = self.energy.shape[1]
+        new_width = min(self.max_nodes, max(n, 2 * width))
+        pad = ((0, 0), (0, new_width - width))
+        self.energy = np.pad(self.energy, pad, constant_values=np.nan)
+        self.snr = np.pad(self.snr, pad, constant_values=np.nan)
+
+    def append(self, wall_time: float, ids: List[Any],
+               energy: np.ndarray, snr: np.ndarray) -> None:
+        n = len(ids)
+        if n > self.max_nodes:
+            logger.warning("observer_logger: truncating %d nodes to max_nodes=%d",
+                           n, self.max_nodes)
+            n = self.max_nodes
+        with self._lock:
+            self._seq += 1
+            if n > self.energy.shape[1]:
+                self._grow(n)
+            row = self._head
+            self.wall_times[row] = wall_time
+            self.node_count[row] = n
+            self._ids[row] = ids[:n]
+            self.energy[row, :n] = energy[:n]
+            self.energy[row, n:] = np.nan
+            self.snr[row, :n] = snr[:n]
+            self.snr[row, n:] = np.nan
+            self._head = (row + 1) % self.capacity
+            self._count = min(self._count + 1, self.capacity)
+            self._seq += 1
+
+    def _read(self, copy: Callable[[], Any]) -> Any:
+        """Run ``copy`` until it completes without an overlapping write."""
+        while True:
+            seq = self._seq
+            if seq & 1:
+                time.sleep(0)  # writer mid-update; yield the GIL to it
+                continue
+            try:
+                result = copy()
+            except (IndexError, ValueError):
+                # Columns resized by _grow()/clear() under the copy.
+                if self._seq == seq:
+                    raise
+                continue
+            if self._seq == seq:
+                return result
+
+    def _rows(self, start: Optional[int] = None,
+              end: Optional[int] = None) -> np.ndarray:
+        """Physical row indices for ``[start:end]`` of the oldest-first log."""
+        first = self._head - self._count
+        return ((first + np.arange(self._count))[start:end]) % self.capacity
+
+    def snapshot(self) -> List[_Snapshot]:
+        """Entries from oldest to newest, copied out of the columns."""
+        def copy() -> List[_Snapshot]:
+            return [
+                _Snapshot(float(self.wall_times[r]), self._ids[r],
+                          self.energy[r, :self.node_count[r]].copy(),
+                          self.snr[r, :self.node_count[r]].copy())
+                for r in self._rows().tolist()
+            ]
+        return self._read(copy)
+
+    def energy_range(self, start: Optional[int] = None,
+                     end: Optional[int] = None) -> Dict[str, Any]:
+        """Min/max energy over entries ``[start:end]`` (slice semantics,
+        oldest first), ignoring missing readings."""
+        def copy() -> np.ndarray:
+            return self.energy[self._rows(start, end)]
+        window = self._read(copy)
+        finite = window[~np.isnan(window)]
+        return {
+            "count": int(window.shape[0]),
+            "min": float(finite.min()) if finite.size else None,
+            "max": float(finite.max()) if finite.size else None,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._seq += 1
+            self._reset(width=0)
+            self._seq += 1
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[_Snapshot]:
+        return iter(self.snapshot())
+
+
+# Column-wise storage; rows are expanded to per-node dicts only when the
+# log is served.
+_log = _ColumnLog(_MAX_ENTRIES, _MAX_NODES)
 _api_base: Optional[str] = None  # Set by activate()
 
+
+def _column(values: np.ndarray) -> List[Optional[float]]:
+    """Float column as JSON-ready values, with NaN (missing) mapped to None."""
+    return [None if v != v else v for v in values.tolist()]
+
+
+def _entry_payload(entry: _Snapshot) -> Dict[str, Any]:
+    """Expand a column-wise log entry into the per-node JSON shape."""
+    return {
+        "wall_time": entry.wall_time,
+        "nodes": [
+            {"id": i, "energy": energy, "snr": snr}
+            for i, energy, snr in zip(
+                entry.ids, _column(entry.energy), _column(entry.snr))
+        ],
+    }
+
+
 # ---------------------------------------------------------------------------
 # Blueprint
 # ---------------------------------------------------------------------------
@@ -56,14 +224,43 @@ _blueprint = Blueprint("observer_logger", __name__, url_prefix="/plugins/observe
 
 @_blueprint.route("/log", methods=["GET"])
 def get_log():
-    """Return the rolling energy-snapshot log — read-only endpoint."""
-    return jsonify({"entries": list(_log), "count": len(_log)})
+    """Return the rolling energy-snapshot log — read-only endpoint.
+
+    Streams one JSON entry per line (NDJSON), oldest first, so the body is
+    never built in memory as a whole. ``?format=json`` returns the older
+    ``{"entries": [...], "count": n}`` envelope instead.
+    """
+    entries = _log.snapshot()
+    if request.args.get("format") == "json":
+        return Response(
+            _dumps({"entries": [_entry_payload(e) for e in entries],
+                    "count": len(entries)}),
+            mimetype="application/json")
+
+    def generate():
+        for entry in entries:
+            yield _dumps(_entry_payload(entry)) + b"\n"
+
+    return Response(generate(), mimetype="application/x-ndjson")
+
+
+@_blueprint.route("/log/energy_range", methods=["GET"])
+def get_energy_range():
+    """Return min/max node energy over a window of the log — read-only.
+
+    ``start`` and ``end`` index the log oldest-first with Python slice
+    semantics, so ``?start=-100`` covers the newest 100 entries.
+    """
+    start = request.args.get("start", type=int)
+    end = request.args.get("end", type=int)
+    return Response(_dumps(_log.energy_range(start, end)),
+                    mimetype="application/json")
 
 
 @_blueprint.route("/info", methods=["GET"])
 def info():
     """Return plugin metadata — read-only endpoint."""
-    return jsonify(MANIFEST.to_dict())
+    return Response(MANIFEST.to_json(), mimetype="application/json")
 
 
 # ---------------------------------------------------------------------------
@@ -77,17 +274,13 @@ def poll(nodes_snapshot: list) -> None:
     The caller (not FEEN core) is responsible for fetching it.
     This function never touches simulation state.
     """
-    _log.append({
-        "wall_time": time.time(),
-        "nodes": [
-            {
-                "id": n.get("id"),
-                "energy": n.get("energy"),
-                "snr": n.get("snr"),
-            }
-            for n in nodes_snapshot
-        ],
-    })
+    # float64 conversion turns missing/null readings into NaN.
+    _log.append(
+        time.time(),
+        [n.get("id") for n in nodes_snapshot],
+        np.array([n.get("energy") for n in nodes_snapshot], dtype=np.float64),
+        np.array([n.get("snr") for n in nodes_snapshot], dtype=np.float64),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -15,7 +15,7 @@ This plugin demonstrates the UI plugin contract:
   • Returns a Blueprint with self-contained routes
 """
 
-from flask import Blueprint, jsonify, current_app
+from flask import Blueprint, Response, current_app
 
 from plugin_registry import PluginManifest, PluginType
 
@@ -43,7 +43,7 @@ _blueprint = Blueprint("ui_dashboard", __name__, url_prefix="/plugins/ui_dashboa
 @_blueprint.route("/info", methods=["GET"])
 def info():
     """Return plugin metadata — read-only endpoint."""
-    return jsonify(MANIFEST.to_dict())
+    return Response(MANIFEST.to_json(), mimetype="application/json")
 
 
 # ---------------------------------------------------------------------------
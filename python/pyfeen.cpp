@@ -1,6 +1,9 @@
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
 #include <pybind11/stl.h>
 
+#include <stdexcept>
+
 // ------------------------------------------------------------------
 // Core FEEN physics
 // ------------------------------------------------------------------
@@ -46,7 +49,11 @@ PYBIND11_MODULE(pyfeen, m) {
         .def("snr", &Resonator::snr, py::arg("T") = ROOM_TEMP)
         .def("x", &Resonator::x)
         .def("v", &Resonator::v)
-        .def("t", &Resonator::t);
+        .def("t", &Resonator::t)
+        // (x, v, t, energy, snr) in one call for per-node snapshots.
+        .def("state", [](const Resonator& r) {
+            return py::make_tuple(r.x(), r.v(), r.t(), r.total_energy(), r.snr());
+        });
 
     py::class_<ResonatorNetwork>(m, "ResonatorNetwork")
         .def(py::init<>())
@@ -57,8 +64,29 @@ PYBIND11_MODULE(pyfeen, m) {
              py::arg("i"), py::arg("j"), py::arg("strength"))
         .def("coupling", &ResonatorNetwork::coupling)
         .def("clear_couplings", &ResonatorNetwork::clear_couplings)
-        .def("tick_parallel", &ResonatorNetwork::tick_parallel, py::arg("dt"))
-        .def("get_state_vector", &ResonatorNetwork::get_state_vector)
+        // (rows, cols, values) NumPy arrays of the nonzero couplings; the O(N²)
+        // scan runs without the GIL, only the array copies need it.
+        .def("coupling_coo", [](const ResonatorNetwork& net) {
+            CouplingCOO coo;
+            {
+                py::gil_scoped_release release;
+                coo = net.coupling_coo();
+            }
+            return py::make_tuple(
+                py::array_t<std::size_t>(coo.rows.size(), coo.rows.data()),
+                py::array_t<std::size_t>(coo.cols.size(), coo.cols.data()),
+                py::array_t<double>(coo.values.size(), coo.values.data()));
+        })
+        // Pure numeric C++ with no Python callbacks: release the GIL so other
+        // threads keep running during long ticks. Accessors like x()/v() are
+        // cheap and keep the GIL.
+        .def("tick_parallel", &ResonatorNetwork::tick_parallel, py::arg("dt"),
+             py::call_guard<py::gil_scoped_release>())
+        .def("tick_parallel_n", &ResonatorNetwork::tick_parallel_n,
+             py::arg("dt"), py::arg("steps"),
+             py::call_guard<py::gil_scoped_release>())
+        .def("get_state_vector", &ResonatorNetwork::get_state_vector,
+             py::call_guard<py::gil_scoped_release>())
         .def("node", static_cast<Resonator& (ResonatorNetwork::*)(ResonatorNetwork::index_t)>(&ResonatorNetwork::node),
              py::return_value_policy::reference_internal)
         .def("size", &ResonatorNetwork::size)
@@ -211,6 +239,22 @@ PYBIND11_MODULE(pyfeen, m) {
     py::class_<AileeMetric>(ailee, "AileeMetric")
         .def(py::init<const AileeParams&>())
         .def("integrate", &AileeMetric::integrate, py::arg("sample"))
+        .def("integrate_raw", &AileeMetric::integrate_raw,
+             py::arg("p_input").noconvert(), py::arg("workload").noconvert(),
+             py::arg("velocity").noconvert(), py::arg("mass").noconvert(),
+             py::arg("dt").noconvert())
+        .def("integrate_batch",
+             [](AileeMetric& self,
+                py::array_t<double, py::array::c_style | py::array::forcecast> batch) {
+                 if (batch.ndim() != 2 || batch.shape(1) != 5) {
+                     throw std::invalid_argument(
+                         "integrate_batch expects an (N, 5) array of "
+                         "[p_input, workload, velocity, mass, dt] rows");
+                 }
+                 return self.integrate_batch(batch.data(),
+                                             static_cast<std::size_t>(batch.shape(0)));
+             },
+             py::arg("batch"))
         .def("delta_v", &AileeMetric::delta_v)
         .def("reset", &AileeMetric::reset);
 }
@@ -3,7 +3,7 @@ Tests for the AILEE Delta v Metric REST API endpoints.
 
 These tests validate:
   • Correct pyfeen.ailee namespace usage (not top-level pyfeen.*)
-  • Thread-safety: _ailee_metric_lock guards all ailee_metric access
+  • Thread-safety: ailee_metric is swapped atomically; _ailee_metric_lock guards lazy init
   • Observer/mutator boundary: GET /api/ailee/metric/value is read-only
   • Auto-initialization on first sample push
   • Reset clears metric accumulator
@@ -14,6 +14,16 @@ import sys
 import types
 import unittest
 import threading
+from dataclasses import dataclass
+from math import exp as _exp
+from typing import Any
+
+import numpy as np
+
+try:
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover
+    from json import loads as _loads
 
 # Ensure the python/ directory is on the path for direct test execution.
 _HERE = os.path.dirname(os.path.abspath(__file__))
@@ -46,28 +56,57 @@ class _AileeSample:
         self.dt = 1e-6
 
 
+_EXP_ARG_LIMIT = 700.0  # Mirrors AileeMetric::clamp_exp_arg in metric.h
+
+
+def _clamp_exp_arg(x, limit=_EXP_ARG_LIMIT):
+    return limit if x > limit else (-limit if x < -limit else x)
+
+
 class _AileeMetric:
-    _EXP_ARG_LIMIT = 700.0  # Mirrors AileeMetric::clamp_exp_arg in metric.h
+    _EXP_ARG_LIMIT = _EXP_ARG_LIMIT
 
     def __init__(self, params):
         self._params = params
         self._accum = 0.0
 
-    def integrate(self, sample):
+    # exp and the clamp are bound as defaults so the per-sample path reads
+    # fast locals rather than module globals.
+    def integrate(self, sample, _exp=_exp, _clamp=_clamp_exp_arg):
         if sample.mass <= 0.0:
             return
-        import math
-        limit = self._EXP_ARG_LIMIT
-        arg1 = max(-limit, min(limit, -self._params.alpha * sample.workload ** 2))
-        arg2 = max(-limit, min(limit, 2.0 * self._params.alpha * self._params.v0 * sample.velocity))
-        integrand = (sample.p_input * math.exp(arg1) * math.exp(arg2)) / sample.mass
+        arg1 = _clamp(-self._params.alpha * sample.workload ** 2)
+        arg2 = _clamp(2.0 * self._params.alpha * self._params.v0 * sample.velocity)
+        factor = _exp(_clamp(arg1 + arg2))
+        integrand = (sample.p_input * factor) / sample.mass
         self._accum += integrand * sample.dt
 
-    def delta_v(self):
-        import math
+    def integrate_raw(self, p_input, workload, velocity, mass, dt):
+        sample = _AileeSample()
+        sample.p_input = p_input
+        sample.workload = workload
+        sample.velocity = velocity
+        sample.mass = mass
+        sample.dt = dt
+        self.integrate(sample)
+        return self.delta_v()
+
+    def integrate_batch(self, batch):
+        # Vectorised over rows (p_input, workload, velocity, mass, dt).
+        rows = np.asarray(batch, dtype=np.float64).reshape(-1, 5)
+        rows = rows[rows[:, 3] > 0.0]
         limit = self._EXP_ARG_LIMIT
-        arg = max(-limit, min(limit, -self._params.alpha * self._params.v0 ** 2))
-        return self._params.isp * self._params.eta * math.exp(arg) * self._accum
+        alpha, v0 = self._params.alpha, self._params.v0
+        arg1 = np.clip(-alpha * rows[:, 1] ** 2, -limit, limit)
+        arg2 = np.clip(2.0 * alpha * v0 * rows[:, 2], -limit, limit)
+        factor = np.exp(np.clip(arg1 + arg2, -limit, limit))
+        integrand = rows[:, 0] * factor / rows[:, 3]
+        self._accum += float((integrand * rows[:, 4]).sum())
+        return self.delta_v()
+
+    def delta_v(self):
+        arg = _clamp_exp_arg(-self._params.alpha * self._params.v0 ** 2)
+        return self._params.isp * self._params.eta * _exp(arg) * self._accum
 
     def reset(self):
         self._accum = 0.0
@@ -82,15 +121,16 @@ class _ResonatorConfig:
         self.sustain_s = 0.0
 
 
+@dataclass(slots=True)
 class _Resonator:
-    def __init__(self, config):
-        self._config = config
+    config: Any
 
     def x(self): return 0.0
     def v(self): return 0.0
     def t(self): return 0.0
     def energy(self): return 0.0
     def snr(self, T=293.15): return 0.0
+    def state(self): return (0.0, 0.0, 0.0, 0.0, 0.0)
     def set_state(self, x, v, t=0.0): pass
     def inject(self, amplitude, phase=0.0): pass
     def tick(self, dt, F=0.0, omega_d=-1.0, internal_force=0.0): pass
@@ -98,44 +138,86 @@ class _Resonator:
 
 
 class _ResonatorNetwork:
+    # Dense coupling matrix grown with the node count, like CouplingMatrix
+    # in network.h; out-of-range indices raise as K.at() does.
     def __init__(self):
         self._nodes = []
-        self._matrix = {}
+        self._matrix = np.zeros((0, 0))
         self._time = 0.0
         self._ticks = 0
 
-    def add_node(self, resonator): self._nodes.append(resonator)
+    def add_node(self, resonator):
+        self._nodes.append(resonator)
+        n = len(self._nodes)
+        if n > self._matrix.shape[0]:
+            grown = np.zeros((2 * n, 2 * n))
+            m = self._matrix.shape[0]
+            grown[:m, :m] = self._matrix
+            self._matrix = grown
     def node(self, i): return self._nodes[i]
     def size(self): return len(self._nodes)
-    def coupling(self, i, j): return self._matrix.get((i, j), 0.0)
-    def add_coupling(self, i, j, strength): self._matrix[(i, j)] = strength
-    def set_coupling(self, i, j, strength): self._matrix[(i, j)] = strength
-    def clear_couplings(self): self._matrix.clear()
+    def _check(self, i, j):
+        n = len(self._nodes)
+        if not (0 <= i < n and 0 <= j < n):
+            raise IndexError(f'coupling index ({i}, {j}) out of range for {n} nodes')
+    def coupling(self, i, j): self._check(i, j); return float(self._matrix[i, j])
+    def add_coupling(self, i, j, strength): self._check(i, j); self._matrix[i, j] += strength
+    def set_coupling(self, i, j, strength): self._check(i, j); self._matrix[i, j] = strength
+    def clear_couplings(self): self._matrix[:] = 0.0
+    def coupling_coo(self):
+        n = len(self._nodes)
+        rows, cols = np.nonzero(self._matrix[:n, :n])
+        return (rows.astype(np.uint64), cols.astype(np.uint64),
+                self._matrix[rows, cols])
     def tick_parallel(self, dt): self._time += dt; self._ticks += 1
+    def tick_parallel_n(self, dt, steps): self._time += dt * steps; self._ticks += steps
     def get_state_vector(self): return []
     def time_s(self): return self._time
     def ticks(self): return self._ticks
 
 
-# Build stub pyfeen module with the correct namespace layout
-_ailee_sub = types.ModuleType('pyfeen.ailee')
-_ailee_sub.AileeParams = _AileeParams
-_ailee_sub.AileeSample = _AileeSample
-_ailee_sub.AileeMetric = _AileeMetric
+# Build stub pyfeen module with the correct namespace layout.  A re-import
+# of this file (e.g. under a different module name) reuses the stub it
+# installed the first time instead of allocating a second module pair.
+_pyfeen_stub = sys.modules.get('pyfeen')
+if not getattr(_pyfeen_stub, '_ailee_test_stub', False):
+    _ailee_sub = types.ModuleType('pyfeen.ailee')
+    _ailee_sub.AileeParams = _AileeParams
+    _ailee_sub.AileeSample = _AileeSample
+    _ailee_sub.AileeMetric = _AileeMetric
 
-_pyfeen_stub = types.ModuleType('pyfeen')
-_pyfeen_stub.ailee = _ailee_sub
-_pyfeen_stub.ResonatorConfig = _ResonatorConfig
-_pyfeen_stub.Resonator = _Resonator
-_pyfeen_stub.ResonatorNetwork = _ResonatorNetwork
-_pyfeen_stub.ROOM_TEMP = 293.15
+    _pyfeen_stub = types.ModuleType('pyfeen')
+    _pyfeen_stub._ailee_test_stub = True
+    _pyfeen_stub.ailee = _ailee_sub
+    _pyfeen_stub.ResonatorConfig = _ResonatorConfig
+    _pyfeen_stub.Resonator = _Resonator
+    _pyfeen_stub.ResonatorNetwork = _ResonatorNetwork
+    _pyfeen_stub.ROOM_TEMP = 293.15
 
-sys.modules['pyfeen'] = _pyfeen_stub
-sys.modules['pyfeen.ailee'] = _ailee_sub
+    sys.modules['pyfeen'] = _pyfeen_stub
+    sys.modules['pyfeen.ailee'] = _ailee_sub
 
 # Now import the REST API module (pyfeen is already stubbed)
 import feen_rest_api as _api
 
+# Another test module may have imported feen_rest_api first against its own
+# pyfeen stub, which lacks the AILEE batch/raw entry points; bind ours.
+_api.pyfeen = _pyfeen_stub
+
+# One client shared by every worker thread in the concurrency test, so the
+# test measures contention on the metric lock rather than client set-up.
+# Cookies are off: the jar is the only per-client state requests would share.
+_SHARED_CLIENT = _api.app.test_client(use_cookies=False)
+
+# Sample body the concurrency tests post on every iteration, encoded once.
+_SAMPLE_BODY = _api._dumps({'p_input': 1.0, 'workload': 0.0,
+                            'velocity': 1.0, 'mass': 1.0, 'dt': 0.1})
+
+
+def _json(resp):
+    """Decode a response body directly, skipping Flask's get_json() machinery."""
+    return _loads(resp.data)
+
 
 # ---------------------------------------------------------------------------
 # Test cases
@@ -166,9 +248,13 @@ class TestAileeNamespace(unittest.TestCase):
 class TestAileeMetricEndpoints(unittest.TestCase):
     """Validate REST endpoint behaviour using Flask test client."""
 
+    @classmethod
+    def setUpClass(cls):
+        # The client holds no per-test state, so one serves the whole class.
+        cls.client = _api.app.test_client()
+
     def setUp(self):
         _api.ailee_metric = None  # Reset to uninitialized before each test
-        self.client = _api.app.test_client()
 
     # ------------------------------------------------------------------
     # GET /api/ailee/metric/value — observer
@@ -177,7 +263,7 @@ class TestAileeMetricEndpoints(unittest.TestCase):
     def test_get_value_uninitialized_returns_zero(self):
         resp = self.client.get('/api/ailee/metric/value')
         self.assertEqual(resp.status_code, 200)
-        data = resp.get_json()
+        data = _json(resp)
         self.assertEqual(data['delta_v'], 0.0)
         self.assertEqual(data['status'], 'uninitialized')
 
@@ -228,7 +314,7 @@ class TestAileeMetricEndpoints(unittest.TestCase):
             json={'p_input': 1.0, 'workload': 0.0, 'velocity': 0.0, 'mass': 1.0, 'dt': 1.0}
         )
         self.assertEqual(resp.status_code, 200)
-        data = resp.get_json()
+        data = _json(resp)
         self.assertIn('current_delta_v', data)
         self.assertIsInstance(data['current_delta_v'], float)
 
@@ -240,6 +326,50 @@ class TestAileeMetricEndpoints(unittest.TestCase):
         )
         self.assertEqual(resp.status_code, 200)
 
+    # ------------------------------------------------------------------
+    # POST /api/ailee/metric/samples — batched mutator
+    # ------------------------------------------------------------------
+
+    def test_push_samples_matches_individual_pushes(self):
+        samples = [
+            {'p_input': 1.0, 'workload': 0.0, 'velocity': 1.0, 'mass': 1.0, 'dt': 0.1},
+            {'p_input': 2.0, 'workload': 0.5, 'velocity': 0.2, 'mass': 2.0, 'dt': 0.1},
+        ]
+        for s in samples:
+            self.client.post('/api/ailee/metric/sample', json=s)
+        expected = _api.ailee_metric.delta_v()
+
+        _api.ailee_metric = None
+        resp = self.client.post('/api/ailee/metric/samples', json={'samples': samples})
+        self.assertEqual(resp.status_code, 200)
+        data = _json(resp)
+        self.assertEqual(data['count'], 2)
+        self.assertAlmostEqual(data['current_delta_v'], expected, places=12)
+
+    def test_push_samples_accepts_row_arrays(self):
+        rows = [[1.0, 0.0, 1.0, 1.0, 0.1], [2.0, 0.5, 0.2, 2.0, 0.1],
+                [3.0, 0.0, 0.0, 0.0, 0.1]]  # mass 0 is skipped
+        keys = ('p_input', 'workload', 'velocity', 'mass', 'dt')
+        self.client.post('/api/ailee/metric/samples',
+                         json={'samples': [dict(zip(keys, r)) for r in rows]})
+        expected = _api.ailee_metric.delta_v()
+
+        _api.ailee_metric = None
+        resp = self.client.post('/api/ailee/metric/samples', json={'samples': rows})
+        self.assertEqual(resp.status_code, 200)
+        data = _json(resp)
+        self.assertEqual(data['count'], 3)
+        self.assertAlmostEqual(data['current_delta_v'], expected, places=12)
+
+    def test_push_samples_rejects_short_rows(self):
+        resp = self.client.post('/api/ailee/metric/samples',
+                                json={'samples': [[1.0, 0.0, 1.0]]})
+        self.assertEqual(resp.status_code, 400)
+
+    def test_push_samples_rejects_empty_batch(self):
+        resp = self.client.post('/api/ailee/metric/samples', json={'samples': []})
+        self.assertEqual(resp.status_code, 400)
+
     # ------------------------------------------------------------------
     # POST /api/network/reset — resets metric without replacing it
     # ------------------------------------------------------------------
@@ -255,7 +385,7 @@ class TestAileeMetricEndpoints(unittest.TestCase):
 
 
 class TestAileeThreadSafety(unittest.TestCase):
-    """Verify that _ailee_metric_lock exists and guards concurrent access."""
+    """Verify lock-free metric access and the lazy-init lock."""
 
     def test_lock_attribute_exists(self):
         self.assertTrue(hasattr(_api, '_ailee_metric_lock'),
@@ -268,6 +398,25 @@ class TestAileeThreadSafety(unittest.TestCase):
         self.assertTrue(callable(getattr(lock, 'release', None)),
                         "_ailee_metric_lock must be a threading lock")
 
+    def test_sample_and_value_do_not_wait_on_lock(self):
+        """The lock only guards lazy init; a configured metric is used lock-free."""
+        _SHARED_CLIENT.post('/api/ailee/metric/config',
+                            json={'alpha': 0.1, 'eta': 1.0, 'isp': 1.0, 'v0': 1.0})
+        done = threading.Event()
+
+        def push():
+            _SHARED_CLIENT.post('/api/ailee/metric/sample', data=_SAMPLE_BODY,
+                                content_type='application/json')
+            _SHARED_CLIENT.get('/api/ailee/metric/value')
+            done.set()
+
+        with _api._ailee_metric_lock:
+            t = threading.Thread(target=push)
+            t.start()
+            self.assertTrue(done.wait(2.0),
+                            "Sample push must not block on _ailee_metric_lock")
+        t.join()
+
     def test_concurrent_sample_pushes_do_not_raise(self):
         """Multiple threads pushing samples concurrently must not raise or corrupt state."""
         _api.ailee_metric = None
@@ -275,11 +424,9 @@ class TestAileeThreadSafety(unittest.TestCase):
 
         def push():
             try:
-                client = _api.app.test_client()
                 for _ in range(10):
-                    client.post('/api/ailee/metric/sample',
-                                json={'p_input': 1.0, 'workload': 0.0,
-                                      'velocity': 1.0, 'mass': 1.0, 'dt': 0.1})
+                    _SHARED_CLIENT.post('/api/ailee/metric/sample', data=_SAMPLE_BODY,
+                                        content_type='application/json')
             except Exception as exc:
                 errors.append(exc)
 
@@ -48,10 +48,13 @@ sample_frequencies = _mod.sample_frequencies
 physics_p1 = _mod.physics_p1
 physics_p2 = _mod.physics_p2
 physics_p3 = _mod.physics_p3
+phase_offset_operators = _mod.phase_offset_operators
 observer_o1 = _mod.observer_o1
 observer_o2 = _mod.observer_o2
+observer_o2_series = _mod.observer_o2_series
 run_simulation = _mod.run_simulation
 run_kappa_sweep = _mod.run_kappa_sweep
+run_kappa_sweep_batched = _mod.run_kappa_sweep_batched
 build_artifact_bundle = _mod.build_artifact_bundle
 
 
@@ -63,6 +66,10 @@ def _rng(seed=0):
     return np.random.default_rng(seed)
 
 
+def _dense(M):
+    return M.toarray() if hasattr(M, "toarray") else M
+
+
 def _zero_rng():
     """RNG that returns 0 for standard_normal (zero noise)."""
     class ZeroRng:
@@ -140,6 +147,15 @@ class TestBuildErdosRenyi(unittest.TestCase):
         A = build_erdos_renyi(8, p=0.0, rng=_rng(0))
         np.testing.assert_array_equal(A, np.zeros((8, 8)))
 
+    def test_er_sparse_sampler_density(self):
+        # p below the dense threshold exercises the geometric-skip sampler
+        N, p = 200, 0.05
+        A = build_erdos_renyi(N, p=p, rng=_rng(3))
+        np.testing.assert_array_equal(A, A.T)
+        np.testing.assert_array_equal(np.diag(A), np.zeros(N))
+        density = A.sum() / (N * (N - 1))
+        self.assertAlmostEqual(density, p, delta=0.01)
+
 
 class TestPhaseOffsets(unittest.TestCase):
 
@@ -154,6 +170,32 @@ class TestPhaseOffsets(unittest.TestCase):
         phi = build_phase_offsets_ring(8, phi0=1.0, mode="zero")
         np.testing.assert_array_equal(phi, np.zeros((8, 8)))
 
+    def test_prepare_graph_is_cached_and_read_only(self):
+        cfg = {"topology": "small_world", "N": 30, "plugin": "P3", "phi0": 0.2}
+        first = _mod._prepare_graph(cfg)
+        self.assertIs(_mod._prepare_graph(dict(cfg, kappa=3.0, seed=9)), first)
+        self.assertIsNot(_mod._prepare_graph(dict(cfg, topo_seed=1)), first)
+        A = first[0]
+        with self.assertRaises(ValueError):
+            A.data[0] = 2.0
+        # Unseeded topologies are rebuilt every time.
+        self.assertIsNone(_mod._graph_key(dict(cfg, topo_seed=None)))
+
+    def test_build_graph_sparse_matches_dense_builders(self):
+        cases = [
+            ({"topology": "ring", "N": 40}, lambda: build_ring(40)),
+            ({"topology": "erdos_renyi", "N": 60, "er_p": 0.05, "topo_seed": 2},
+             lambda: build_erdos_renyi(60, p=0.05, rng=_rng(2))),
+            ({"topology": "small_world", "N": 50, "sw_beta": 0.4, "topo_seed": 3},
+             lambda: build_small_world(50, k=4, beta=0.4, rng=_rng(3))),
+        ]
+        for cfg, dense in cases:
+            with self.subTest(topology=cfg["topology"]):
+                A, phi = build_graph(dict(cfg, phi0=0.4))
+                np.testing.assert_array_equal(_dense(A), dense())
+                np.testing.assert_array_equal(
+                    _dense(phi), build_phase_offsets_ring(cfg["N"], 0.4))
+
 
 # ---------------------------------------------------------------------------
 # Frequency distribution tests
@@ -225,6 +267,30 @@ class TestPhysicsP1(unittest.TestCase):
         dtheta = physics_p1(theta, omega, A, phi, params, _rng(0))
         self.assertAlmostEqual(dtheta[0], -dtheta[1], places=10)
 
+    def test_p1_mean_field_operator_matches_dense(self):
+        N = 12
+        theta = _rng(4).uniform(-math.pi, math.pi, N)
+        omega = np.linspace(-1.0, 1.0, N)
+        phi = np.zeros((N, N))
+        params = {"kappa": 1.7, "sigma": 0.0}
+        mean_field = _mod._MeanFieldCoupling(N)
+        dense = (np.ones((N, N)) - np.eye(N)) / (N - 1)
+        np.testing.assert_allclose(
+            physics_p1(theta, omega, mean_field, phi, params, None),
+            physics_p1(theta, omega, dense, phi, params, None),
+            atol=1e-12)
+
+    def test_mean_field_coupling_sums_match_dense(self):
+        N = 9
+        theta = _rng(6).uniform(-math.pi, math.pi, N)
+        sin_t, cos_t = np.sin(theta), np.cos(theta)
+        mean_field = _mod._MeanFieldCoupling(N)
+        dense = mean_field.toarray()
+        for coupling in (_mod._sin_coupling, _mod._cos_coupling):
+            np.testing.assert_allclose(
+                coupling(mean_field, sin_t, cos_t),
+                coupling(dense, sin_t, cos_t), atol=1e-12)
+
 
 class TestPhysicsP2(unittest.TestCase):
 
@@ -255,6 +321,22 @@ class TestPhysicsP2(unittest.TestCase):
         # ṁᵢ = -mᵢ/τₘ + 0 = -0.4
         np.testing.assert_array_almost_equal(dmemory, -memory / 5.0)
 
+    def test_p2_writes_into_out_buffers(self):
+        N = 6
+        theta = np.random.default_rng(2).uniform(-math.pi, math.pi, N)
+        omega = np.linspace(-1.0, 1.0, N)
+        memory = np.full(N, 0.3)
+        A = build_ring(N)
+        phi = np.zeros((N, N))
+        params = {"kappa": 1.2, "sigma": 0.0, "eta": 0.5, "tau_m": 5.0}
+        expected = physics_p2(theta, omega, memory, A, phi, params, _rng(0))
+        out = (np.empty(N), np.empty(N))
+        result = physics_p2(theta, omega, memory, A, phi, params, _rng(0), out=out)
+        self.assertIs(result[0], out[0])
+        self.assertIs(result[1], out[1])
+        np.testing.assert_array_equal(result[0], expected[0])
+        np.testing.assert_array_equal(result[1], expected[1])
+
 
 class TestPhysicsP3(unittest.TestCase):
 
@@ -271,6 +353,24 @@ class TestPhysicsP3(unittest.TestCase):
         dtheta_p3 = physics_p3(theta, omega, A, phi, params, _rng(0))
         np.testing.assert_array_almost_equal(dtheta_p1, dtheta_p3)
 
+    def test_p3_matches_direct_pairwise_sum(self):
+        """Matvec form equals the explicit Σⱼ Aᵢⱼ sin(θⱼ − θᵢ + φᵢⱼ)."""
+        N = 12
+        rng = _rng(3)
+        theta = rng.uniform(-math.pi, math.pi, N)
+        omega = rng.normal(0.0, 0.5, N)
+        A = build_small_world(N, k=4, beta=0.3, rng=_rng(1))
+        phi = build_phase_offsets_ring(N, 0.4, mode="random")
+        params = {"kappa": 1.3, "sigma": 0.0}
+        diff = theta[np.newaxis, :] - theta[:, np.newaxis]
+        expected = omega + 1.3 * np.sum(A * np.sin(diff + phi), axis=1)
+        np.testing.assert_allclose(
+            physics_p3(theta, omega, A, phi, params, _rng(0)), expected, atol=1e-12)
+        np.testing.assert_allclose(
+            physics_p3(theta, omega, A, phi, params, _rng(0),
+                       offsets=phase_offset_operators(A, phi)),
+            expected, atol=1e-12)
+
 
 # ---------------------------------------------------------------------------
 # Observer tests
@@ -328,6 +428,13 @@ class TestObserverO2(unittest.TestCase):
         result = observer_o2(history, window=10)
         self.assertGreater(result, 0.1)
 
+    def test_series_matches_prefix_calls(self):
+        R = np.random.default_rng(5).uniform(0.0, 1.0, 40)
+        R[10:25] = 0.0  # zero baselines → ΔΦ = 0
+        series = observer_o2_series(R, window=10)
+        expected = [observer_o2(list(R[:n + 1]), window=10) for n in range(len(R))]
+        np.testing.assert_array_equal(series, expected)
+
 
 # ---------------------------------------------------------------------------
 # Full simulation tests (Phase-1 expected behaviors, HLV.md §A.5)
@@ -368,6 +475,14 @@ class TestRunSimulationStructure(unittest.TestCase):
         for field in ("t", "R", "psi", "sigma_theta", "delta_phi"):
             self.assertIn(field, row)
 
+    def test_metrics_view_matches_rows(self):
+        metrics = self._run()["metrics"]
+        rows = metrics.rows()
+        self.assertEqual(list(metrics), rows)
+        self.assertEqual(metrics[-1], rows[-1])
+        self.assertEqual((metrics[:3] + metrics[-3:]).rows(), rows[:3] + rows[-3:])
+        self.assertEqual(np.asarray(metrics).shape, (len(rows), len(_mod.METRIC_FIELDS)))
+
     def test_summary_has_required_fields(self):
         result = self._run()
         s = result["summary"]
@@ -383,6 +498,16 @@ class TestRunSimulationStructure(unittest.TestCase):
         result = self._run(plugin="P3", phi0=0.3, offset_mode="chiral")
         self.assertEqual(result["summary"]["plugin"], "P3")
 
+    def test_rk4_p2_p3_beat_euler(self):
+        for plugin in ("P2", "P3"):
+            with self.subTest(plugin=plugin):
+                base = {"plugin": plugin, "t_end": 5.0, "kappa": 1.5,
+                        "phi0": 0.4, "eta": 0.5, "tau_m": 2.0}
+                ref = self._run(dt=0.001, integrator="rk4", **base)["metrics"][-1]["R"]
+                rk4 = self._run(dt=0.1, integrator="rk4", **base)["metrics"][-1]["R"]
+                euler = self._run(dt=0.1, **base)["metrics"][-1]["R"]
+                self.assertLess(abs(rk4 - ref) * 10, abs(euler - ref))
+
     def test_o2_observer_runs(self):
         result = self._run(observers=["O1", "O2"])
         row = result["metrics"][-1]
@@ -483,6 +608,103 @@ class TestNT4DeterministicReproducibility(unittest.TestCase):
             places=6,
         )
 
+    def test_sfc64_bit_generator_is_opt_in_and_reproducible(self):
+        cfg = {**FAST_SIM_CFG, "kappa": 1.5, "sigma": 0.1, "seed": 3}
+        sfc = {**cfg, "bit_generator": "sfc64"}
+        self.assertEqual(run_simulation(sfc)["metrics"], run_simulation(sfc)["metrics"])
+        self.assertEqual(run_simulation({**cfg, "bit_generator": "pcg64"})["metrics"],
+                         run_simulation(cfg)["metrics"])
+        self.assertNotEqual(run_simulation(sfc)["metrics"], run_simulation(cfg)["metrics"])
+        with self.assertRaises(ValueError):
+            run_simulation({**cfg, "bit_generator": "mt19937"})
+
+
+class TestWrapPhases(unittest.TestCase):
+
+    def test_matches_modulo_wrap(self):
+        near = _rng(8).uniform(-1.5 * math.pi, 1.5 * math.pi, 64)
+        far = near * 5.0  # beyond ±2π: takes the modulo fallback
+        for theta in (near, far, np.array([math.pi, -math.pi, 0.0])):
+            expected = (theta + math.pi) % (2 * math.pi) - math.pi
+            wrapped = _mod._wrap_phases(theta.copy())
+            self.assertTrue(np.all((wrapped >= -math.pi) & (wrapped < math.pi)))
+            np.testing.assert_allclose(wrapped, expected, atol=1e-12)
+
+
+class TestNoiseRows(unittest.TestCase):
+
+    def test_blocks_match_per_step_draws(self):
+        # max_values=10 with N=4 forces blocks of two rows plus a short tail
+        rows = [row.copy() for row in
+                _mod._noise_rows(_rng(7), 5, 4, scale=0.3, max_values=10)]
+        ref = _rng(7)
+        self.assertEqual(len(rows), 5)
+        for row in rows:
+            np.testing.assert_array_equal(row, 0.3 * ref.standard_normal(4))
+
+
+@unittest.skipUnless(_mod._NUMBA_AVAILABLE, "numba not installed")
+class TestCompiledEulerLoop(unittest.TestCase):
+    """The Numba kernels must reproduce the NumPy Euler and RK4 loops."""
+
+    def _compare(self, **overrides):
+        cfg = {**FAST_SIM_CFG, "kappa": 1.5, "sigma": 0.05,
+               "observers": ["O1", "O2"], **overrides}
+        compiled = run_simulation(cfg)["metrics"]
+        _mod._NUMBA_AVAILABLE = False
+        try:
+            reference = run_simulation(cfg)["metrics"]
+        finally:
+            _mod._NUMBA_AVAILABLE = True
+        self.assertEqual(len(compiled), len(reference))
+        for a, b in zip(compiled, reference):
+            self.assertEqual(a.keys(), b.keys())
+            for key in a:
+                self.assertAlmostEqual(a[key], b[key], places=9)
+
+    def test_p1_matches_python_loop(self):
+        self._compare(plugin="P1")
+
+    def test_p2_matches_python_loop(self):
+        self._compare(plugin="P2", eta=0.5, tau_m=2.0)
+
+    def test_p3_matches_python_loop(self):
+        self._compare(plugin="P3", topology="small_world")
+
+    def test_rk4_matches_python_loop(self):
+        self._compare(plugin="P2", integrator="rk4", sigma=0.0, eta=0.5, tau_m=2.0)
+        self._compare(plugin="P3", integrator="rk4", sigma=0.0,
+                      topology="small_world")
+
+    def test_csr_coupling_kernel_matches_operator_path(self):
+        A = _mod._coupling_operator(build_ring(16))
+        self.assertTrue(_mod._compiled_csr(A))
+        theta = _rng(2).uniform(-math.pi, math.pi, 16)
+        sin_t, cos_t = np.sin(theta), np.cos(theta)
+        compiled = (_mod._sin_coupling(A, sin_t, cos_t),
+                    _mod._cos_coupling(A, sin_t, cos_t))
+        _mod._NUMBA_AVAILABLE = False
+        try:
+            reference = (_mod._sin_coupling(A, sin_t, cos_t),
+                         _mod._cos_coupling(A, sin_t, cos_t))
+        finally:
+            _mod._NUMBA_AVAILABLE = True
+        np.testing.assert_array_equal(compiled[0], reference[0])
+        np.testing.assert_array_equal(compiled[1], reference[1])
+
+    def test_noisy_kernel_resumes_across_noise_blocks(self):
+        """Splitting the noise into small blocks must not change the run."""
+        cfg = {**FAST_SIM_CFG, "plugin": "P2", "kappa": 1.5, "sigma": 0.1,
+               "eta": 0.5, "tau_m": 2.0}
+        whole = run_simulation(cfg)["metrics"]
+        saved = _mod.NOISE_BLOCK_VALUES
+        _mod.NOISE_BLOCK_VALUES = 3 * cfg["N"] + 1  # 3 rows, uneven last block
+        try:
+            blocked = run_simulation(cfg)["metrics"]
+        finally:
+            _mod.NOISE_BLOCK_VALUES = saved
+        self.assertEqual(blocked, whole)
+
 
 # ---------------------------------------------------------------------------
 # Perturbation injection tests
@@ -520,6 +742,17 @@ class TestPerturbationInjection(unittest.TestCase):
         self.assertGreater(len(result["events"]), 0)
         self.assertEqual(result["events"][0]["type"], "phase_kick")
 
+    def test_omega_rekick_extends_to_latest_end(self):
+        """Re-kicking a node moves its expiry; the earlier end is ignored."""
+        kick = {"type": "omega_kick", "node": 2, "amplitude": 1.0}
+        cfg = {**FAST_SIM_CFG, "t_end": 6.0}
+        rekicked = run_simulation({**cfg, "inject_events": [
+            {**kick, "time": 1.0, "duration": 1.0},
+            {**kick, "time": 1.5, "duration": 2.0}]})
+        single = run_simulation({**cfg, "inject_events": [
+            {**kick, "time": 1.0, "duration": 2.5}]})
+        self.assertEqual(rekicked["metrics"], single["metrics"])
+
 
 # ---------------------------------------------------------------------------
 # Artifact bundle tests
@@ -548,6 +781,12 @@ class TestArtifactBundle(unittest.TestCase):
         self.assertIn("R", first_line)
         self.assertIn("psi", first_line)
 
+    def test_metrics_array_and_rows_give_same_bundle(self):
+        bundle, result = self._bundle(observers=["O1", "O2"])
+        array_result = {**result, "metrics": np.array(
+            [[row[f] for f in _mod.METRIC_FIELDS] for row in result["metrics"]])}
+        self.assertEqual(build_artifact_bundle(array_result), bundle)
+
     def test_hash_is_sha256_hex(self):
         bundle, _ = self._bundle()
         h = bundle["hash.txt"]
@@ -564,6 +803,22 @@ class TestArtifactBundle(unittest.TestCase):
         bundle2, _ = self._bundle(kappa=2.0, seed=5)
         self.assertEqual(bundle1["hash.txt"], bundle2["hash.txt"])
 
+    def test_config_records_integration_engine(self):
+        bundle, _ = self._bundle(inject_events=[
+            {"time": 1.0, "type": "phase_kick", "node": 0, "amplitude": 0.1}])
+        self.assertEqual(json.loads(bundle["config.json"])["engine"], "numpy")
+
+    @unittest.skipUnless(_mod._NUMBA_AVAILABLE, "numba not installed")
+    def test_hash_differs_between_engines(self):
+        compiled, _ = self._bundle(kappa=1.5, sigma=0.05)
+        _mod._NUMBA_AVAILABLE = False
+        try:
+            reference, _ = self._bundle(kappa=1.5, sigma=0.05)
+        finally:
+            _mod._NUMBA_AVAILABLE = True
+        self.assertEqual(json.loads(compiled["config.json"])["engine"], "numba")
+        self.assertNotEqual(compiled["hash.txt"], reference["hash.txt"])
+
 
 # ---------------------------------------------------------------------------
 # κ-sweep tests
@@ -597,6 +852,75 @@ class TestKappaSweep(unittest.TestCase):
         self.assertIn(2.0, kappas)
         self.assertIn(3.0, kappas)
 
+    def test_batched_sweep_matches_per_run_sweep(self):
+        for plugin in ("P1", "P2", "P3"):
+            with self.subTest(plugin=plugin):
+                cfg = {**FAST_SIM_CFG, "plugin": plugin, "sigma": 0.1,
+                       "phi0": 0.3, "topology": "small_world",
+                       "kappa_min": 0.0, "kappa_max": 2.0, "kappa_step": 1.0,
+                       "num_seeds": 2, "workers": 1}
+                per_run = run_kappa_sweep(cfg)
+                batched = run_kappa_sweep_batched(cfg)
+                self.assertEqual(batched["kappa_values"], per_run["kappa_values"])
+                for a, b in zip(batched["results"], per_run["results"]):
+                    self.assertAlmostEqual(a["mean_R"], b["mean_R"], places=9)
+                    self.assertEqual(a["n_locked"], b["n_locked"])
+
+    @unittest.skipIf(importlib.util.find_spec("cupy") is not None, "cupy installed")
+    def test_gpu_sweep_without_cupy_raises_import_error(self):
+        cfg = {**FAST_SIM_CFG, "kappa_min": 0.0, "kappa_max": 1.0,
+               "kappa_step": 1.0, "num_seeds": 1, "device": "gpu"}
+        with self.assertRaises(ImportError):
+            run_kappa_sweep_batched(cfg)
+
+    @unittest.skipUnless(hasattr(os, "fork"), "fork start method required")
+    def test_sweep_process_pool_matches_serial(self):
+        from unittest.mock import patch
+        cfg = {**FAST_SIM_CFG, "kappa_min": 0.0, "kappa_max": 2.0,
+               "kappa_step": 1.0, "num_seeds": 2, "seed_base": 0}
+        serial = run_kappa_sweep({**cfg, "workers": 1})
+        # Workers resolve _sweep_summary by module name, as they do for
+        # plugins loaded through PluginRegistry.
+        sys.modules[_mod.__name__] = _mod
+        try:
+            self.assertIsNotNone(_mod._sweep_pool_context())
+            with patch.object(_mod.os, "cpu_count", return_value=2):
+                parallel = run_kappa_sweep({**cfg, "workers": 2})
+        finally:
+            sys.modules.pop(_mod.__name__, None)
+        self.assertEqual(serial["results"], parallel["results"])
+
+    @unittest.skipUnless(_mod._NUMBA_AVAILABLE, "numba not installed")
+    def test_sweep_thread_fallback_matches_serial(self):
+        from unittest.mock import patch
+        # _mod is not registered in sys.modules, so no process pool is
+        # usable and the GIL-free compiled loop runs on threads instead.
+        self.assertIsNone(_mod._sweep_pool_context())
+        cfg = {**FAST_SIM_CFG, "kappa_min": 0.0, "kappa_max": 2.0,
+               "kappa_step": 1.0, "num_seeds": 2, "seed_base": 0}
+        serial = run_kappa_sweep({**cfg, "workers": 1})
+        with patch.object(_mod.os, "cpu_count", return_value=3):
+            threaded = run_kappa_sweep({**cfg, "workers": 3})
+        self.assertEqual(serial["results"], threaded["results"])
+
+    @unittest.skipUnless(_mod._NUMBA_AVAILABLE, "numba not installed")
+    def test_sweep_workers_capped_at_cpu_count(self):
+        """A huge ``workers`` value must not start one thread per task."""
+        from unittest.mock import patch
+        cfg = {**FAST_SIM_CFG, "kappa_min": 0.0, "kappa_max": 2.0,
+               "kappa_step": 1.0, "num_seeds": 3, "workers": 100000}
+        sizes = []
+        real_pool = _mod.ThreadPoolExecutor
+
+        def spy(max_workers):
+            sizes.append(max_workers)
+            return real_pool(max_workers=max_workers)
+
+        with patch.object(_mod.os, "cpu_count", return_value=2), \
+                patch.object(_mod, "ThreadPoolExecutor", spy):
+            run_kappa_sweep(cfg)
+        self.assertEqual(sizes, [2])
+
 
 # ---------------------------------------------------------------------------
 # Flask Blueprint endpoint tests
@@ -621,6 +945,15 @@ class TestHLVBlueprint(unittest.TestCase):
         app.register_blueprint(bp)
         cls.client = app.test_client()
         cls.app = app
+        # One run up front compiles the kernels outside any single test and
+        # gives the artifact tests a result without re-simulating each time.
+        cls.client.post("/api/hlv/run", json=FAST_SIM_CFG,
+                        content_type="application/json")
+        cls.result = _mod._latest_result
+
+    def _restore_result(self):
+        """Make the setUpClass run the latest result (tests may clear it)."""
+        _mod._latest_result = self.result
 
     def test_status_endpoint(self):
         resp = self.client.get("/api/hlv/status")
@@ -660,14 +993,29 @@ class TestHLVBlueprint(unittest.TestCase):
         self.assertIn("summary", data)
 
     def test_artifacts_endpoint_after_run(self):
-        self.client.post("/api/hlv/run", json=FAST_SIM_CFG,
-                         content_type="application/json")
+        self._restore_result()
         resp = self.client.get("/api/hlv/artifacts")
         self.assertEqual(resp.status_code, 200)
         bundle = resp.get_json()
         self.assertIn("hash.txt", bundle)
         self.assertEqual(len(bundle["hash.txt"]), 64)
 
+    def test_artifacts_encoded_once_per_result(self):
+        from unittest.mock import patch
+
+        self._restore_result()
+        _mod._artifact_cache = (None, {})
+        with patch.object(_mod, "_artifact_files", wraps=_mod._artifact_files) as spy:
+            first = self.client.get("/api/hlv/artifacts").get_json()
+            self.client.get("/api/hlv/artifacts/download")
+            self.assertEqual(spy.call_count, 1)
+            self.client.post("/api/hlv/run", json={**FAST_SIM_CFG, "seed": 5},
+                             content_type="application/json")
+            second = self.client.get("/api/hlv/artifacts").get_json()
+            self.assertEqual(spy.call_count, 2)
+        self.assertNotEqual(first["hash.txt"], second["hash.txt"])
+        self.assertEqual(first, build_artifact_bundle(self.result))
+
     def test_inject_endpoint(self):
         ev = {"type": "phase_kick", "node": "all", "amplitude": 0.5, "time": 5.0}
         resp = self.client.post(
@@ -692,6 +1040,18 @@ class TestHLVBlueprint(unittest.TestCase):
         self.assertIn("results", data)
         self.assertGreater(len(data["results"]), 0)
 
+    def test_sweep_endpoint_never_forks(self):
+        from unittest.mock import patch
+        cfg = {**FAST_SIM_CFG, "kappa_min": 0.0, "kappa_max": 2.0,
+               "kappa_step": 1.0, "num_seeds": 2, "workers": 4}
+        with patch.object(_mod.os, "cpu_count", return_value=4), \
+                patch.object(_mod, "_sweep_pool_context") as pool_context, \
+                patch.object(_mod, "ProcessPoolExecutor") as pool:
+            resp = self.client.post("/api/hlv/sweep", json=cfg)
+        self.assertEqual(resp.status_code, 200)
+        pool_context.assert_not_called()
+        pool.assert_not_called()
+
     def test_sweep_results_endpoint_after_sweep(self):
         cfg = {**FAST_SIM_CFG, "kappa_min": 0.0, "kappa_max": 1.0,
                "kappa_step": 1.0, "num_seeds": 1}
@@ -703,8 +1063,7 @@ class TestHLVBlueprint(unittest.TestCase):
     def test_artifacts_download_endpoint_returns_zip(self):
         """GET /api/hlv/artifacts/download returns a valid ZIP after a run."""
         import zipfile as _zipfile
-        self.client.post("/api/hlv/run", json=FAST_SIM_CFG,
-                         content_type="application/json")
+        self._restore_result()
         resp = self.client.get("/api/hlv/artifacts/download")
         self.assertEqual(resp.status_code, 200)
         self.assertEqual(resp.content_type, "application/zip")
@@ -726,8 +1085,7 @@ class TestHLVBlueprint(unittest.TestCase):
 
     def test_artifacts_email_missing_recipient(self):
         """POST /api/hlv/artifacts/email returns 400 when 'to' is absent."""
-        self.client.post("/api/hlv/run", json=FAST_SIM_CFG,
-                         content_type="application/json")
+        self._restore_result()
         resp = self.client.post(
             "/api/hlv/artifacts/email",
             json={},
@@ -748,8 +1106,7 @@ class TestHLVBlueprint(unittest.TestCase):
 
     def test_artifacts_email_smtp_failure_returns_502(self):
         """POST /api/hlv/artifacts/email returns 502 when SMTP is unreachable."""
-        self.client.post("/api/hlv/run", json=FAST_SIM_CFG,
-                         content_type="application/json")
+        self._restore_result()
         resp = self.client.post(
             "/api/hlv/artifacts/email",
             json={
@@ -765,8 +1122,7 @@ class TestHLVBlueprint(unittest.TestCase):
     def test_artifacts_email_env_var_smtp_host(self):
         """FEEN_SMTP_HOST env var is used when smtp_host not provided in request."""
         from unittest.mock import patch
-        self.client.post("/api/hlv/run", json=FAST_SIM_CFG,
-                         content_type="application/json")
+        self._restore_result()
         with patch.dict(os.environ, {"FEEN_SMTP_HOST": "testhost.invalid",
                                      "FEEN_SMTP_PORT": "9"}):
             resp = self.client.post(
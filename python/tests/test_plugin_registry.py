@@ -11,12 +11,18 @@ These tests validate:
   • Flask Blueprint registration from active plugins
 """
 
+import importlib
+import importlib.util
+import json
 import os
 import sys
+import tempfile
 import textwrap
 import types
 import unittest
 
+import numpy as np
+
 # Ensure the python/ directory is on the path for direct test execution.
 _HERE = os.path.dirname(os.path.abspath(__file__))
 _PYTHON_DIR = os.path.dirname(_HERE)
@@ -26,10 +32,13 @@ if _PYTHON_DIR not in sys.path:
 from plugin_registry import (
     FEEN_PLUGIN_API_VERSION,
     ObserverBoundaryViolation,
+    PluginEntry,
     PluginManifest,
     PluginRegistry,
     PluginState,
     PluginType,
+    dumps,
+    loads,
 )
 
 
@@ -78,6 +87,16 @@ class TestPluginManifest(unittest.TestCase):
         self.assertEqual(m.plugin_type, PluginType.OBSERVER)
         self.assertTrue(m.is_api_compatible())
 
+    def test_to_json_matches_to_dict(self):
+        m = PluginManifest(name="my_obs", version=(1, 2, 3),
+                           plugin_type=PluginType.OBSERVER, description="test")
+        self.assertEqual(loads(m.to_json()), m.to_dict())
+        self.assertIs(m.to_json(), m.to_json())
+
+    def test_dumps_accepts_numpy_and_non_str_keys(self):
+        body = dumps({"b": np.arange(2), 1: np.float64(0.5)}, sort_keys=True)
+        self.assertEqual(body, b'{"1":0.5,"b":[0,1]}')
+
     def test_invalid_name_raises(self):
         with self.assertRaises(ValueError):
             PluginManifest(name="bad name!", version=(1,), plugin_type=PluginType.UI,
@@ -130,7 +149,6 @@ class TestPluginLifecycle(unittest.TestCase):
         manifest = PluginManifest(name=name, version=(1,), plugin_type=plugin_type, description="t")
         mod = _make_module(name, manifest, with_hooks=with_hooks)
         # Inject directly into registry internal state for unit testing.
-        from plugin_registry import PluginEntry
         entry = PluginEntry(manifest, mod)
         reg._plugins[name] = entry
         return reg, name
@@ -186,7 +204,6 @@ class TestPluginLifecycle(unittest.TestCase):
         for nm in ("p1", "p2"):
             manifest = PluginManifest(name=nm, version=(1,), plugin_type=PluginType.UI, description="x")
             mod = _make_module(nm, manifest)
-            from plugin_registry import PluginEntry
             reg._plugins[nm] = PluginEntry(manifest, mod)
         reg.activate_all()
         for nm in ("p1", "p2"):
@@ -241,7 +258,6 @@ class TestFailureIsolation(unittest.TestCase):
         self.assertIsNotNone(entry.error)
 
     def test_load_module_without_manifest_returns_failed(self):
-        import tempfile
         with tempfile.TemporaryDirectory() as tmp:
             path = _write_plugin_file(tmp, "# No MANIFEST here\n")
             reg = PluginRegistry()
@@ -249,7 +265,6 @@ class TestFailureIsolation(unittest.TestCase):
             self.assertEqual(entry.state, PluginState.FAILED)
 
     def test_load_incompatible_api_version_fails(self):
-        import tempfile
         content = textwrap.dedent("""\
             import sys, os
             sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'python'))
@@ -275,7 +290,6 @@ class TestFailureIsolation(unittest.TestCase):
         def bad_activate(): raise RuntimeError("boom")
         mod.activate = bad_activate
 
-        from plugin_registry import PluginEntry
         entry = PluginEntry(manifest, mod)
         reg._plugins["bad_act"] = entry
         reg.register_plugin("bad_act")
@@ -283,6 +297,24 @@ class TestFailureIsolation(unittest.TestCase):
         self.assertFalse(ok)
         self.assertEqual(entry.state, PluginState.FAILED)
 
+    def test_active_blueprints_track_transitions(self):
+        reg = PluginRegistry()
+        manifest = PluginManifest(name="bp_plugin", version=(1,), plugin_type=PluginType.UI, description="x")
+        mod = types.ModuleType("bp_plugin")
+        mod.MANIFEST = manifest
+        bp = object()
+        mod.get_blueprint = lambda: bp
+
+        reg._plugins["bp_plugin"] = PluginEntry(manifest, mod)
+        reg.activate_all()
+        self.assertEqual(reg.active_blueprints(), [bp])
+        reg.deactivate_plugin("bp_plugin")
+        self.assertEqual(reg.active_blueprints(), [])
+        reg.activate_plugin("bp_plugin")
+        self.assertEqual(reg.active_blueprints(), [bp])
+        reg.unload_plugin("bp_plugin")
+        self.assertEqual(reg.active_blueprints(), [])
+
     def test_failed_plugin_does_not_appear_in_active_blueprints(self):
         reg = PluginRegistry()
         entry_fail = reg.load_plugin("/nonexistent.py")
@@ -315,6 +347,37 @@ class TestBuiltinPlugins(unittest.TestCase):
         self.assertNotEqual(entry.state, PluginState.FAILED, entry.error)
         self.assertEqual(entry.manifest.plugin_type, PluginType.OBSERVER)
 
+    def test_reloading_plugin_reuses_module(self):
+        path = os.path.join(self._PLUGINS_DIR, "ui_dashboard.py")
+        first = PluginRegistry().load_plugin(path)
+        again = PluginRegistry().load_plugin(path)
+        self.assertIs(first.module, again.module)
+        fresh = PluginRegistry().load_plugin(path, reload=True)
+        self.assertIsNot(fresh.module, first.module)
+        PluginRegistry.invalidate_module_cache()
+        after = PluginRegistry().load_plugin(path)
+        self.assertIsNot(after.module, fresh.module)
+
+    def test_edited_plugin_file_is_reimported(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = _write_plugin_file(tmp, "VALUE = 1\n")
+            first = PluginRegistry().load_plugin(path)
+            self.assertIs(PluginRegistry().load_plugin(path).module, first.module)
+            _write_plugin_file(tmp, "VALUE = 2\n")
+            stat = os.stat(path)
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            edited = PluginRegistry().load_plugin(path)
+            self.assertEqual(edited.module.VALUE, 2)
+
+    def test_unloaded_plugin_is_reimported(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = _write_plugin_file(tmp, "VALUE = 1\n")
+            reg = PluginRegistry()
+            first = reg.load_plugin(path)
+            self.assertTrue(reg.unload_plugin(first.manifest.name))
+            again = reg.load_plugin(path)
+            self.assertIsNot(again.module, first.module)
+
     def test_all_builtin_plugins_activate(self):
         reg = PluginRegistry()
         for fname in ("ui_dashboard.py", "observer_logger.py", "hardware_monitor.py"):
@@ -333,21 +396,99 @@ class TestBuiltinPlugins(unittest.TestCase):
         self.assertEqual(len(bps), 3)
 
     def test_observer_logger_poll(self):
-        import importlib.util
         spec = importlib.util.spec_from_file_location(
             "feen_plugin_observer_logger_test",
             os.path.join(self._PLUGINS_DIR, "observer_logger.py"),
         )
         mod = importlib.util.module_from_spec(spec)
         spec.loader.exec_module(mod)
-        mod.poll([{"id": 0, "energy": 1.5, "snr": 20.0}])
+        mod.poll([{"id": 0, "energy": 1.5, "snr": 20.0}, {"id": 1, "energy": None}])
         # Access internal _log via module attribute (white-box)
         log = list(mod._log)
         self.assertEqual(len(log), 1)
-        self.assertEqual(log[0]["nodes"][0]["id"], 0)
+        self.assertEqual(log[0].ids, [0, 1])
+        self.assertAlmostEqual(log[0].energy[0], 1.5)
+        nodes = mod._entry_payload(log[0])["nodes"]
+        self.assertEqual(nodes[0], {"id": 0, "energy": 1.5, "snr": 20.0})
+        self.assertEqual(nodes[1], {"id": 1, "energy": None, "snr": None})
+
+    def test_observer_logger_log_streams_ndjson(self):
+        from flask import Flask
+        entry = PluginRegistry().load_plugin(
+            os.path.join(self._PLUGINS_DIR, "observer_logger.py"), reload=True)
+        mod = entry.module
+        app = Flask("observer_log_test")
+        app.register_blueprint(mod.get_blueprint())
+        client = app.test_client()
+        mod.poll([{"id": 0, "energy": 1.5, "snr": 20.0}])
+        mod.poll([{"id": 0, "energy": 1.25, "snr": 20.0}])
+
+        resp = client.get("/plugins/observer_logger/log")
+        self.assertEqual(resp.mimetype, "application/x-ndjson")
+        lines = [json.loads(line) for line in resp.data.splitlines()]
+        self.assertEqual([l["nodes"][0]["energy"] for l in lines], [1.5, 1.25])
+
+        envelope = client.get("/plugins/observer_logger/log?format=json").get_json()
+        self.assertEqual(envelope["count"], 2)
+        self.assertEqual(envelope["entries"], lines)
+        info = client.get("/plugins/observer_logger/info").get_json()
+        self.assertEqual(info, mod.MANIFEST.to_dict())
+        mod.unload()
+
+    def test_observer_logger_ring_keeps_newest_entries(self):
+        entry = PluginRegistry().load_plugin(
+            os.path.join(self._PLUGINS_DIR, "observer_logger.py"), reload=True)
+        ring = entry.module._ColumnLog(3, max_nodes=4)
+        for i in range(5):
+            ring.append(float(i), [i], np.array([float(i)]), np.array([np.nan]))
+        self.assertEqual(len(ring), 3)
+        self.assertEqual([e.ids for e in ring.snapshot()], [[2], [3], [4]])
+        ring.clear()
+        self.assertEqual(ring.snapshot(), [])
+
+    def test_observer_logger_read_retries_across_a_write(self):
+        entry = PluginRegistry().load_plugin(
+            os.path.join(self._PLUGINS_DIR, "observer_logger.py"), reload=True)
+        ring = entry.module._ColumnLog(4, max_nodes=4)
+        calls = []
+
+        def copy():
+            # The first copy overlaps a poll, as if the writer ran mid-read.
+            calls.append(len(ring))
+            if len(calls) == 1:
+                ring.append(1.0, [0], np.array([1.0]), np.array([1.0]))
+            return len(ring)
+
+        self.assertEqual(ring._read(copy), 1)
+        self.assertEqual(calls, [0, 1])
+        self.assertEqual(ring._seq % 2, 0)
+
+    def test_observer_logger_energy_range(self):
+        from flask import Flask
+        entry = PluginRegistry().load_plugin(
+            os.path.join(self._PLUGINS_DIR, "observer_logger.py"), reload=True)
+        mod = entry.module
+        mod.poll([{"id": 0, "energy": 1.0}])
+        mod.poll([{"id": 0, "energy": 5.0}, {"id": 1, "energy": -2.0}])
+        mod.poll([{"id": 0, "energy": None}, {"id": 1, "energy": 3.0}])
+        self.assertEqual(mod._log.energy.shape[1], 2)
+        self.assertEqual(list(mod._log)[0].energy.tolist(), [1.0])
+
+        app = Flask("observer_range_test")
+        app.register_blueprint(mod.get_blueprint())
+        client = app.test_client()
+        url = "/plugins/observer_logger/log/energy_range"
+        self.assertEqual(client.get(url).get_json(),
+                         {"count": 3, "min": -2.0, "max": 5.0})
+        self.assertEqual(client.get(url + "?start=-1").get_json(),
+                         {"count": 1, "min": 3.0, "max": 3.0})
+        self.assertEqual(client.get(url + "?start=0&end=1").get_json(),
+                         {"count": 1, "min": 1.0, "max": 1.0})
+        mod.unload()
+        self.assertEqual(client.get(url).get_json(),
+                         {"count": 0, "min": None, "max": None})
 
     def test_hardware_monitor_update_metrics(self):
-        import importlib.util
         spec = importlib.util.spec_from_file_location(
             "feen_plugin_hw_monitor_test",
             os.path.join(self._PLUGINS_DIR, "hardware_monitor.py"),
@@ -358,7 +499,54 @@ class TestBuiltinPlugins(unittest.TestCase):
         m = mod._latest_metrics
         self.assertIsNotNone(m)
         self.assertEqual(m["node_count"], 1)
-        self.assertAlmostEqual(m["nodes"][0]["snr_headroom_db"], 5.0)
+        self.assertAlmostEqual(m["snr_headroom_db"][0], 5.0)
+        payload = mod._metrics_payload(m)
+        self.assertEqual(payload["nodes"][0]["id"], 0)
+        self.assertAlmostEqual(payload["nodes"][0]["snr_headroom_db"], 5.0)
+
+    def test_hardware_monitor_skips_unchanged_snapshot(self):
+        entry = PluginRegistry().load_plugin(
+            os.path.join(self._PLUGINS_DIR, "hardware_monitor.py"), reload=True)
+        mod = entry.module
+        mod.update_metrics([{"id": 0, "energy": 0.5, "snr": 15.0}], tick=1)
+        first = mod._latest_metrics
+        # Same tick: skipped even though the snapshot differs.
+        mod.update_metrics([{"id": 0, "energy": 9.0, "snr": 15.0}], tick=1)
+        self.assertIs(mod._latest_metrics, first)
+        # New tick but identical content: cache kept.
+        mod.update_metrics([{"id": 0, "energy": 0.5, "snr": 15.0}], tick=2)
+        self.assertIs(mod._latest_metrics, first)
+        mod.update_metrics([{"id": 0, "energy": 0.7, "snr": 15.0}], tick=3)
+        self.assertIsNot(mod._latest_metrics, first)
+        self.assertAlmostEqual(mod._latest_metrics["energy"][0], 0.7)
+
+    def test_hardware_monitor_metrics_etag(self):
+        from flask import Flask
+        entry = PluginRegistry().load_plugin(
+            os.path.join(self._PLUGINS_DIR, "hardware_monitor.py"), reload=True)
+        app = Flask("hw_etag_test")
+        app.register_blueprint(entry.module.get_blueprint())
+        client = app.test_client()
+
+        entry.module.update_metrics([{"id": 0, "energy": 0.5, "snr": 15.0}])
+        first = client.get("/plugins/hardware_monitor/metrics")
+        self.assertEqual(first.status_code, 200)
+        etag = first.headers["ETag"]
+        again = client.get("/plugins/hardware_monitor/metrics", headers={"If-None-Match": etag})
+        self.assertEqual(again.status_code, 304)
+
+        entry.module.update_metrics([{"id": 0, "energy": 0.9, "snr": 15.0}])
+        changed = client.get("/plugins/hardware_monitor/metrics", headers={"If-None-Match": etag})
+        self.assertEqual(changed.status_code, 200)
+        self.assertAlmostEqual(changed.get_json()["nodes"][0]["energy"], 0.9)
+
+    def test_hardware_monitor_blueprint_built_lazily(self):
+        entry = PluginRegistry().load_plugin(
+            os.path.join(self._PLUGINS_DIR, "hardware_monitor.py"), reload=True)
+        self.assertIsNone(entry.module._blueprint)
+        bp = entry.module.get_blueprint()
+        self.assertEqual(bp.name, "hardware_monitor")
+        self.assertIs(entry.module.get_blueprint(), bp)
 
 
 class TestEagerPluginInitialization(unittest.TestCase):
@@ -370,12 +558,10 @@ class TestEagerPluginInitialization(unittest.TestCase):
 
     def _import_feen_rest_api(self):
         """Import feen_rest_api in a clean module environment."""
-        import importlib
         # Remove cached module so each test gets a fresh import.
-        for key in list(sys.modules.keys()):
-            if "feen_rest_api" in key:
-                del sys.modules[key]
-        sys.path.insert(0, _PYTHON_DIR)
+        sys.modules.pop("feen_rest_api", None)
+        if _PYTHON_DIR not in sys.path:
+            sys.path.insert(0, _PYTHON_DIR)
         try:
             import feen_rest_api
             return feen_rest_api
@@ -393,15 +579,15 @@ class TestEagerPluginInitialization(unittest.TestCase):
     def test_blueprints_registered_before_first_request(self):
         """Plugin blueprints must be registered with the Flask app at import time."""
         mod = self._import_feen_rest_api()
-        registered_names = {bp.name for bp in mod.app.blueprints.values()}
         # All active plugins that provided a blueprint must be registered.
-        active_bps = mod.plugin_registry.active_blueprints()
-        for bp in active_bps:
-            self.assertIn(
-                bp.name,
-                registered_names,
-                f"Blueprint {bp.name!r} was not registered before the first request.",
-            )
+        # app.blueprints is keyed by blueprint name, so its keys view is
+        # compared directly.
+        active_names = {bp.name for bp in mod.plugin_registry.active_blueprints()}
+        missing = active_names - mod.app.blueprints.keys()
+        self.assertFalse(
+            missing,
+            f"Blueprints {sorted(missing)!r} were not registered before the first request.",
+        )
 
     def test_health_endpoint_works_after_eager_init(self):
         """The /api/health endpoint must respond correctly after eager init."""
@@ -412,6 +598,20 @@ class TestEagerPluginInitialization(unittest.TestCase):
         data = response.get_json()
         self.assertEqual(data["status"], "ok")
 
+    def test_static_fast_path_matches_flask_views(self):
+        """Bodies short-circuited before Flask must equal the routed views."""
+        mod = self._import_feen_rest_api()
+        client = mod.app.test_client()
+        paths = list(mod.app.wsgi_app._routes)
+        self.assertIn("/plugins/observer_logger/info", paths)
+        for path in paths:
+            fast = client.get(path)
+            # An Origin header sends the request through Flask (and CORS).
+            routed = client.get(path, headers={"Origin": "http://example.test"})
+            self.assertEqual(fast.status_code, 200, path)
+            self.assertEqual(fast.data, routed.data, path)
+            self.assertEqual(fast.mimetype, routed.mimetype, path)
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
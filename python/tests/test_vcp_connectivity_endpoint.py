@@ -18,6 +18,8 @@ import sys
 import types
 import unittest
 
+import numpy as np
+
 _HERE = os.path.dirname(os.path.abspath(__file__))
 _PYTHON_DIR = os.path.dirname(_HERE)
 if _PYTHON_DIR not in sys.path:
@@ -55,24 +57,43 @@ class _Resonator:
     def t(self): return self._t
     def energy(self): return self._x ** 2 + self._v ** 2
     def snr(self, T=293.15): return 0.0
+    def state(self): return (self._x, self._v, self._t, self.energy(), self.snr())
     def inject(self, amplitude, phase=0.0): pass
     def set_state(self, x, v, t=0.0): self._x = x; self._v = v; self._t = t
     def tick(self, dt, F=0.0, omega_d=-1.0, internal_force=0.0): pass
     def total_energy(self): return self.energy()
 
 class _ResonatorNetwork:
+    # Dense coupling matrix grown with the node count, like CouplingMatrix
+    # in network.h; out-of-range indices raise as K.at() does.
     def __init__(self):
-        self._nodes = []; self._matrix = {}; self._time = 0.0; self._ticks = 0
-
-    def add_node(self, resonator): self._nodes.append(resonator)
+        self._nodes = []; self._matrix = np.zeros((0, 0)); self._time = 0.0; self._ticks = 0
+
+    def add_node(self, resonator):
+        self._nodes.append(resonator)
+        n = len(self._nodes)
+        if n > self._matrix.shape[0]:
+            grown = np.zeros((2 * n, 2 * n))
+            m = self._matrix.shape[0]
+            grown[:m, :m] = self._matrix
+            self._matrix = grown
     def node(self, i): return self._nodes[i]
     def size(self): return len(self._nodes)
-    def coupling(self, i, j): return self._matrix.get((i, j), 0.0)
-    def add_coupling(self, i, j, strength):
-        self._matrix[(i, j)] = self._matrix.get((i, j), 0.0) + strength
-    def set_coupling(self, i, j, strength): self._matrix[(i, j)] = strength
-    def clear_couplings(self): self._matrix.clear()
+    def _check(self, i, j):
+        n = len(self._nodes)
+        if not (0 <= i < n and 0 <= j < n):
+            raise IndexError(f'coupling index ({i}, {j}) out of range for {n} nodes')
+    def coupling(self, i, j): self._check(i, j); return float(self._matrix[i, j])
+    def add_coupling(self, i, j, strength): self._check(i, j); self._matrix[i, j] += strength
+    def set_coupling(self, i, j, strength): self._check(i, j); self._matrix[i, j] = strength
+    def clear_couplings(self): self._matrix[:] = 0.0
+    def coupling_coo(self):
+        n = len(self._nodes)
+        rows, cols = np.nonzero(self._matrix[:n, :n])
+        return (rows.astype(np.uint64), cols.astype(np.uint64),
+                self._matrix[rows, cols])
     def tick_parallel(self, dt): self._time += dt; self._ticks += 1
+    def tick_parallel_n(self, dt, steps): self._time += dt * steps; self._ticks += steps
     def get_state_vector(self): return []
     def time_s(self): return self._time
     def ticks(self): return self._ticks
@@ -90,10 +111,13 @@ _pyfeen_stub.Resonator = _Resonator
 _pyfeen_stub.ResonatorNetwork = _ResonatorNetwork
 _pyfeen_stub.ROOM_TEMP = 293.15
 
-sys.modules['pyfeen'] = _pyfeen_stub
-sys.modules['pyfeen.ailee'] = _ailee_sub
+# The stubs are only installed while this module's tests run.  Only the two
+# pyfeen entries are saved and restored: patch.dict(sys.modules) would also
+# drop feen_rest_api and everything it imported when the patch stops.
+_STUB_MODULES = {'pyfeen': _pyfeen_stub, 'pyfeen.ailee': _ailee_sub}
+_saved_modules = {}
 
-import feen_rest_api as _api
+_api = None
 
 
 # ---------------------------------------------------------------------------
@@ -104,6 +128,30 @@ def _client():
     return _api.app.test_client()
 
 
+# The view is read-only, so structure/field checks share one response;
+# access, read-only and statelessness tests still make their own requests.
+_CACHED_VIEW = None
+
+
+def setUpModule():
+    global _api, _CACHED_VIEW
+    for name, stub in _STUB_MODULES.items():
+        _saved_modules[name] = sys.modules.get(name)
+        sys.modules[name] = stub
+    import feen_rest_api
+    _api = feen_rest_api
+    _CACHED_VIEW = _client().get('/api/vcp/view').get_json()
+
+
+def tearDownModule():
+    for name, previous in _saved_modules.items():
+        if previous is None:
+            sys.modules.pop(name, None)
+        else:
+            sys.modules[name] = previous
+    _saved_modules.clear()
+
+
 # ---------------------------------------------------------------------------
 # Observer / access boundary
 # ---------------------------------------------------------------------------
@@ -131,8 +179,7 @@ class TestVCPViewStructure(unittest.TestCase):
     """Response must contain the expected top-level keys and correct types."""
 
     def setUp(self):
-        resp = _client().get('/api/vcp/view')
-        self.data = resp.get_json()
+        self.data = _CACHED_VIEW
 
     def test_response_has_nodes_key(self):
         self.assertIn('nodes', self.data,
@@ -166,6 +213,14 @@ class TestVCPViewStructure(unittest.TestCase):
         self.assertGreater(len(self.data['edges']), 0,
                            "Fallback must return at least one edge")
 
+    def test_streamed_body_matches_one_shot_body(self):
+        """Large views are streamed in batches; the bytes must not change."""
+        with _api.app.app_context():
+            expected = _api._json_response(self.data).get_data()
+            for batch in (1, 2, 512):
+                streamed = _api._streamed_json_response(self.data, batch=batch)
+                self.assertEqual(streamed.get_data(), expected)
+
 
 # ---------------------------------------------------------------------------
 # Node structure
@@ -175,7 +230,7 @@ class TestVCPViewNodeFields(unittest.TestCase):
     """Each node must carry the required fields."""
 
     def setUp(self):
-        self.nodes = _client().get('/api/vcp/view').get_json()['nodes']
+        self.nodes = _CACHED_VIEW['nodes']
 
     def test_each_node_has_id(self):
         for n in self.nodes:
@@ -198,42 +253,48 @@ class TestVCPViewEdgeMetrics(unittest.TestCase):
     """Edges with FEEN metrics must expose all four physics fields."""
 
     _REQUIRED_METRICS = ('resonance', 'interference', 'stability', 'delta_v')
+    _REQUIRED_SET = frozenset(_REQUIRED_METRICS)
     _RESONANCE_TOLERANCE = 1e-9  # Allow tiny floating-point overshoot above 1.0
 
-    def setUp(self):
-        self.edges = _client().get('/api/vcp/view').get_json()['edges']
+    @classmethod
+    def setUpClass(cls):
+        cls.edges = _CACHED_VIEW['edges']
+        # One row per edge with metrics, columns in _REQUIRED_METRICS order;
+        # missing fields become NaN and fail the field/NaN checks below.
+        cls.metrics = np.array(
+            [[edge['metrics'].get(f, np.nan) for f in cls._REQUIRED_METRICS]
+             for edge in cls.edges if 'metrics' in edge],
+            dtype=np.float64,
+        ).reshape(-1, len(cls._REQUIRED_METRICS))
+
+    def _column(self, field):
+        return self.metrics[:, self._REQUIRED_METRICS.index(field)]
 
     def test_edges_with_metrics_have_all_four_fields(self):
         for edge in self.edges:
             if 'metrics' in edge:
-                for field in self._REQUIRED_METRICS:
-                    self.assertIn(field, edge['metrics'],
-                                  f"Edge metrics missing '{field}': {edge['metrics']}")
+                missing = self._REQUIRED_SET - edge['metrics'].keys()
+                self.assertFalse(missing,
+                                 f"Edge metrics missing {sorted(missing)}: {edge['metrics']}")
 
     def test_metric_values_are_finite_floats(self):
-        import math
         for edge in self.edges:
             if 'metrics' in edge:
                 for field in self._REQUIRED_METRICS:
-                    val = edge['metrics'].get(field)
-                    self.assertIsInstance(val, (int, float),
-                                         f"Metric '{field}' must be numeric")
-                    self.assertFalse(math.isnan(val),
-                                     f"Metric '{field}' must not be NaN")
+                    self.assertIsInstance(edge['metrics'].get(field), (int, float),
+                                          f"Metric '{field}' must be numeric")
+        self.assertFalse(np.isnan(self.metrics).any(), "Metrics must not be NaN")
 
     def test_resonance_in_reasonable_range(self):
         """Resonance is defined as 1 - normalised energy mismatch, so it must be ≤ 1."""
-        for edge in self.edges:
-            if 'metrics' in edge:
-                self.assertLessEqual(edge['metrics']['resonance'], 1.0 + self._RESONANCE_TOLERANCE,
-                                     "Resonance must be ≤ 1.0")
+        resonance = self._column('resonance')
+        self.assertTrue((resonance <= 1.0 + self._RESONANCE_TOLERANCE).all(),
+                        f"Resonance must be ≤ 1.0: {resonance}")
 
     def test_stability_positive(self):
         """Stability = 1/(1+|v1-v2|) is always > 0."""
-        for edge in self.edges:
-            if 'metrics' in edge:
-                self.assertGreater(edge['metrics']['stability'], 0.0,
-                                   "Stability must be positive")
+        stability = self._column('stability')
+        self.assertTrue((stability > 0.0).all(), f"Stability must be positive: {stability}")
 
 
 # ---------------------------------------------------------------------------
@@ -324,6 +385,72 @@ class TestVCPIntegrationRobustness(unittest.TestCase):
             _vcp.VCP_API_URL = original_vcp_api_url
             _vcp.pyfeen = original_pyfeen
 
+    def test_coordinator_view_reused_within_ttl(self):
+        """With VCP_VIEW_TTL set, polls inside the TTL do not refetch."""
+        import vcp_integration as _vcp
+
+        calls = []
+
+        class _Resp:
+            ok = True
+
+            def __init__(self, url):
+                self._url = url
+
+            def json(self):
+                if self._url.endswith('/nodes'):
+                    return {'nodes': [{'id': 1, 'state': {'x': 0.1, 'v': 0.2}},
+                                      {'id': 2, 'state': {'x': 0.3, 'v': 0.0}}]}
+                return {'couplings': [{'source': 1, 'target': 2, 'strength': 0.5}]}
+
+        def _get(url, timeout):
+            calls.append(url)
+            return _Resp(url)
+
+        saved = (_vcp._session, _vcp.VCP_API_URL, _vcp.VCP_VIEW_TTL, _vcp._view_cache)
+        try:
+            _vcp._session = types.SimpleNamespace(get=_get)
+            _vcp.VCP_API_URL = 'http://vcp.invalid'
+            _vcp._view_cache = (None, 0.0, None)
+            _vcp.VCP_VIEW_TTL = 60.0
+            first = _vcp.get_vcp_network_view()
+            self.assertIs(_vcp.get_vcp_network_view(), first)
+            self.assertEqual(len(calls), 2)
+            self.assertIn('metrics', first['edges'][0])
+            _vcp.VCP_VIEW_TTL = 0.0
+            _vcp.get_vcp_network_view()
+            self.assertEqual(len(calls), 4)
+        finally:
+            (_vcp._session, _vcp.VCP_API_URL,
+             _vcp.VCP_VIEW_TTL, _vcp._view_cache) = saved
+
+    def test_unreachable_coordinator_is_skipped_after_repeated_failures(self):
+        """After _FETCH_FAIL_LIMIT failed fetches, polls fall back without fetching."""
+        import vcp_integration as _vcp
+
+        calls = []
+
+        def _get(url, timeout):
+            calls.append(url)
+            raise ConnectionError('coordinator down')
+
+        saved = (_vcp._session, _vcp.VCP_API_URL, _vcp.VCP_VIEW_TTL, _vcp._fetch_backoff)
+        try:
+            _vcp._session = types.SimpleNamespace(get=_get)
+            _vcp.VCP_API_URL = 'http://vcp.invalid'
+            _vcp.VCP_VIEW_TTL = 0.0
+            _vcp._fetch_backoff = (0, 0.0)
+            with self.assertLogs(level='WARNING'):
+                for _ in range(_vcp._FETCH_FAIL_LIMIT):
+                    _vcp.get_vcp_network_view()
+            attempted = len(calls)
+            view = _vcp.get_vcp_network_view()
+            self.assertEqual(len(calls), attempted)
+            self.assertGreater(len(view['nodes']), 0)
+        finally:
+            (_vcp._session, _vcp.VCP_API_URL,
+             _vcp.VCP_VIEW_TTL, _vcp._fetch_backoff) = saved
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -6,15 +6,18 @@ Validates:
   • Mutator boundary: POST/DELETE /api/network/couplings are publicly accessible (no auth gate)
   • Idempotency: wiring the same pair twice yields last-set strength, not accumulated strength
   • Coupling removal: DELETE zeroes out the coupling
-  • Thread safety: _network_lock exists and guards concurrent coupling mutations
+  • Thread safety: _network_lock exists and serializes native network reads and mutations
   • No execution semantics: coupling endpoints only mutate structural state, not tick/inject/reset
 """
 
 import os
 import sys
 import types
-import unittest
 import threading
+import time
+import unittest
+
+import numpy as np
 
 _HERE = os.path.dirname(os.path.abspath(__file__))
 _PYTHON_DIR = os.path.dirname(_HERE)
@@ -53,27 +56,47 @@ class _Resonator:
     def t(self): return 0.0
     def energy(self): return 0.0
     def snr(self, T=293.15): return 0.0
+    def state(self): return (0.0, 0.0, 0.0, 0.0, 0.0)
     def set_state(self, x, v, t=0.0): pass
     def inject(self, amplitude, phase=0.0): pass
     def tick(self, dt, F=0.0, omega_d=-1.0, internal_force=0.0): pass
     def total_energy(self): return 0.0
 
 class _ResonatorNetwork:
+    # Dense coupling matrix grown with the node count, like CouplingMatrix
+    # in network.h; out-of-range indices raise as K.at() does.
     def __init__(self):
-        self._nodes = []; self._matrix = {}; self._time = 0.0; self._ticks = 0
-
-    def add_node(self, resonator): self._nodes.append(resonator)
+        self._nodes = []; self._matrix = np.zeros((0, 0)); self._time = 0.0; self._ticks = 0
+
+    def add_node(self, resonator):
+        self._nodes.append(resonator)
+        n = len(self._nodes)
+        if n > self._matrix.shape[0]:
+            grown = np.zeros((2 * n, 2 * n))
+            m = self._matrix.shape[0]
+            grown[:m, :m] = self._matrix
+            self._matrix = grown
     def node(self, i): return self._nodes[i]
     def size(self): return len(self._nodes)
-    def coupling(self, i, j): return self._matrix.get((i, j), 0.0)
+    def _check(self, i, j):
+        n = len(self._nodes)
+        if not (0 <= i < n and 0 <= j < n):
+            raise IndexError(f'coupling index ({i}, {j}) out of range for {n} nodes')
+    def coupling(self, i, j): self._check(i, j); return float(self._matrix[i, j])
     # add_coupling on the stub uses additive (+=) semantics to faithfully model the
     # underlying C++ add_coupling behaviour.  The REST endpoint under test must NOT
     # call this method — it must call set_coupling instead, which is what the
     # idempotency tests below verify.
-    def add_coupling(self, i, j, strength): self._matrix[(i, j)] = self._matrix.get((i, j), 0.0) + strength
-    def set_coupling(self, i, j, strength): self._matrix[(i, j)] = strength
-    def clear_couplings(self): self._matrix.clear()
+    def add_coupling(self, i, j, strength): self._check(i, j); self._matrix[i, j] += strength
+    def set_coupling(self, i, j, strength): self._check(i, j); self._matrix[i, j] = strength
+    def clear_couplings(self): self._matrix[:] = 0.0
+    def coupling_coo(self):
+        n = len(self._nodes)
+        rows, cols = np.nonzero(self._matrix[:n, :n])
+        return (rows.astype(np.uint64), cols.astype(np.uint64),
+                self._matrix[rows, cols])
     def tick_parallel(self, dt): self._time += dt; self._ticks += 1
+    def tick_parallel_n(self, dt, steps): self._time += dt * steps; self._ticks += steps
     def get_state_vector(self): return []
     def time_s(self): return self._time
     def ticks(self): return self._ticks
@@ -108,9 +131,10 @@ def _setup_two_nodes(api):
     api.network.add_node({'name': 'node_1', 'frequency_hz': 2000.0, 'q_factor': 100.0, 'beta': 1e-4})
 
 
-def _plain_client(api):
-    """Return a plain test client (no authentication required)."""
-    return api.app.test_client()
+# One plain test client (no authentication required) shared by every test
+# and worker thread.  Cookies are off: the jar is the only per-client state
+# requests would share.
+_SHARED_CLIENT = _api.app.test_client(use_cookies=False)
 
 
 # ---------------------------------------------------------------------------
@@ -122,7 +146,7 @@ class TestObserverMutatorBoundary(unittest.TestCase):
 
     def setUp(self):
         _setup_two_nodes(_api)
-        self.client = _api.app.test_client()
+        self.client = _SHARED_CLIENT
 
     def test_get_couplings_requires_no_auth(self):
         """GET /api/network/couplings must be accessible without authentication."""
@@ -162,7 +186,7 @@ class TestCouplingIdempotency(unittest.TestCase):
 
     def setUp(self):
         _setup_two_nodes(_api)
-        self.client = _plain_client(_api)
+        self.client = _SHARED_CLIENT
 
     def test_wire_twice_does_not_double_strength(self):
         """POST coupling twice with strength=1.0 must result in strength=1.0, not 2.0.
@@ -235,7 +259,7 @@ class TestNoExecutionSemanticsInWiring(unittest.TestCase):
 
     def setUp(self):
         _setup_two_nodes(_api)
-        self.client = _plain_client(_api)
+        self.client = _SHARED_CLIENT
 
     def test_post_coupling_does_not_advance_time(self):
         """POST coupling must not call tick_parallel; simulation time must stay at 0."""
@@ -261,11 +285,78 @@ class TestNoExecutionSemanticsInWiring(unittest.TestCase):
         self.assertEqual(_api.network.network.ticks(), before_ticks,
                          "DELETE coupling must not increment tick counter")
 
+    def test_empty_tick_and_inject_bodies_are_rejected(self):
+        """An empty JSON object must not tick or inject with default values."""
+        before_ticks = _api.network.network.ticks()
+        for path in ('/api/network/tick', '/api/network/nodes/0/inject'):
+            resp = self.client.post(path, json={})
+            self.assertEqual(resp.status_code, 400, path)
+            self.assertEqual(resp.get_json(), {'error': 'No JSON data provided'})
+        self.assertEqual(_api.network.network.ticks(), before_ticks,
+                         "An empty tick request must not advance the network")
+
 
 # ---------------------------------------------------------------------------
 # Thread safety
 # ---------------------------------------------------------------------------
 
+class _RaceCheckingNetwork(_ResonatorNetwork):
+    """Stub network that records overlapping native calls.
+
+    The wrapped methods release the GIL in pyfeen; here each one yields the
+    GIL mid-call instead, so two handlers running them at once are caught.
+    """
+
+    _EXCLUSIVE = ('add_node', 'tick_parallel_n', 'get_state_vector',
+                  'set_coupling', 'coupling_coo')
+
+    def __init__(self):
+        super().__init__()
+        self.active = 0
+        self.overlaps = 0
+        for name in self._EXCLUSIVE:
+            setattr(self, name, self._exclusive(getattr(self, name)))
+
+    def _exclusive(self, fn):
+        def call(*args):
+            self.active += 1
+            try:
+                if self.active > 1:
+                    self.overlaps += 1
+                time.sleep(0.0005)
+                return fn(*args)
+            finally:
+                self.active -= 1
+        return call
+
+
+def _race_checking_network(api, nodes=2):
+    """Install a network manager backed by _RaceCheckingNetwork."""
+    api.network = api.ResonatorNetworkManager()
+    api.network.network = _RaceCheckingNetwork()
+    for i in range(nodes):
+        api.network.add_node({'name': f'node_{i}', 'frequency_hz': 1000.0})
+    return api.network.network
+
+
+def _run_concurrently(*targets):
+    """Run each callable on its own thread; return exceptions they raised."""
+    errors = []
+
+    def run(fn):
+        try:
+            fn()
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=run, args=(fn,)) for fn in targets]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return errors
+
+
 class TestCouplingThreadSafety(unittest.TestCase):
     """_network_lock must exist and concurrent coupling mutations must not corrupt state."""
 
@@ -286,9 +377,8 @@ class TestCouplingThreadSafety(unittest.TestCase):
 
         def wire():
             try:
-                client = _plain_client(_api)
                 for _ in range(5):
-                    client.post('/api/network/couplings',
+                    _SHARED_CLIENT.post('/api/network/couplings',
                                 json={'source_id': 0, 'target_id': 1, 'strength': 1.0})
             except Exception as exc:
                 errors.append(exc)
@@ -302,6 +392,47 @@ class TestCouplingThreadSafety(unittest.TestCase):
         self.assertEqual(errors, [],
                          f"Unexpected errors in concurrent wiring: {errors}")
 
+    def test_state_reads_do_not_overlap_ticks_or_node_growth(self):
+        """State snapshots must be serialized with ticks and add_node on _network_lock."""
+        net = _race_checking_network(_api)
+
+        def read():
+            for _ in range(20):
+                self.assertEqual(_SHARED_CLIENT.get('/api/network/state').status_code, 200)
+                self.assertEqual(_SHARED_CLIENT.get('/api/network/nodes').status_code, 200)
+
+        def write():
+            for _ in range(20):
+                _SHARED_CLIENT.post('/api/network/nodes', json={'frequency_hz': 1000.0})
+                _SHARED_CLIENT.post('/api/network/tick', json={'dt': 1e-6, 'steps': 1})
+
+        errors = _run_concurrently(read, read, read, write)
+        self.assertEqual(errors, [])
+        self.assertEqual(net.overlaps, 0,
+                         "A state read ran alongside a tick or add_node")
+
+    def test_coupling_listing_does_not_overlap_mutations(self):
+        """GET couplings must not scan while nodes or couplings are being changed."""
+        net = _race_checking_network(_api)
+
+        def read():
+            for _ in range(20):
+                resp = _SHARED_CLIENT.get('/api/network/couplings')
+                self.assertEqual(resp.status_code, 200)
+
+        def write():
+            for _ in range(20):
+                _SHARED_CLIENT.post('/api/network/nodes', json={'frequency_hz': 1000.0})
+                _SHARED_CLIENT.post('/api/network/couplings',
+                                    json={'source_id': 0, 'target_id': 1, 'strength': 1.0})
+                _SHARED_CLIENT.delete('/api/network/couplings',
+                                      json={'source_id': 0, 'target_id': 1})
+
+        errors = _run_concurrently(read, read, read, write)
+        self.assertEqual(errors, [])
+        self.assertEqual(net.overlaps, 0,
+                         "coupling_coo ran alongside a node or coupling mutation")
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -2,8 +2,13 @@ import logging
 import os
 import math
 import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
 try:
     import requests
+    from requests.adapters import HTTPAdapter
 except ImportError:
     requests = None
 
@@ -14,6 +19,41 @@ except ImportError:
 
 # Configuration
 VCP_API_URL = os.environ.get('VCP_API_URL')
+# Seconds a view built from coordinator data is reused before refetching;
+# 0 (the default) fetches on every call.  Dashboards polling faster than the
+# coordinator changes can set this to spare it two requests per poll.
+VCP_VIEW_TTL = float(os.environ.get('VCP_VIEW_TTL', 0.0))
+# Views that may be fetching at once; match the server's request threads
+# (gunicorn --threads, 4 in the Dockerfile) so concurrent views never queue
+# for a fetch worker.
+VCP_FETCH_WORKERS = max(2, int(os.environ.get('VCP_FETCH_WORKERS', 4)))
+
+# One keep-alive connection pool for every coordinator fetch, sized for two
+# connections per concurrent view.  The couplings request runs on
+# _fetch_pool while the nodes request runs on the caller's thread, so a
+# fetch costs one round trip rather than two.
+if requests:
+    _session = requests.Session()
+    _adapter = HTTPAdapter(pool_maxsize=2 * VCP_FETCH_WORKERS)
+    _session.mount('http://', _adapter)
+    _session.mount('https://', _adapter)
+else:
+    _session = None
+_fetch_pool = ThreadPoolExecutor(max_workers=VCP_FETCH_WORKERS,
+                                 thread_name_prefix='vcp-fetch')
+
+# (coordinator URL, time.monotonic() of the fetch, view) of the last view
+# built from coordinator data; replaced as one tuple.
+_view_cache = (None, 0.0, None)
+
+# After _FETCH_FAIL_LIMIT failed fetches in a row the coordinator is left
+# alone for _FETCH_BACKOFF_S seconds, so an unreachable host does not cost
+# every poll its timeout.  A failed retry backs off again straight away.
+_FETCH_FAIL_LIMIT = 3
+_FETCH_BACKOFF_S = 30.0
+# (consecutive failed fetches, time.monotonic() before which fetches are
+# skipped); replaced as one tuple.
+_fetch_backoff = (0, 0.0)
 
 def get_vcp_network_view():
     """
@@ -21,32 +61,48 @@ def get_vcp_network_view():
     If VCP_API_URL is set, fetches from the external VCP coordinator.
     Otherwise, generates a simulated/dummy network for visualization.
     """
+    global _view_cache, _fetch_backoff
     nodes = []
     edges = []
 
     # 1. Fetch from VCP if configured
-    if VCP_API_URL and requests:
-        try:
-            # Example fetch: nodes and couplings from VCP API
-            # Note: This assumes VCP exposes similar endpoints or we adapt.
-            # Given VCP is distributed, maybe we query a coordinator or known peer.
-            # For this integration, we assume a single entry point.
-            res_nodes = requests.get(f"{VCP_API_URL}/api/network/nodes", timeout=1.0)
-            if res_nodes.ok:
-                data = res_nodes.json()
-                # Adapt VCP node format to our view format if needed
-                # Assuming VCP returns similar structure as FEEN
-                nodes = data.get('nodes', [])
-
-            res_edges = requests.get(f"{VCP_API_URL}/api/network/couplings", timeout=1.0)
-            if res_edges.ok:
-                data = res_edges.json()
-                edges = data.get('couplings', [])
-        except Exception as e:
-            logging.warning("VCP fetch failed: %s", e)
-            # Fallback to dummy data will happen below if empty
+    if VCP_API_URL and _session is not None:
+        cached_url, fetched_at, cached_view = _view_cache
+        if (cached_view is not None and cached_url == VCP_API_URL
+                and time.monotonic() - fetched_at < VCP_VIEW_TTL):
+            return cached_view
+        failures, retry_at = _fetch_backoff
+        if time.monotonic() >= retry_at:
+            try:
+                # Example fetch: nodes and couplings from VCP API
+                # Note: This assumes VCP exposes similar endpoints or we adapt.
+                # Given VCP is distributed, maybe we query a coordinator or known peer.
+                # For this integration, we assume a single entry point.
+                edges_future = _fetch_pool.submit(
+                    _session.get, f"{VCP_API_URL}/api/network/couplings", timeout=1.0)
+                res_nodes = _session.get(f"{VCP_API_URL}/api/network/nodes", timeout=1.0)
+                if res_nodes.ok:
+                    data = res_nodes.json()
+                    # Adapt VCP node format to our view format if needed
+                    # Assuming VCP returns similar structure as FEEN
+                    nodes = data.get('nodes', [])
+
+                res_edges = edges_future.result()
+                if res_edges.ok:
+                    data = res_edges.json()
+                    edges = data.get('couplings', [])
+                if failures:
+                    _fetch_backoff = (0, 0.0)
+            except Exception as e:
+                logging.warning("VCP fetch failed: %s", e)
+                # Fallback to dummy data will happen below if empty
+                failures += 1
+                if failures >= _FETCH_FAIL_LIMIT:
+                    retry_at = time.monotonic() + _FETCH_BACKOFF_S
+                _fetch_backoff = (failures, retry_at)
 
     # 2. Fallback to dummy data if fetch failed or no URL
+    from_vcp = bool(nodes)
     if not nodes:
         num_nodes = 6
         t = time.time()
@@ -83,92 +139,102 @@ def get_vcp_network_view():
             })
 
     # 3. Compute FEEN-powered metrics for all edges
-    # We use pyfeen to compute physical properties of the connection.
-    # Metrics:
-    # - Resonance: Energy transfer efficiency / phase alignment
-    # - Interference: Constructive vs Destructive
-    # - Stability: Relative velocity / energy mismatch
-    # - Delta v: Accumulated change (simulated increment)
+    _attach_edge_metrics(nodes, edges)
 
-    for edge in edges:
-        # Find source and target nodes
-        n1 = next((n for n in nodes if n['id'] == edge['source']), None)
-        n2 = next((n for n in nodes if n['id'] == edge['target']), None)
-
-        if n1 and n2:
-            metrics = {}
-            x1 = n1.get('state', {}).get('x', 0.0)
-            v1 = n1.get('state', {}).get('v', 0.0)
-            x2 = n2.get('state', {}).get('x', 0.0)
-            v2 = n2.get('state', {}).get('v', 0.0)
-            k = edge.get('strength', 0.0)
-
-            if pyfeen:
-                # Use FEEN physics engine
-                # Create temporary resonators to compute potential/energy
-                # We reuse a default config for metrics estimation
-                cfg = pyfeen.ResonatorConfig()
-                cfg.frequency_hz = 1000.0 # Assumption for metric baseline
-                cfg.q_factor = 200.0
-
-                r1 = pyfeen.Resonator(cfg)
-                r1.set_state(x1, v1, 0.0)
-
-                r2 = pyfeen.Resonator(cfg)
-                r2.set_state(x2, v2, 0.0)
-
-                # Resonance: SNR ratio or energy alignment?
-                # Let's use phase alignment.
-                # Phase is atan2(-v/omega, x) roughly.
-                # Or just simple energy difference?
-                e1 = r1.energy()
-                e2 = r2.energy()
-                # Resonance is high if energies are matched?
-                # Or if they are in phase?
-                # Let's use normalized energy difference as mismatch.
-                resonance = 1.0 - (abs(e1 - e2) / (e1 + e2 + 1e-9))
-
-                # Interference: Force = k*(x2 - x1)
-                # Power = Force * v1
-                # If Power > 0, energy is entering -> constructive?
-                # If Power < 0, energy is leaving -> destructive (damping)?
-                force = k * (x2 - x1)
-                power = force * v1
-                interference = power  # Positive = gain, Negative = loss
-
-                # Stability: Based on switching time or barrier height?
-                # If bistable, this matters. If monostable, less so.
-                # Let's use relative velocity stability.
-                stability = 1.0 / (1.0 + abs(v1 - v2))
-
-                # Delta v: Use AileeMetric
-                # We simulate one tick of delta v accumulation
-                params = pyfeen.ailee.AileeParams()
-                metric = pyfeen.ailee.AileeMetric(params)
-                sample = pyfeen.ailee.AileeSample()
-                sample.p_input = force * v1 # Work done by coupling
-                sample.velocity = v1
-                sample.mass = 1.0
-                sample.dt = 0.001 # Simulated dt
-                metric.integrate(sample)
-                delta_v = metric.delta_v()
-
-            else:
-                # Fallback math
-                resonance = 1.0 - min(1.0, abs(x1 - x2))
-                interference = (x1 + x2) * 0.5
-                stability = 1.0 / (1.0 + abs(v1 - v2))
-                delta_v = 0.01 * (abs(x1) + abs(x2))
-
-            metrics['resonance'] = float(resonance)
-            metrics['interference'] = float(interference)
-            metrics['stability'] = float(stability)
-            metrics['delta_v'] = float(delta_v)
-
-            edge['metrics'] = metrics
-
-    return {
+    view = {
         'nodes': nodes,
         'edges': edges,
         'timestamp': time.time()
     }
+    if from_vcp and VCP_VIEW_TTL > 0:
+        _view_cache = (VCP_API_URL, time.monotonic(), view)
+    return view
+
+
+def _attach_edge_metrics(nodes, edges):
+    """Add a ``metrics`` dict to every edge whose endpoints are both in ``nodes``.
+
+    We use pyfeen to compute physical properties of the connection.
+    Metrics:
+    - Resonance: Energy transfer efficiency / phase alignment
+    - Interference: Constructive vs Destructive
+    - Stability: Relative velocity / energy mismatch
+    - Delta v: Accumulated change (simulated increment)
+
+    Nodes are looked up through an id index, per-node energies are computed
+    once per node instead of once per incident edge, and the per-edge
+    formulas run as array expressions over all linked edges together.
+    """
+    index = {}
+    for pos, n in enumerate(nodes):
+        if 'id' in n:
+            index.setdefault(n['id'], pos)  # first node with an id wins
+    linked, src, dst = [], [], []
+    for edge in edges:
+        i = index.get(edge['source'])
+        j = index.get(edge['target'])
+        if i is not None and j is not None:
+            linked.append(edge)
+            src.append(i)
+            dst.append(j)
+    if not linked:
+        return
+
+    states = [n.get('state', {}) for n in nodes]
+    x = np.array([st.get('x', 0.0) for st in states], dtype=np.float64)
+    v = np.array([st.get('v', 0.0) for st in states], dtype=np.float64)
+    src = np.array(src, dtype=np.intp)
+    dst = np.array(dst, dtype=np.intp)
+    x1, v1, x2, v2 = x[src], v[src], x[dst], v[dst]
+    k = np.array([edge.get('strength', 0.0) for edge in linked], dtype=np.float64)
+
+    stability = 1.0 / (1.0 + np.abs(v1 - v2))
+    if pyfeen:
+        # Use FEEN physics engine.  One resonator, with a default config as
+        # the metric baseline, evaluates every node's energy in turn.
+        cfg = pyfeen.ResonatorConfig()
+        cfg.frequency_hz = 1000.0  # Assumption for metric baseline
+        cfg.q_factor = 200.0
+        resonator = pyfeen.Resonator(cfg)
+        energy = np.empty(len(nodes))
+        for pos in range(len(nodes)):
+            resonator.set_state(float(x[pos]), float(v[pos]), 0.0)
+            energy[pos] = resonator.energy()
+        e1, e2 = energy[src], energy[dst]
+
+        # Resonance: normalised energy mismatch between the two ends.
+        resonance = 1.0 - (np.abs(e1 - e2) / (e1 + e2 + 1e-9))
+
+        # Interference: power delivered by the coupling force k*(x2 - x1)
+        # into the source node (positive = gain, negative = loss).
+        force = k * (x2 - x1)
+        power = force * v1
+        interference = power
+
+        # Delta v: one simulated AILEE integration step per edge, on a single
+        # metric that is reset between edges.
+        metric = pyfeen.ailee.AileeMetric(pyfeen.ailee.AileeParams())
+        sample = pyfeen.ailee.AileeSample()
+        sample.mass = 1.0
+        sample.dt = 0.001  # Simulated dt
+        delta_v = np.empty(len(linked))
+        for e, (p_in, vel) in enumerate(zip(power.tolist(), v1.tolist())):
+            metric.reset()
+            sample.p_input = p_in  # Work done by coupling
+            sample.velocity = vel
+            metric.integrate(sample)
+            delta_v[e] = metric.delta_v()
+    else:
+        # Fallback math
+        resonance = 1.0 - np.minimum(1.0, np.abs(x1 - x2))
+        interference = (x1 + x2) * 0.5
+        delta_v = 0.01 * (np.abs(x1) + np.abs(x2))
+
+    for edge, r, f, st, dv in zip(linked, resonance.tolist(), interference.tolist(),
+                                  stability.tolist(), delta_v.tolist()):
+        edge['metrics'] = {
+            'resonance': r,
+            'interference': f,
+            'stability': st,
+            'delta_v': dv,
+        }
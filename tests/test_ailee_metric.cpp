@@ -3,6 +3,8 @@
 #include <iostream>
 #include <cmath>
 #include <cstdlib>
+#include <thread>
+#include <vector>
 
 // Simple check macro to replace assert, ensuring tests run in Release mode
 #define CHECK(condition, message) \
@@ -59,9 +61,71 @@ void test_overflow_protection() {
     std::cout << "Test 3: Overflow protection passed." << std::endl;
 }
 
+void test_integrate_raw_matches_sample() {
+    feen::ailee::AileeParams params{0.1, 1.0, 1.0, 1.0};
+    feen::ailee::AileeMetric via_sample(params);
+    feen::ailee::AileeMetric via_raw(params);
+
+    via_sample.integrate(feen::ailee::AileeSample{2.0, 0.5, 0.3, 1.5, 0.1});
+    double returned = via_raw.integrate_raw(2.0, 0.5, 0.3, 1.5, 0.1);
+
+    CHECK(returned == via_raw.delta_v(), "integrate_raw must return the updated delta_v");
+    CHECK(std::abs(via_raw.delta_v() - via_sample.delta_v()) < 1e-12,
+          "integrate_raw must match integrate(AileeSample)");
+    std::cout << "Test 4: integrate_raw passed." << std::endl;
+}
+
+void test_concurrent_integrate() {
+    feen::ailee::AileeParams params{0.0, 1.0, 1.0, 0.0};
+    feen::ailee::AileeMetric metric(params);
+    constexpr int kThreads = 4;
+    constexpr int kSamplesPerThread = 10000;
+
+    std::vector<std::thread> workers;
+    for (int i = 0; i < kThreads; ++i) {
+        workers.emplace_back([&metric]() {
+            for (int j = 0; j < kSamplesPerThread; ++j) {
+                metric.integrate(feen::ailee::AileeSample{1.0, 0.0, 0.0, 1.0, 1.0});
+            }
+        });
+    }
+    for (auto& w : workers) {
+        w.join();
+    }
+
+    // alpha = 0 makes every exponential 1, so each sample adds exactly 1.0.
+    CHECK(metric.delta_v() == static_cast<double>(kThreads * kSamplesPerThread),
+          "Concurrent integrate() must not lose updates");
+    std::cout << "Test 5: Concurrent integrate passed." << std::endl;
+}
+
+void test_integrate_batch_matches_sequential() {
+    feen::ailee::AileeParams params{0.1, 1.0, 1.0, 1.0};
+    feen::ailee::AileeMetric sequential(params);
+    feen::ailee::AileeMetric batched(params);
+
+    const double rows[3][5] = {
+        {1.0, 0.0, 0.0, 1.0, 1.0},
+        {2.0, 0.5, 0.3, 1.5, 0.1},
+        {1.0, 0.0, 0.0, 0.0, 1.0},  // non-positive mass: skipped
+    };
+    for (const auto& r : rows) {
+        sequential.integrate(feen::ailee::AileeSample{r[0], r[1], r[2], r[3], r[4]});
+    }
+    double returned = batched.integrate_batch(&rows[0][0], 3);
+
+    CHECK(returned == batched.delta_v(), "integrate_batch must return the updated delta_v");
+    CHECK(std::abs(batched.delta_v() - sequential.delta_v()) < 1e-12,
+          "integrate_batch must match sequential integrate()");
+    std::cout << "Test 6: integrate_batch passed." << std::endl;
+}
+
 int main() {
     test_initialization();
     test_single_step();
     test_overflow_protection();
+    test_integrate_raw_matches_sample();
+    test_concurrent_integrate();
+    test_integrate_batch_matches_sequential();
     return 0;
 }
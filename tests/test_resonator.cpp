@@ -3,6 +3,7 @@
 #include <cassert>
 #include <iomanip>
 #include <feen/resonator.h>
+#include <feen/network.h>
 
 using namespace feen;
 
@@ -102,6 +103,41 @@ int main() {
     assert(isolation < -20.0 && "System Error: Spectral crosstalk too high.");
     std::cout << "  PASS: Spectral orthogonality verified.\n\n";
 
+    // ---------------------------------------------------------------------
+    // 4. Multi-step Network Tick Test
+    // Goal: Verify tick_parallel_n matches repeated tick_parallel calls
+    // ---------------------------------------------------------------------
+    std::cout << "[Step 4] Multi-step Network Tick Test...\n";
+
+    ResonatorNetwork stepped;
+    ResonatorNetwork batched;
+    for (ResonatorNetwork* net : {&stepped, &batched}) {
+        Resonator n0(mono_cfg);
+        n0.inject(1.0);
+        net->add_node(n0);
+        net->add_node(Resonator(a_cfg));
+        net->set_coupling(1, 0, 1e3);
+    }
+    for (int i = 0; i < 1000; ++i) {
+        stepped.tick_parallel(dt);
+    }
+    batched.tick_parallel_n(dt, 1000);
+
+    std::cout << "  Ticks: " << stepped.ticks() << " vs " << batched.ticks() << "\n";
+    std::cout << "  x1: " << stepped.node(1).x() << " vs " << batched.node(1).x() << "\n";
+    assert(stepped.ticks() == batched.ticks() && "Network Error: tick count mismatch.");
+    assert(stepped.node(1).x() == batched.node(1).x() && "Network Error: state mismatch.");
+    std::cout << "  PASS: Batched ticks identical to stepped ticks.\n\n";
+
+    std::cout << "[Step 5] Sparse Coupling Listing Test...\n";
+
+    const CouplingCOO coo = batched.coupling_coo();
+    std::cout << "  Nonzeros: " << coo.values.size() << "\n";
+    assert(coo.values.size() == 1 && "Network Error: expected one coupling.");
+    assert(coo.rows[0] == 1 && coo.cols[0] == 0 && coo.values[0] == 1e3 &&
+           "Network Error: coupling entry mismatch.");
+    std::cout << "  PASS: Only the nonzero coupling is listed.\n\n";
+
     std::cout << "==== ALL PHYSICAL VALIDATIONS PASSED ====\n";
     return 0;
 }
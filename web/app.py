@@ -1,6 +1,6 @@
 import sys
 import os
-from flask import Flask, send_from_directory, render_template, redirect
+from flask import Flask, Response, render_template, redirect
 
 # Ensure we can import from python/ directory and from web/ directory
 python_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'python'))
@@ -24,77 +24,94 @@ app.register_blueprint(hardware_bp)
 # Set up template and static folders relative to this file
 base_dir = os.path.dirname(os.path.abspath(__file__))
 app.template_folder = os.path.join(base_dir, 'templates')
+# Flask's built-in /static route serves app.static_folder with ETag and
+# Last-Modified validators.  The assets are not fingerprinted, so browsers may
+# reuse them for FEEN_STATIC_MAX_AGE seconds and then revalidate (a 304 when
+# unchanged).
 app.static_folder = os.path.join(base_dir, 'static')
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = int(os.environ.get('FEEN_STATIC_MAX_AGE', 3600))
+
+# The pages are static HTML shells rendered with no per-request context, so
+# each is rendered on its first hit and the bytes reused.  While Jinja
+# auto-reload is on (debug or TEMPLATES_AUTO_RELOAD) every request renders,
+# so template edits still show up.
+_rendered_pages = {}
+
+
+def _page(name):
+    """Serve template ``name``, rendering it once per process."""
+    body = _rendered_pages.get(name)
+    if body is None:
+        body = render_template(name).encode('utf-8')
+        if not app.jinja_env.auto_reload:
+            _rendered_pages[name] = body
+    return Response(body, mimetype='text/html')
+
 
 @app.route('/')
 def root():
     """Serve the homepage dashboard."""
-    return render_template('dashboard.html')
+    return _page('dashboard.html')
 
 
 @app.route('/dashboard')
 def dashboard():
     """Alias for the homepage dashboard."""
-    return render_template('dashboard.html')
+    return _page('dashboard.html')
 
 
 @app.route('/simulation')
 def simulation():
     """Serve the main simulation page."""
-    return render_template('index.html')
+    return _page('index.html')
 
 
 @app.route('/node-graph')
 def node_graph():
     """Serve the node-graph plugin visualization page."""
-    return render_template('node_graph.html')
+    return _page('node_graph.html')
 
 
 @app.route('/ailee-metric')
 def ailee_metric():
     """Serve the AILEE Delta v Metric visualization page."""
-    return render_template('ailee_metric.html')
+    return _page('ailee_metric.html')
 
 
 @app.route('/coupling')
 def coupling():
     """Serve the Node Coupling visualization page."""
-    return render_template('coupling.html')
+    return _page('coupling.html')
 
 
 @app.route('/vcp-wiring')
 def vcp_wiring():
     """Serve the authenticated VCP Wiring page."""
-    return render_template('vcp_wiring.html')
+    return _page('vcp_wiring.html')
 
 
 @app.route('/vcp-connectivity')
 def vcp_connectivity():
     """Serve the VCP Connectivity visualization page."""
-    return render_template('vcp_connectivity.html')
+    return _page('vcp_connectivity.html')
 
 
 @app.route('/hlv-lab')
 def hlv_lab():
     """Serve the HLV Dynamics Lab page."""
-    return render_template('hlv_lab.html')
+    return _page('hlv_lab.html')
 
 
 @app.route('/docs')
 def api_docs():
     """Serve the human-readable API documentation page."""
-    return render_template('docs.html')
+    return _page('docs.html')
 
 @app.route('/hardware')
 def hardware_link():
     """Serve the Hardware Link Bluetooth bridge page."""
-    return render_template('hardware.html')
-
+    return _page('hardware.html')
 
-@app.route('/static/<path:filename>')
-def custom_static(filename):
-    """Serve static files from web/static."""
-    return send_from_directory(app.static_folder, filename)
 
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
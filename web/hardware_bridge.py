@@ -10,7 +10,9 @@ import math
 import time as _time
 import threading as _threading
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, abort, jsonify, request
+
+from plugin_registry import dumps, loads as _loads
 
 hardware_bp = Blueprint('hardware', __name__)
 
@@ -19,18 +21,56 @@ _hw_state = {
     'scan_results': [],   # list of {name, addr, rssi}
     'paired': {},         # addr -> {name, addr, rssi}
     'streams': {},        # key -> {value, ts}
+    'version': 0,         # bumped whenever scanning or paired changes
 }
 _hw_lock = _threading.Lock()
+# Each gunicorn worker keeps its own _hw_state; the per-process prefix keeps
+# a tag issued by another worker or an earlier process from ever matching.
+_ETAG_PREFIX = format(_time.time_ns(), 'x')
+
+
+def _json_body():
+    """Parse the raw request body as JSON, treating an empty body as {}.
+
+    Decodes with orjson (stdlib fallback) without caching the body on the
+    request.  Malformed JSON is a 400, as with get_json(force=True).
+    """
+    raw = request.get_data(cache=False)
+    if not raw:
+        return {}
+    try:
+        return _loads(raw) or {}
+    except ValueError:
+        abort(400)
+
+
+def _not_modified(etag):
+    """Return a 304 response if the client already holds ``etag``, else None.
+
+    Lets the polled GET endpoints skip building and serializing a body the
+    dashboard already has.
+    """
+    if request.if_none_match.contains_weak(etag):
+        resp = Response(status=304)
+        resp.set_etag(etag, weak=True)
+        return resp
+    return None
 
 
 @hardware_bp.route('/api/hardware/status')
 def hw_status():
     with _hw_lock:
-        return jsonify({
+        etag = '%s-status-%d' % (_ETAG_PREFIX, _hw_state['version'])
+        cached = _not_modified(etag)
+        if cached is not None:
+            return cached
+        resp = jsonify({
             'scanning': _hw_state['scanning'],
             'paired_count': len(_hw_state['paired']),
             'devices': list(_hw_state['paired'].values()),
         })
+    resp.set_etag(etag, weak=True)
+    return resp
 
 
 @hardware_bp.route('/api/hardware/scan/start', methods=['POST'])
@@ -38,6 +78,7 @@ def hw_scan_start():
     with _hw_lock:
         _hw_state['scanning'] = True
         _hw_state['scan_results'] = []
+        _hw_state['version'] += 1
     return jsonify({'ok': True})
 
 
@@ -45,6 +86,7 @@ def hw_scan_start():
 def hw_scan_stop():
     with _hw_lock:
         _hw_state['scanning'] = False
+        _hw_state['version'] += 1
     return jsonify({'ok': True})
 
 
@@ -56,22 +98,24 @@ def hw_scan_results():
 
 @hardware_bp.route('/api/hardware/pair', methods=['POST'])
 def hw_pair():
-    data = request.get_json(force=True) or {}
+    data = _json_body()
     addr = data.get('addr', '').strip()
     name = data.get('name', addr)
     if not addr:
         return jsonify({'ok': False, 'error': 'addr required'}), 400
     with _hw_lock:
         _hw_state['paired'][addr] = {'name': name, 'addr': addr, 'rssi': -65}
+        _hw_state['version'] += 1
     return jsonify({'ok': True, 'addr': addr, 'rssi': -65})
 
 
 @hardware_bp.route('/api/hardware/unpair', methods=['POST'])
 def hw_unpair():
-    data = request.get_json(force=True) or {}
+    data = _json_body()
     addr = data.get('addr', '').strip()
     with _hw_lock:
         _hw_state['paired'].pop(addr, None)
+        _hw_state['version'] += 1
         for k in list(_hw_state['streams'].keys()):
             if k.startswith(addr + ':'):
                 del _hw_state['streams'][k]
@@ -80,21 +124,39 @@ def hw_unpair():
 
 @hardware_bp.route('/api/hardware/streams')
 def hw_streams():
+    # Serialized directly rather than through jsonify; sorted keys keep the
+    # body identical to what app.json would produce.  The ETag is the state
+    # version plus the whole second, so repeat polls within the same second
+    # (the resolution of ts) get a 304.
     t = _time.time()
+    # Only the paired list is read under the lock; the response is built
+    # after releasing it so polling does not hold off pair/send.
     with _hw_lock:
-        streams = {}
-        for addr, dev in _hw_state['paired'].items():
-            ts = _time.strftime('%Y-%m-%dT%H:%M:%SZ', _time.gmtime(t))
-            streams[addr + ':temp']    = {'value': round(20 + 5 * math.sin(t / 4), 2),  'ts': ts}
-            streams[addr + ':accel_x'] = {'value': round(0.1 * math.sin(t / 1.2), 4),   'ts': ts}
-            streams[addr + ':accel_y'] = {'value': round(0.1 * math.cos(t / 1.2), 4),   'ts': ts}
-            streams[addr + ':rssi']    = {'value': dev['rssi'],                           'ts': ts}
-        return jsonify({'streams': streams})
+        etag = '%s-streams-%d-%d' % (_ETAG_PREFIX, _hw_state['version'], int(t))
+        cached = _not_modified(etag)
+        if cached is not None:
+            return cached
+        paired = [(addr, dev['rssi']) for addr, dev in _hw_state['paired'].items()]
+    # The simulated readings depend only on t, so every device shares them.
+    ts = _time.strftime('%Y-%m-%dT%H:%M:%SZ', _time.gmtime(t))
+    temp = round(20 + 5 * math.sin(t / 4), 2)
+    accel_x = round(0.1 * math.sin(t / 1.2), 4)
+    accel_y = round(0.1 * math.cos(t / 1.2), 4)
+    streams = {}
+    for addr, rssi in paired:
+        streams[addr + ':temp']    = {'value': temp,    'ts': ts}
+        streams[addr + ':accel_x'] = {'value': accel_x, 'ts': ts}
+        streams[addr + ':accel_y'] = {'value': accel_y, 'ts': ts}
+        streams[addr + ':rssi']    = {'value': rssi,    'ts': ts}
+    resp = Response(dumps({'streams': streams}, sort_keys=True),
+                    mimetype='application/json')
+    resp.set_etag(etag, weak=True)
+    return resp
 
 
 @hardware_bp.route('/api/hardware/send', methods=['POST'])
 def hw_send():
-    data = request.get_json(force=True) or {}
+    data = _json_body()
     addr  = data.get('addr', '').strip()
     value = data.get('value', '')
     if not addr: